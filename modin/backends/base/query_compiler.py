@@ -103,6 +103,19 @@ class BaseQueryCompiler(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def build_repr_df(self, num_rows, num_cols=None):
+        """Builds the Pandas DataFrame of the first and last rows and columns to render.
+
+        Args:
+            num_rows: The number of rows to display.
+            num_cols: The number of columns to display. If None, all columns are kept.
+
+        Returns:
+            Pandas DataFrame holding the head/tail rows of the front/back columns.
+        """
+        pass
+
     @classmethod
     @abc.abstractmethod
     def from_pandas(cls, df, data_cls):
@@ -291,6 +304,48 @@ class BaseQueryCompiler(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def merge_asof(self, right, **kwargs):
+        """
+        Perform an as-of merge with the rows of `right` on sorted keys.
+
+        Parameters
+        ----------
+        right : BaseQueryCompiler
+            The query compiler of the right DataFrame to merge with.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            A new query compiler that contains result of the merge.
+
+        Notes
+        -----
+        See pd.merge_asof for more info on kwargs.
+        """
+        pass
+
+    @abc.abstractmethod
+    def merge_ordered(self, right, **kwargs):
+        """
+        Perform an ordered merge with the rows of `right` on sorted keys.
+
+        Parameters
+        ----------
+        right : BaseQueryCompiler
+            The query compiler of the right DataFrame to merge with.
+
+        Returns
+        -------
+        BaseQueryCompiler
+            A new query compiler that contains result of the merge.
+
+        Notes
+        -----
+        See pd.merge_ordered for more info on kwargs.
+        """
+        pass
+
     # END Abstract inter-data operations
 
     # Abstract Transpose
@@ -656,6 +711,24 @@ class BaseQueryCompiler(abc.ABC):
     def diff(self, **kwargs):
         pass
 
+    @abc.abstractmethod
+    def duplicated(self, subset=None, keep="first"):
+        """Mark duplicate rows, optionally only considering certain columns.
+
+        Return:
+            New QueryCompiler with a single boolean column
+        """
+        pass
+
+    @abc.abstractmethod
+    def drop_duplicates(self, subset=None, keep="first"):
+        """Remove duplicate rows, optionally only considering certain columns.
+
+        Return:
+            New QueryCompiler
+        """
+        pass
+
     @abc.abstractmethod
     def dropna(self, **kwargs):
         """Returns a new QueryCompiler with null values dropped along given axis.
@@ -743,6 +816,72 @@ class BaseQueryCompiler(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def cov(self, min_periods=None):
+        """Computes the pairwise covariance of the columns, excluding missing values.
+
+        Args:
+            min_periods: The minimum number of observations required per pair of
+                columns.
+
+        Returns:
+            QueryCompiler containing the covariance matrix.
+        """
+        pass
+
+    @abc.abstractmethod
+    def corr(self, method="pearson", min_periods=1):
+        """Computes the pairwise correlation of the columns, excluding missing values.
+
+        Args:
+            method: The correlation method, "pearson" or "spearman".
+            min_periods: The minimum number of observations required per pair of
+                columns.
+
+        Returns:
+            QueryCompiler containing the correlation matrix.
+        """
+        pass
+
+    @abc.abstractmethod
+    def approx_quantile(self, q, compression):
+        """Estimates quantiles of the numeric columns in a single pass.
+
+        Args:
+            q: The list of quantiles to compute.
+            compression: The accuracy of the estimate.
+
+        Returns:
+            QueryCompiler containing the estimated quantiles indexed by `q`.
+        """
+        pass
+
+    @abc.abstractmethod
+    def approx_describe(self, percentiles, compression):
+        """Generates descriptive statistics of the numeric columns in a single pass.
+
+        Args:
+            percentiles: The sorted list of percentiles to include in the output.
+            compression: The accuracy of the estimated percentiles.
+
+        Returns:
+            QueryCompiler containing the descriptive statistics of the numeric columns.
+        """
+        pass
+
+    @abc.abstractmethod
+    def approx_nunique(self, dropna, precision):
+        """Estimates the number of distinct values of every column in a single pass.
+
+        Args:
+            dropna: Whether or not to ignore missing values.
+            precision: The accuracy of the estimate.
+
+        Returns:
+            QueryCompiler containing the estimated number of distinct values.
+        """
+        pass
+
     # END Abstract map across rows/columns
 
     # Abstract __getitem__ methods
@@ -825,6 +964,46 @@ class BaseQueryCompiler(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def map_partitions(
+        self,
+        func,
+        new_columns=None,
+        dtypes=None,
+        preserve_index=False,
+        with_partition_info=False,
+    ):
+        """Apply a function to the pandas DataFrame of every row partition.
+
+        Args:
+            func: The function to apply.
+            new_columns: (optional) The columns of the result.
+            dtypes: (optional) A pandas Series with the data types of the result.
+            preserve_index: Whether or not `func` keeps the index of every row
+                partition.
+            with_partition_info: Whether or not to pass a `partition_info` dict to
+                `func`.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        pass
+
+    @abc.abstractmethod
+    def tree_reduce(self, map_func, reduce_func, split_every=8):
+        """Reduce the row partitions with a tree of tasks.
+
+        Args:
+            map_func: The function to apply to every row partition.
+            reduce_func: The function that reduces the results of `map_func`, or
+                of itself.
+            split_every: The number of results to reduce in every task.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        pass
+
     # END UDF
 
     # Manual Partitioning methods (e.g. merge, groupby)
@@ -1120,6 +1299,42 @@ class BaseQueryCompiler(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def groupby_approx_nunique(
+        self,
+        by,
+        axis,
+        groupby_args,
+        map_args,
+        reduce_args=None,
+        numeric_only=True,
+        drop=False,
+    ):
+        """Estimate the number of distinct values per group with HyperLogLog sketches.
+
+        Parameters
+        ----------
+        by : BaseQueryCompiler
+            The query compiler object to groupby.
+        axis : 0 or 1
+            The axis to groupby. Must be 0 currently.
+        groupby_args : dict
+            The arguments for the groupby component.
+        map_args : dict
+            The arguments for the `map_func`, `dropna` and `precision`.
+        reduce_args : dict
+            The arguments for `reduce_func`.
+        numeric_only : bool
+            Whether to drop non-numeric columns.
+        drop : bool
+            Whether the data in `by` was dropped.
+
+        Returns
+        -------
+        BaseQueryCompiler
+        """
+        pass
+
     @abc.abstractmethod
     def groupby_agg(self, by, axis, agg_func, groupby_args, agg_args):
         pass
@@ -1138,6 +1353,75 @@ class BaseQueryCompiler(abc.ABC):
         """
         pass
 
+    @abc.abstractmethod
+    def stack(self, level, dropna):
+        """Stack column levels into the index.
+
+        Args:
+            level: The column levels to stack.
+            dropna: Whether to drop the rows of the result with only missing values.
+
+        Returns:
+            A new QueryCompiler. Series results have a single `__reduced__` column.
+        """
+        pass
+
+    @abc.abstractmethod
+    def unstack(self, level, fill_value):
+        """Pivot index levels to the columns.
+
+        Args:
+            level: The index levels to unstack.
+            fill_value: The value for the missing cells.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        pass
+
+    @abc.abstractmethod
+    def explode(self, column):
+        """Transform every list-like of a column to rows, repeating the index.
+
+        Args:
+            column: The column to explode.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        pass
+
+    @abc.abstractmethod
+    def lreshape(self, keys, values, dropna):
+        """Reshape wide-format data to long, stacking groups of columns.
+
+        Args:
+            keys: The labels of the new columns.
+            values: The lists of columns to stack into every new column.
+            dropna: Whether or not to drop the rows with missing values in the new
+                columns.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        pass
+
+    @abc.abstractmethod
+    def wide_to_long(self, stubnames, i, j, sep, suffix):
+        """Reshape wide-format data to long, with the suffixes of the wide columns.
+
+        Args:
+            stubnames: The stub names of the wide columns.
+            i: The columns to use as the id variables.
+            j: The name of the suffix column.
+            sep: The separator between the stub names and the suffixes.
+            suffix: The regular expression of the suffixes.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        pass
+
     @abc.abstractmethod
     def repeat(self, repeats):
         """
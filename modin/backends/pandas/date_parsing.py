@@ -0,0 +1,125 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Datetime parsing of row blocks that parses every distinct string once."""
+
+import threading
+
+import numpy as np
+import pandas
+from pandas.core.tools.datetimes import _guess_datetime_format_for_array
+
+# The maximum number of parsed values kept per set of parsing arguments.
+CACHE_SIZE = 2 ** 16
+
+# The parsed values of the blocks converted in this process, by parsing arguments.
+# Every entry holds the timezone of the values and a dict from the string to the
+# nanoseconds since the epoch. The cache is shared by the threads of the process,
+# which hold `_lock` to use it.
+_parsed_values = {}
+_lock = threading.Lock()
+
+
+def guess_datetime_format(values, dayfirst=False):
+    """Guess the format of datetime strings from the first non-null value.
+
+    Args:
+        values: The strings.
+        dayfirst: Whether the day comes before the month.
+
+    Returns:
+        The format, or None if it could not be guessed.
+    """
+    return _guess_datetime_format_for_array(
+        np.asarray(values, dtype=object), dayfirst=dayfirst
+    )
+
+
+def clear_cache():
+    """Forget the values parsed in this process."""
+    with _lock:
+        _parsed_values.clear()
+
+
+def _parse_cached(uniques, kwargs):
+    """Parse distinct strings, reusing the values parsed before with the same kwargs.
+
+    Returns:
+        A DatetimeIndex, or None if the strings cannot be parsed to one.
+    """
+    key = tuple(sorted(kwargs.items()))
+    with _lock:
+        try:
+            entry = _parsed_values.setdefault(key, {"tz": None, "values": {}})
+        except TypeError:
+            # Unhashable arguments, e.g. an `origin` array.
+            entry = {"tz": None, "values": {}}
+        known = entry["values"]
+        tz = entry["tz"]
+        cached = [known.get(value) for value in uniques]
+    is_known = np.fromiter((value is not None for value in cached), bool, len(cached))
+    missing = uniques[~is_known]
+    parsed = pandas.to_datetime(missing, cache=False, **kwargs)
+    if not isinstance(parsed, pandas.DatetimeIndex) or (
+        is_known.any() and len(missing) > 0 and parsed.tz != tz
+    ):
+        return None
+    if len(missing) > 0:
+        with _lock:
+            if len(known) + len(missing) > CACHE_SIZE or entry["tz"] != parsed.tz:
+                known.clear()
+            entry["tz"] = parsed.tz
+            known.update(zip(missing, parsed.asi8))
+    if len(missing) == len(uniques):
+        return parsed
+    nanoseconds = np.empty(len(uniques), dtype="i8")
+    nanoseconds[is_known] = [value for value in cached if value is not None]
+    nanoseconds[~is_known] = parsed.asi8
+    result = pandas.DatetimeIndex(nanoseconds.view("M8[ns]"))
+    if tz is not None:
+        result = result.tz_localize("UTC").tz_convert(tz)
+    return result
+
+
+def to_datetime_by_unique(series, cache=True, **kwargs):
+    """Convert a Series of strings to datetime, parsing every distinct string once.
+
+    The strings are factorized, the distinct strings are parsed and the parsed values
+    are taken back by code. With `cache`, the values parsed by earlier calls in the
+    same process with the same arguments are reused, so the blocks of a column share
+    the parsing of the strings they have in common.
+
+    Args:
+        series: pandas Series to convert.
+        cache: Whether to reuse and store the parsed values of this process.
+        kwargs: The arguments of `pandas.to_datetime`.
+
+    Returns:
+        A pandas Series, like `pandas.to_datetime`.
+    """
+    if series.dtype != np.dtype("O") or kwargs.get("unit") is not None:
+        return pandas.to_datetime(series, cache=cache, **kwargs)
+    codes, uniques = pandas.factorize(series)
+    if cache:
+        parsed = _parse_cached(uniques, kwargs)
+    else:
+        parsed = pandas.to_datetime(uniques, cache=False, **kwargs)
+    if not isinstance(parsed, pandas.DatetimeIndex):
+        # Some strings could not be parsed with `errors="ignore"`, or are not all
+        # in the same timezone.
+        return pandas.to_datetime(series, cache=cache, **kwargs)
+    return pandas.Series(
+        parsed.take(codes, allow_fill=True, fill_value=pandas.NaT),
+        index=series.index,
+        name=series.name,
+    )
@@ -20,7 +20,9 @@ from pandas.core.dtypes.concat import union_categoricals
 from pandas.io.common import infer_compression
 import warnings
 
+from modin.backends.pandas.date_parsing import to_datetime_by_unique
 from modin.engines.base.io import FileReader
+from modin.engines.base.io.sql.connection_pool import sql_connection
 from modin.data_management.utils import split_result_of_axis_func_pandas
 from modin.error_message import ErrorMessage
 
@@ -95,6 +97,7 @@ class PandasCSVParser(PandasParser):
         start = kwargs.pop("start", None)
         end = kwargs.pop("end", None)
         index_col = kwargs.get("index_col", None)
+        date_columns = kwargs.pop("date_columns", None)
         if start is not None and end is not None:
             # pop "compression" from kwargs because bio is uncompressed
             bio = FileReader.file_open(fname, "rb", kwargs.pop("compression", "infer"))
@@ -109,6 +112,17 @@ class PandasCSVParser(PandasParser):
         else:
             # This only happens when we are reading with only one worker (Default)
             return pandas.read_csv(fname, **kwargs)
+        if date_columns is not None:
+            # Same arguments as the date converter of `pandas.read_csv`.
+            for column in date_columns:
+                pandas_df[column] = to_datetime_by_unique(
+                    pandas_df[column],
+                    cache=kwargs.get("cache_dates", True),
+                    utc=None,
+                    dayfirst=kwargs.get("dayfirst", False),
+                    errors="ignore",
+                    infer_datetime_format=kwargs.get("infer_datetime_format", False),
+                )
         if index_col is not None:
             index = pandas_df.index
         else:
@@ -397,7 +411,8 @@ class PandasSQLParser(PandasParser):
         num_splits = kwargs.pop("num_splits", None)
         if num_splits is None:
             return pandas.read_sql(sql, con, index_col=index_col, **kwargs)
-        df = pandas.read_sql(sql, con, index_col=index_col, **kwargs)
+        with sql_connection(con) as conn:
+            df = pandas.read_sql(sql, conn, index_col=index_col, **kwargs)
         if index_col is None:
             index = len(df)
         else:
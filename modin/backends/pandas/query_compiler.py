@@ -13,14 +13,33 @@
 
 import numpy as np
 import pandas
+import re
+import weakref
 from pandas.core.dtypes.common import (
     is_list_like,
     is_numeric_dtype,
+    is_bool_dtype,
+    is_categorical_dtype,
+    is_integer,
     is_datetime_or_timedelta_dtype,
+    is_datetime64_any_dtype,
 )
 from pandas.core.base import DataError
+from pandas.core.dtypes.cast import find_common_type, maybe_promote
+from pandas.io.formats.format import format_percentiles
 
 from modin.backends.base.query_compiler import BaseQueryCompiler
+from modin.backends.pandas.date_parsing import (
+    guess_datetime_format,
+    to_datetime_by_unique,
+)
+from modin.backends.pandas.sketches import (
+    DEFAULT_COMPRESSION,
+    DEFAULT_PRECISION,
+    HyperLogLog,
+    TDigest,
+    bucket_hashes,
+)
 from modin.error_message import ErrorMessage
 from modin.pandas.utils import try_cast_to_pandas, wrap_udf_function
 from modin.data_management.functions import (
@@ -54,6 +73,174 @@ def _set_axis(axis):
     return set_axis
 
 
+# The row loops compiled with numba in this process, by function and row type.
+_jitted_row_loops = weakref.WeakKeyDictionary()
+
+
+def _compile_row_loop(func, row_type):
+    """
+    Compile a loop applying a function to every row of a 2-D NumPy array with numba.
+
+    The function is only compiled, not called, so it does not run more often than
+    it would in `numpy.apply_along_axis`.
+
+    Parameters
+    ----------
+    func
+        The function to compile, it takes a 1-D NumPy array.
+    row_type
+        The numba type of the rows.
+
+    Returns
+    -------
+        A tuple of the compiled loop and the dtype of its results, or None if numba
+        is not installed, `func` cannot be compiled in nopython mode or does not
+        return scalars.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+    try:
+        row_func = numba.njit(func)
+        row_func.compile((row_type,))
+        return_type = row_func.overloads[(row_type,)].signature.return_type
+        if not isinstance(return_type, (numba.types.Number, numba.types.Boolean)):
+            return None
+
+        @numba.njit
+        def row_loop(values, result, progress):
+            for i in range(len(values)):
+                progress[0] = i
+                result[i] = row_func(values[i])
+
+        return row_loop, numba.np.numpy_support.as_dtype(return_type)
+    except Exception:
+        # e.g. `func` is not supported by numba.
+        return None
+
+
+def _apply_along_rows(func, values, args, kwargs):
+    """
+    Apply a function to every row of a 2-D NumPy array.
+
+    Parameters
+    ----------
+    func
+        The function to apply, it takes a 1-D NumPy array.
+    values
+        The 2-D NumPy array.
+    args, kwargs
+        The extra arguments of `func`.
+
+    Returns
+    -------
+        A 2-D NumPy array with the results stacked along the first axis if `func`
+        returns 1-D arrays as wide as `values`, or else a 1-D NumPy array with the
+        result of every row.
+
+    Notes
+    -----
+    If numba is installed and `func` can be compiled in nopython mode and returns
+    scalars, the loop over the rows is compiled too. The compiled loops are kept
+    per function and row type, so every function is compiled once per process.
+    Otherwise the rows are applied in Python. Every row is applied once: if the
+    compiled loop fails on a row, that row and the ones after it are applied in
+    Python.
+    """
+    start = 0
+    if not args and not kwargs and len(values) > 0 and values.dtype.kind in "biuf":
+        try:
+            import numba
+        except ImportError:
+            numba = None
+        if numba is not None:
+            row_type = numba.typeof(values[0])
+            try:
+                compiled = _jitted_row_loops.setdefault(func, {})
+            except TypeError:
+                # The function cannot be weakly referenced.
+                compiled = {}
+            if row_type not in compiled:
+                compiled[row_type] = _compile_row_loop(func, row_type)
+            if compiled[row_type] is not None:
+                row_loop, dtype = compiled[row_type]
+                result = np.empty(len(values), dtype=dtype)
+                progress = np.zeros(1, dtype=np.int64)
+                try:
+                    row_loop(values, result, progress)
+                    return result
+                except Exception:
+                    # e.g. `func` raised an error that NumPy would turn into a
+                    # warning.
+                    start = int(progress[0])
+    results = list(result[:start]) if start else []
+    results.extend(func(row, *args, **kwargs) for row in values[start:])
+    width = values.shape[1]
+    if len(results) and all(
+        isinstance(res, np.ndarray) and res.shape == (width,) for res in results
+    ):
+        return np.array(results)
+    # The results are put one by one, so that tuples and lists stay whole.
+    stacked = np.empty(len(results), dtype=object)
+    for i, res in enumerate(results):
+        stacked[i] = res
+    return stacked
+
+
+def _rolling_func(func):
+    """
+    Create a query compiler method that applies a rolling window function.
+
+    Parameters
+    ----------
+    func
+        The function to apply, it takes a pandas DataFrame, the rolling arguments
+        and the arguments of the aggregation.
+
+    Returns
+    -------
+        A callable method of the query compiler.
+
+    Notes
+    -----
+    Row blocks are computed independently of each other, overlapping the preceding
+    (and following, for centered windows) blocks by the size of the window. See
+    `PandasQueryCompiler._window_halo` for the windows this is not possible for.
+    """
+
+    def rolling_builder(query_compiler, rolling_args, *args, **kwargs):
+        return query_compiler._rolling_fold(
+            rolling_args, lambda df: func(df, rolling_args, *args, **kwargs)
+        )
+
+    return rolling_builder
+
+
+def _scan_func(func):
+    """
+    Create a query compiler method that applies a prefix scan.
+
+    Parameters
+    ----------
+    func
+        The scan to apply, e.g. `pandas.DataFrame.cumsum`.
+
+    Returns
+    -------
+        A callable method of the query compiler.
+    """
+
+    def scan_builder(query_compiler, axis=0, **kwargs):
+        return query_compiler._scan(
+            axis,
+            lambda df: func(df, axis=axis, **kwargs),
+            skipna=kwargs.get("skipna") is not False,
+        )
+
+    return scan_builder
+
+
 def _str_map(func_name):
     def str_op_builder(df, *args, **kwargs):
         str_s = df.squeeze(axis=1).str
@@ -188,6 +375,9 @@ class PandasQueryCompiler(BaseQueryCompiler):
     def to_pandas(self):
         return self._modin_frame.to_pandas()
 
+    def build_repr_df(self, num_rows, num_cols=None):
+        return self._modin_frame.build_repr_df(num_rows, num_cols)
+
     @classmethod
     def from_pandas(cls, df, data_cls):
         return cls(data_cls.from_pandas(df))
@@ -442,6 +632,266 @@ class PandasQueryCompiler(BaseQueryCompiler):
         else:
             return self.default_to_pandas(pandas.DataFrame.merge, right, **kwargs)
 
+    def _sorted_key_bounds(self, key):
+        """
+        Find the range of a sorted key column in every row partition.
+
+        Parameters
+        ----------
+        key : label
+            The column of the key.
+
+        Returns
+        -------
+        pandas.DataFrame or None
+            The "first" and "last" key of every non-empty row partition, or None if
+            the key has missing values or is not sorted, within or across the
+            row partitions.
+        """
+
+        def key_bounds(df):
+            values = df.iloc[:, 0].reset_index(drop=True)
+            if len(values) == 0:
+                return pandas.DataFrame(columns=["first", "last", "sorted", "nulls"])
+            return pandas.DataFrame(
+                {
+                    "first": values.iloc[:1],
+                    "last": values.iloc[-1:].reset_index(drop=True),
+                    "sorted": [values.is_monotonic_increasing],
+                    "nulls": [values.hasnans],
+                }
+            )
+
+        bounds = (
+            self.getitem_column_array([key])
+            ._modin_frame._map_row_partitions(key_bounds)
+            .to_pandas()
+        )
+        if bounds["nulls"].any() or not bounds["sorted"].all():
+            return None
+        if not (bounds["first"].values[1:] >= bounds["last"].values[:-1]).all():
+            return None
+        return bounds[["first", "last"]]
+
+    def _merge_keys(self, right, left_on, right_on, left_by=None, right_by=None):
+        """Check that the keys of an ordered merge are single columns of both sides."""
+        try:
+            return (
+                not is_list_like(left_on)
+                and not is_list_like(right_on)
+                and left_on in self.columns
+                and right_on in right.columns
+                and all(col in self.columns for col in left_by or [])
+                and all(col in right.columns for col in right_by or [])
+            )
+        except TypeError:
+            # Unhashable keys, e.g. arrays of values.
+            return False
+
+    def merge_asof(self, right, **kwargs):
+        """
+        Perform an as-of merge with the rows of `right` on sorted keys.
+
+        Parameters
+        ----------
+        right : PandasQueryCompiler
+            The query compiler of the right DataFrame to merge with.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            A new query compiler that contains result of the merge.
+
+        Notes
+        -----
+        The row partitions of this query compiler are merged independently, each
+        with the row partitions of `right` whose key range overlaps its own. For
+        the backward (forward) direction only the last (first) row of every `by`
+        group is taken from the partitions of `right` entirely before (after) it,
+        and partitions further away than `tolerance` are skipped. See
+        pandas.merge_asof for more info on kwargs.
+        """
+        if len(self.index) == 0 or len(right.index) == 0:
+            return self.default_to_pandas(pandas.merge_asof, right, **kwargs)
+        # Validate the arguments and find the columns of the result like pandas.
+        new_columns = pandas.merge_asof(
+            self.getitem_row_array([0]).to_pandas(),
+            right.getitem_row_array([0]).to_pandas(),
+            **kwargs
+        ).columns
+        if kwargs.get("on") is not None:
+            kwargs["left_on"] = kwargs["right_on"] = kwargs.pop("on")
+        if kwargs.get("by") is not None:
+            kwargs["left_by"] = kwargs["right_by"] = kwargs.pop("by")
+        left_on, right_on = kwargs.get("left_on"), kwargs.get("right_on")
+        left_by, right_by = kwargs.get("left_by"), kwargs.get("right_by")
+        if is_list_like(left_on) and len(left_on) == 1:
+            left_on = kwargs["left_on"] = left_on[0]
+        if is_list_like(right_on) and len(right_on) == 1:
+            right_on = kwargs["right_on"] = right_on[0]
+        if left_by is not None and not is_list_like(left_by):
+            left_by = [left_by]
+        if right_by is not None and not is_list_like(right_by):
+            right_by = [right_by]
+        if (
+            kwargs.get("left_index")
+            or kwargs.get("right_index")
+            or not self._merge_keys(right, left_on, right_on, left_by, right_by)
+        ):
+            return self.default_to_pandas(pandas.merge_asof, right, **kwargs)
+        # The bounds and the row lengths must be those of the non-empty row
+        # partitions, which are the row blocks of `apply_with_row_blocks`.
+        self._modin_frame._filter_empties()
+        right._modin_frame._filter_empties()
+        left_bounds = self._sorted_key_bounds(left_on)
+        right_bounds = right._sorted_key_bounds(right_on)
+        if left_bounds is None or right_bounds is None:
+            # Missing or unsorted keys, pandas raises the appropriate error.
+            return self.default_to_pandas(pandas.merge_asof, right, **kwargs)
+
+        direction = kwargs.get("direction", "backward")
+        tolerance = kwargs.get("tolerance")
+        selections = []
+        for lo, hi in left_bounds.itertuples(index=False):
+            before, overlap, after = [], [], []
+            for j, (first, last) in enumerate(right_bounds.itertuples(index=False)):
+                if last < lo:
+                    if direction != "forward" and (
+                        tolerance is None or last >= lo - tolerance
+                    ):
+                        before.append((j, "last"))
+                elif first > hi:
+                    if direction != "backward" and (
+                        tolerance is None or first <= hi + tolerance
+                    ):
+                        after.append((j, "first"))
+                else:
+                    overlap.append((j, None))
+            if not right_by:
+                # Only the closest row can match without groups.
+                before, after = before[-1:], after[:1]
+            selections.append(before + overlap + after)
+
+        def last_rows(df):
+            return df.drop_duplicates(right_by, keep="last") if right_by else df[-1:]
+
+        def first_rows(df):
+            return df.drop_duplicates(right_by, keep="first") if right_by else df[:1]
+
+        def merge_asof_rows(left, right):
+            return pandas.merge_asof(left, right, **kwargs)
+
+        return self.__constructor__(
+            self._modin_frame.apply_with_row_blocks(
+                right._modin_frame,
+                selections,
+                merge_asof_rows,
+                new_columns,
+                summary_funcs={"last": last_rows, "first": first_rows},
+                row_lengths=self._modin_frame._row_lengths,
+            )
+        )
+
+    def merge_ordered(self, right, **kwargs):
+        """
+        Perform an ordered merge with the rows of `right` on sorted keys.
+
+        Parameters
+        ----------
+        right : PandasQueryCompiler
+            The query compiler of the right DataFrame to merge with.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            A new query compiler that contains result of the merge.
+
+        Notes
+        -----
+        Every row of `right` is merged in the row partition of this query compiler
+        whose key range contains its key, or else in the first one after it, so the
+        merged row partitions are in the order of the keys. The keys of both sides
+        must be sorted, the merge is done with pandas otherwise and when filling or
+        grouping, which span the row partitions, or when a right merge would split
+        the rows with the same key. See pandas.merge_ordered for more
+        info on kwargs.
+        """
+        if kwargs.get("on") is not None:
+            left_on = right_on = kwargs["on"]
+        else:
+            left_on, right_on = kwargs.get("left_on"), kwargs.get("right_on")
+        if is_list_like(left_on) and len(left_on) == 1:
+            left_on = left_on[0]
+        if is_list_like(right_on) and len(right_on) == 1:
+            right_on = right_on[0]
+
+        if len(self.index) == 0 or len(right.index) == 0:
+            return self.default_to_pandas(pandas.merge_ordered, right, **kwargs)
+        new_columns = pandas.merge_ordered(
+            self.getitem_row_array([0]).to_pandas(),
+            right.getitem_row_array([0]).to_pandas(),
+            **kwargs
+        ).columns
+        if (
+            kwargs.get("fill_method") is not None
+            or kwargs.get("left_by") is not None
+            or kwargs.get("right_by") is not None
+            or not self._merge_keys(right, left_on, right_on)
+        ):
+            return self.default_to_pandas(pandas.merge_ordered, right, **kwargs)
+        self._modin_frame._filter_empties()
+        right._modin_frame._filter_empties()
+        left_bounds = self._sorted_key_bounds(left_on)
+        right_bounds = right._sorted_key_bounds(right_on)
+        if (
+            left_bounds is None
+            or right_bounds is None
+            # A right merge lists the matches of every row of `right` together, so
+            # the rows of this query compiler with the same key must not be split.
+            or kwargs.get("how") == "right"
+            and (
+                left_bounds["first"].values[1:] == left_bounds["last"].values[:-1]
+            ).any()
+        ):
+            return self.default_to_pandas(pandas.merge_ordered, right, **kwargs)
+
+        selections, part_kwargs = [], []
+        prev_last = None
+        for i, (lo, hi) in enumerate(left_bounds.itertuples(index=False)):
+            last = hi if i < len(left_bounds) - 1 else None
+            selections.append(
+                [
+                    (j, None)
+                    for j, (r_first, r_last) in enumerate(
+                        right_bounds.itertuples(index=False)
+                    )
+                    if (prev_last is None or r_last >= prev_last)
+                    and (last is None or r_first <= last)
+                ]
+            )
+            part_kwargs.append({"prev_last": prev_last, "first": lo, "last": last})
+            prev_last = hi
+
+        def merge_ordered_rows(left, right, prev_last, first, last):
+            # The keys equal to the boundary of two row partitions go to both.
+            keys = right[right_on]
+            mask = np.ones(len(right), dtype=bool)
+            if prev_last is not None:
+                mask &= ((keys > prev_last) | (keys >= first)).values
+            if last is not None:
+                mask &= (keys <= last).values
+            return pandas.merge_ordered(left, right[mask], **kwargs)
+
+        return self.__constructor__(
+            self._modin_frame.apply_with_row_blocks(
+                right._modin_frame,
+                selections,
+                merge_ordered_rows,
+                new_columns,
+                kwargs=part_kwargs,
+            )
+        )
+
     # END Inter-Data operations
 
     # Reindex/reset_index (may shuffle data)
@@ -670,7 +1120,7 @@ class PandasQueryCompiler(BaseQueryCompiler):
     idxmax = ReductionFunction.register(pandas.DataFrame.idxmax)
     idxmin = ReductionFunction.register(pandas.DataFrame.idxmin)
     median = ReductionFunction.register(pandas.DataFrame.median)
-    nunique = ReductionFunction.register(pandas.DataFrame.nunique)
+    _nunique_full_axis = ReductionFunction.register(pandas.DataFrame.nunique)
     skew = ReductionFunction.register(pandas.DataFrame.skew)
     kurt = ReductionFunction.register(pandas.DataFrame.kurt)
     std = ReductionFunction.register(pandas.DataFrame.std)
@@ -679,13 +1129,130 @@ class PandasQueryCompiler(BaseQueryCompiler):
     prod_min_count = ReductionFunction.register(pandas.DataFrame.prod)
     quantile_for_single_value = ReductionFunction.register(pandas.DataFrame.quantile)
     mad = ReductionFunction.register(pandas.DataFrame.mad)
-    to_datetime = ReductionFunction.register(
+    _to_datetime_full_axis = ReductionFunction.register(
         lambda df, *args, **kwargs: pandas.to_datetime(
             df.squeeze(axis=1), *args, **kwargs
         ),
         axis=1,
     )
 
+    def to_datetime(self, *args, **kwargs):
+        """Convert a column of strings to datetime, block by block.
+
+        Every row partition parses only its distinct strings. The format is guessed
+        once from the first valid value of the column when `infer_datetime_format` is
+        set, and with `cache` (the default) the parsed strings are shared by the
+        blocks converted in the same process. pandas decides for the whole column
+        whether it can be parsed, so if any block could not be converted to the
+        datetime type of the others, e.g. with `errors="ignore"`, the column is
+        converted in one piece.
+
+        Returns:
+            A new PandasQueryCompiler.
+        """
+        if (
+            args
+            or len(self.columns) != 1
+            or self.dtypes.iloc[0] != np.dtype("O")
+            or kwargs.get("unit") is not None
+        ):
+            return self._to_datetime_full_axis(*args, **kwargs)
+        block_kwargs = kwargs
+        if kwargs.get("infer_datetime_format", False) and kwargs.get("format") is None:
+            block_kwargs = dict(
+                kwargs,
+                format=guess_datetime_format(
+                    [self._first_valid_value()], dayfirst=kwargs.get("dayfirst", False)
+                ),
+            )
+        new_modin_frame = self._modin_frame._map(
+            lambda df: to_datetime_by_unique(
+                df.squeeze(axis=1), **block_kwargs
+            ).to_frame()
+        )
+        # The dtypes of the blocks are combined to object if they differ.
+        if not is_datetime64_any_dtype(new_modin_frame.dtypes.iloc[0]):
+            new_modin_frame = self._modin_frame._apply_full_axis(
+                0,
+                lambda df: pandas.to_datetime(df.squeeze(axis=1), **kwargs).to_frame(),
+                new_index=self.index,
+                new_columns=self.columns,
+            )
+        return self.__constructor__(new_modin_frame)
+
+    def _first_valid_value(self):
+        """Get the first non-null value of a single column.
+
+        Returns:
+            The value, or None if all of the values are null.
+        """
+
+        def first_valid(df):
+            values = df.iloc[:, 0].dropna()
+            return pandas.DataFrame(
+                [[values.iloc[0] if len(values) > 0 else None]],
+                index=["__reduced__"],
+                columns=df.columns,
+                dtype=object,
+            )
+
+        return (
+            self._modin_frame._map_reduce(0, first_valid, preserve_index=False)
+            .to_pandas()
+            .iloc[0, 0]
+        )
+
+    def nunique(self, axis=0, dropna=True):
+        """Counts the distinct values along an axis.
+
+        Along the rows, the distinct values of every block are shuffled by the hash
+        bucket of their value, so that no task has to hold a full column. The hash
+        only routes the values: every bucket gets all of the copies of its values
+        and counts them with pandas, so the counts are exact.
+
+        Args:
+            axis: The axis to count along.
+            dropna: Whether or not to ignore missing values.
+
+        Returns:
+            QueryCompiler containing the number of distinct values.
+        """
+        if axis != 0 or len(self._modin_frame._row_lengths) <= 1:
+            return self._nunique_full_axis(axis=axis, dropna=dropna)
+        num_cols = len(self.columns)
+        dtypes = list(self.dtypes)
+
+        def unique_values(df):
+            # The missing values are kept, pandas counts them in the last step.
+            uniques = [pandas.Series(df.iloc[:, i].unique()) for i in range(num_cols)]
+            return pandas.DataFrame(
+                {
+                    "column": np.repeat(np.arange(num_cols), [len(u) for u in uniques]),
+                    "value": pandas.concat(
+                        [u.astype(object) for u in uniques], ignore_index=True
+                    ).values,
+                },
+                index=pandas.Index(np.concatenate([bucket_hashes(u) for u in uniques])),
+            )
+
+        def count_uniques(df):
+            columns = df["column"].values
+            values = df["value"].values
+            counts = [
+                pandas.Series(values[columns == i], dtype=object)
+                .astype(dtypes[i])
+                .nunique(dropna=dropna)
+                for i in range(num_cols)
+            ]
+            return pandas.DataFrame([counts])
+
+        def sum_counts(df):
+            return df.sum().to_frame().T
+
+        return self.__constructor__(
+            self._modin_frame._hash_reduce(unique_values, count_uniques, sum_counts)
+        )
+
     # END Reduction operations
 
     def _resample_func(
@@ -879,16 +1446,68 @@ class PandasQueryCompiler(BaseQueryCompiler):
     def resample_quantile(self, resample_args, q, **kwargs):
         return self._resample_func(resample_args, "quantile", q=q, **kwargs)
 
-    window_mean = FoldFunction.register(
+    def _window_halo(self, rolling_args):
+        """Compute the number of rows every row block shares with its neighbours.
+
+        Args:
+            rolling_args: The arguments of the rolling window.
+
+        Returns:
+            A tuple of the number of preceding and following rows each row block
+            needs, or None if the window has to be computed over full columns.
+        """
+        window, min_periods, center, win_type, on, axis, closed = rolling_args
+        if on is not None or axis not in (0, "index"):
+            return None
+        if is_integer(window):
+            if window < 1:
+                return None
+            return int(window) - 1, int(window) - 1 if center else 0
+        if center or win_type is not None or not self.index.is_monotonic_increasing:
+            return None
+        try:
+            offset = pandas.tseries.frequencies.to_offset(window)
+            starts = np.cumsum([0] + self._modin_frame._row_lengths[:-1])
+            first_labels = self.index[starts] - offset
+        except (TypeError, ValueError):
+            return None
+        # All of the rows no older than the window before the first row of the block
+        # are borrowed, any extra rows are dropped by the window itself.
+        return list(starts - self.index.searchsorted(first_labels, side="left")), 0
+
+    def _rolling_fold(self, rolling_args, func):
+        """Apply a rolling window function.
+
+        Args:
+            rolling_args: The arguments of the rolling window.
+            func: The function to apply to pandas DataFrames.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        halo = (
+            self._window_halo(rolling_args)
+            if len(self._modin_frame._row_lengths) > 1
+            else None
+        )
+        if halo is None:
+            new_modin_frame = self._modin_frame._fold(0, func)
+        else:
+            new_modin_frame = self._modin_frame._overlap_fold(func, *halo)
+        return self.__constructor__(new_modin_frame)
+
+    window_mean = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).mean(*args, **kwargs)
         )
     )
-    window_sum = FoldFunction.register(
+    window_sum = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).sum(*args, **kwargs)
         )
     )
+    # The weighted variance of pandas depends on all of the preceding rows rather
+    # than on the window alone, so it is computed over full columns.
     window_var = FoldFunction.register(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).var(ddof=ddof, *args, **kwargs)
@@ -899,55 +1518,55 @@ class PandasQueryCompiler(BaseQueryCompiler):
             df.rolling(*rolling_args).std(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_count = FoldFunction.register(
+    rolling_count = _rolling_func(
         lambda df, rolling_args: pandas.DataFrame(df.rolling(*rolling_args).count())
     )
-    rolling_sum = FoldFunction.register(
+    rolling_sum = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).sum(*args, **kwargs)
         )
     )
-    rolling_mean = FoldFunction.register(
+    rolling_mean = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).mean(*args, **kwargs)
         )
     )
-    rolling_median = FoldFunction.register(
+    rolling_median = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).median(**kwargs)
         )
     )
-    rolling_var = FoldFunction.register(
+    rolling_var = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).var(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_std = FoldFunction.register(
+    rolling_std = _rolling_func(
         lambda df, rolling_args, ddof, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).std(ddof=ddof, *args, **kwargs)
         )
     )
-    rolling_min = FoldFunction.register(
+    rolling_min = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).min(*args, **kwargs)
         )
     )
-    rolling_max = FoldFunction.register(
+    rolling_max = _rolling_func(
         lambda df, rolling_args, *args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).max(*args, **kwargs)
         )
     )
-    rolling_skew = FoldFunction.register(
+    rolling_skew = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).skew(**kwargs)
         )
     )
-    rolling_kurt = FoldFunction.register(
+    rolling_kurt = _rolling_func(
         lambda df, rolling_args, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).kurt(**kwargs)
         )
     )
-    rolling_apply = FoldFunction.register(
+    rolling_apply = _rolling_func(
         lambda df, rolling_args, func, raw, engine, engine_kwargs, args, kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).apply(
                 func=func,
@@ -959,7 +1578,7 @@ class PandasQueryCompiler(BaseQueryCompiler):
             )
         )
     )
-    rolling_quantile = FoldFunction.register(
+    rolling_quantile = _rolling_func(
         lambda df, rolling_args, quantile, interpolation, **kwargs: pandas.DataFrame(
             df.rolling(*rolling_args).quantile(
                 quantile=quantile, interpolation=interpolation, **kwargs
@@ -1273,11 +1892,62 @@ class PandasQueryCompiler(BaseQueryCompiler):
     # that is being operated on. This means that we have to put all of that
     # data in the same place.
 
-    cummax = FoldFunction.register(pandas.DataFrame.cummax)
-    cummin = FoldFunction.register(pandas.DataFrame.cummin)
-    cumsum = FoldFunction.register(pandas.DataFrame.cumsum)
-    cumprod = FoldFunction.register(pandas.DataFrame.cumprod)
-    diff = FoldFunction.register(pandas.DataFrame.diff)
+    cummax = _scan_func(pandas.DataFrame.cummax)
+    cummin = _scan_func(pandas.DataFrame.cummin)
+    cumsum = _scan_func(pandas.DataFrame.cumsum)
+    cumprod = _scan_func(pandas.DataFrame.cumprod)
+
+    def _scan(self, axis, func, skipna=True, dtypes_check=None):
+        """Apply a prefix scan along an axis.
+
+        Args:
+            axis: The axis to scan along.
+            func: The scan to apply to pandas DataFrames.
+            skipna: Whether or not `func` skips missing values.
+            dtypes_check: (optional) Function that takes a dtype and returns whether
+                the scan can be computed one row block at a time for columns of that
+                type. Defaults to non-boolean numeric types.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        if dtypes_check is None:
+
+            def dtypes_check(dtype):
+                return is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+
+        if (
+            axis == 0
+            and len(self._modin_frame._row_lengths) > 1
+            and all(dtypes_check(dtype) for dtype in self.dtypes)
+        ):
+            new_modin_frame = self._modin_frame._scan(func, skipna=skipna)
+        else:
+            new_modin_frame = self._modin_frame._fold(axis, func)
+        return self.__constructor__(new_modin_frame)
+
+    def diff(self, periods=1, axis=0):
+        """Finds the difference between elements on the axis requested.
+
+        Returns:
+            A new QueryCompiler.
+        """
+
+        def diff(df):
+            return df.diff(periods=periods, axis=axis)
+
+        if (
+            axis == 0
+            and is_integer(periods)
+            and len(self._modin_frame._row_lengths) > 1
+        ):
+            # Every row only needs the row `periods` rows before (or after) it
+            new_modin_frame = self._modin_frame._overlap_fold(
+                diff, max(periods, 0), max(-periods, 0)
+            )
+        else:
+            new_modin_frame = self._modin_frame._fold(axis, diff)
+        return self.__constructor__(new_modin_frame)
 
     def clip(self, lower, upper, **kwargs):
         kwargs["upper"] = upper
@@ -1309,6 +1979,26 @@ class PandasQueryCompiler(BaseQueryCompiler):
         PandasQueryCompiler
             A new query compiler that contains result of the matrix multiply.
         """
+        if (
+            isinstance(other, PandasQueryCompiler)
+            and not squeeze_self
+            and len(self.columns) > 1
+            and all(
+                is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+                for dtype in pandas.concat([self.dtypes, other.dtypes])
+            )
+        ):
+            # Multiply block by block so that `other` is not materialized.
+            if not other.index.equals(self.columns):
+                other = other.reindex(axis=0, labels=self.columns)
+            new_modin_frame = self._modin_frame._matmul(
+                other._modin_frame,
+                np.result_type(*self.dtypes.values, *other.dtypes.values),
+            )
+            if squeeze_other:
+                new_modin_frame.columns = ["__reduced__"]
+            return self.__constructor__(new_modin_frame)
+
         if isinstance(other, PandasQueryCompiler):
             other = (
                 other.to_pandas().squeeze(axis=1)
@@ -1342,6 +2032,135 @@ class PandasQueryCompiler(BaseQueryCompiler):
         )
         return self.__constructor__(new_modin_frame)
 
+    def _pairwise_moments(self):
+        """
+        Compute the sufficient statistics of pairwise-complete column moments.
+
+        Every row partition computes, for each pair of columns `(i, j)` over the rows
+        where both values are finite, the number of observations, the sum of `i`,
+        the sum of `i * j` and the sum of `i ** 2`. The partial matrices are then
+        summed across the row partitions. The data is shifted by the column means
+        first to keep the sums well conditioned.
+
+        Returns
+        -------
+        tuple of NumPy arrays
+            Four square matrices: counts, sums, cross products and sums of squares.
+        """
+        num_cols = len(self.columns)
+        shift = self.mean(axis=0, skipna=True).to_pandas().values.ravel()
+        shift = np.where(np.isfinite(shift), shift, 0.0)
+
+        def map_func(df, shift=shift):
+            values = df.values.astype(np.float64) - shift
+            mask = np.isfinite(values)
+            values = np.where(mask, values, 0.0)
+            mask = mask.astype(np.float64)
+            return pandas.DataFrame(
+                np.hstack(
+                    [
+                        mask.T @ mask,
+                        values.T @ mask,
+                        values.T @ values,
+                        (values ** 2).T @ mask,
+                    ]
+                )
+            )
+
+        def reduce_func(df):
+            return df.groupby(level=0).sum()
+
+        new_columns = pandas.RangeIndex(4 * num_cols)
+        moments = (
+            self._modin_frame._apply_full_axis(1, map_func, new_columns=new_columns)
+            ._apply_full_axis(
+                0,
+                reduce_func,
+                new_index=pandas.RangeIndex(num_cols),
+                new_columns=new_columns,
+            )
+            .to_pandas()
+            .values
+        )
+        return tuple(np.split(moments, 4, axis=1))
+
+    def cov(self, min_periods=None):
+        """
+        Compute pairwise covariance of columns, excluding NA/null values.
+
+        Parameters
+        ----------
+            min_periods : int (optional)
+                Minimum number of observations required per pair of columns.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            A new query compiler that contains the covariance matrix.
+        """
+        count, sums, cross, _ = self._pairwise_moments()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            result = (cross - sums * sums.T / count) / (count - 1)
+        result[count < max(min_periods or 1, 2)] = np.nan
+        return self.from_pandas(
+            pandas.DataFrame(result, index=self.columns, columns=self.columns),
+            type(self._modin_frame),
+        )
+
+    def corr(self, method="pearson", min_periods=1):
+        """
+        Compute pairwise correlation of columns, excluding NA/null values.
+
+        Parameters
+        ----------
+            method : {"pearson", "spearman"}
+                The correlation method. Spearman correlation is computed as Pearson
+                correlation of the column ranks.
+            min_periods : int (optional)
+                Minimum number of observations required per pair of columns.
+
+        Returns
+        -------
+        PandasQueryCompiler
+            A new query compiler that contains the correlation matrix.
+        """
+        if method == "spearman":
+            # pandas ranks every pair of columns over its complete observations,
+            # which only equals the column ranks when nothing is missing, so the
+            # missing values are looked for before anything is ranked
+            has_missing = self._modin_frame._map_reduce(
+                0,
+                lambda df: ~np.isfinite(df.astype(np.float64)).all(),
+                lambda df: df.any(),
+            )
+            if np.any(self.__constructor__(has_missing).to_pandas().values):
+                return self.default_to_pandas(
+                    pandas.DataFrame.corr, method=method, min_periods=min_periods
+                )
+            ranks = self.__constructor__(
+                self._modin_frame._apply_full_axis(
+                    0,
+                    lambda df: df.astype(np.float64)
+                    .replace([np.inf, -np.inf], np.nan)
+                    .rank(),
+                    new_index=self.index,
+                    new_columns=self.columns,
+                )
+            )
+            count, sums, cross, squares = ranks._pairwise_moments()
+        else:
+            count, sums, cross, squares = self._pairwise_moments()
+        with np.errstate(divide="ignore", invalid="ignore"):
+            comoment = cross - sums * sums.T / count
+            sq_dev = squares - sums ** 2 / count
+            divisor = np.sqrt(sq_dev * sq_dev.T)
+            result = np.where(divisor != 0, comoment / divisor, np.nan)
+        result[count < (1 if min_periods is None else min_periods)] = np.nan
+        return self.from_pandas(
+            pandas.DataFrame(result, index=self.columns, columns=self.columns),
+            type(self._modin_frame),
+        )
+
     def nsort(self, n, columns=None, keep="first", sort_type="nsmallest"):
         def map_func(df, n=n, keep=keep, columns=columns):
             if columns is None:
@@ -1454,7 +2273,11 @@ class PandasQueryCompiler(BaseQueryCompiler):
             def fillna(df):
                 return df.fillna(**kwargs)
 
-        if full_axis:
+        if method in ["ffill", "pad"] and limit is None and not kwargs.get("downcast"):
+            return self._scan(
+                axis, fillna, dtypes_check=lambda dtype: not is_categorical_dtype(dtype)
+            )
+        elif full_axis:
             new_modin_frame = self._modin_frame._fold(axis, fillna)
         else:
             new_modin_frame = self._modin_frame._map(fillna)
@@ -1512,6 +2335,143 @@ class PandasQueryCompiler(BaseQueryCompiler):
         result = self.__constructor__(new_modin_frame)
         return result.transpose() if axis == 1 else result
 
+    def _approx_map_reduce(self, columns, reduce_func, compression):
+        """Summarize columns with mergeable t-digests in a single MapReduce pass.
+
+        Args:
+            columns: The labels of the numeric columns to summarize.
+            reduce_func: Function that takes a TDigest of a column and returns the
+                values of the result for that column.
+            compression: The accuracy of the digests.
+
+        Returns:
+            A new QueryCompiler with the results of `reduce_func` as columns.
+        """
+
+        def digest_builder(df):
+            return pandas.DataFrame(
+                [
+                    [
+                        TDigest.from_values(
+                            df.iloc[:, i].to_numpy(dtype=np.float64, na_value=np.nan),
+                            compression,
+                        )
+                        for i in range(len(df.columns))
+                    ]
+                ],
+                columns=df.columns,
+            )
+
+        def merge_builder(df):
+            return pandas.DataFrame(
+                {
+                    i: reduce_func(TDigest.merge(df.iloc[:, i], compression))
+                    for i in range(len(df.columns))
+                }
+            ).set_axis(df.columns, axis=1, inplace=False)
+
+        query_compiler = self.getitem_column_array(columns)
+        return MapReduceFunction.register(
+            digest_builder, merge_builder, axis=0, preserve_index=False
+        )(query_compiler)
+
+    def approx_quantile(self, q, compression=DEFAULT_COMPRESSION):
+        """Estimates quantiles of the numeric columns in a single pass.
+
+        Every row block is summarized with a t-digest per column in the map phase,
+        and the digests are merged in the reduce phase.
+
+        Args:
+            q: The list of quantiles to compute.
+            compression: The accuracy of the digests. The quantile error decreases
+                linearly with it.
+
+        Returns:
+            QueryCompiler containing the estimated quantiles indexed by `q`.
+        """
+        columns = self._modin_frame._numeric_columns()
+        if len(columns) == 0 or len(self.index) == 0:
+            return self.quantile_for_list_of_values(q=q)
+
+        def quantile_builder(digest):
+            return pandas.Series(digest.quantile(q), index=pandas.Float64Index(q))
+
+        return self._approx_map_reduce(columns, quantile_builder, compression)
+
+    def approx_describe(self, percentiles, compression=DEFAULT_COMPRESSION):
+        """Generates descriptive statistics of the numeric columns in a single pass.
+
+        The count, mean, standard deviation, minimum and maximum are exact, the
+        percentiles are estimated with t-digests.
+
+        Args:
+            percentiles: The sorted list of percentiles to include in the output.
+            compression: The accuracy of the digests.
+
+        Returns:
+            QueryCompiler containing the descriptive statistics of the numeric columns.
+        """
+        columns = self._modin_frame._numeric_columns(include_bool=False)
+        if len(columns) == 0 or len(self.index) == 0:
+            return self.describe(percentiles=percentiles)
+        new_index = (
+            ["count", "mean", "std", "min"] + format_percentiles(percentiles) + ["max"]
+        )
+
+        def describe_builder(digest):
+            return pandas.Series(
+                np.r_[
+                    digest.count,
+                    digest.mean,
+                    np.sqrt(digest.var()),
+                    digest.min,
+                    digest.quantile(percentiles),
+                    digest.max,
+                ],
+                index=new_index,
+            )
+
+        return self._approx_map_reduce(columns, describe_builder, compression)
+
+    def approx_nunique(self, dropna=True, precision=DEFAULT_PRECISION):
+        """Estimates the number of distinct values of every column in a single pass.
+
+        Every row block is summarized with a HyperLogLog sketch per column in the
+        map phase, and the sketches are merged in the reduce phase.
+
+        Args:
+            dropna: Whether or not to ignore missing values.
+            precision: The number of hash bits that select a register of the
+                sketches. The relative error is about `1.04 / sqrt(2 ** precision)`.
+
+        Returns:
+            QueryCompiler containing the estimated number of distinct values.
+        """
+
+        def sketch_builder(df):
+            return pandas.DataFrame(
+                [
+                    [
+                        HyperLogLog.from_values(df.iloc[:, i], precision, dropna)
+                        for i in range(len(df.columns))
+                    ]
+                ],
+                columns=df.columns,
+            )
+
+        def count_builder(df):
+            return pandas.Series(
+                [
+                    HyperLogLog.merge(df.iloc[:, i]).count()
+                    for i in range(len(df.columns))
+                ],
+                index=df.columns,
+            )
+
+        return MapReduceFunction.register(
+            sketch_builder, count_builder, axis=0, preserve_index=False
+        )(self)
+
     def query(self, expr, **kwargs):
         """Query columns of the QueryCompiler with a boolean expression.
 
@@ -1813,6 +2773,57 @@ class PandasQueryCompiler(BaseQueryCompiler):
             )
         )
 
+    def duplicated(self, subset=None, keep="first"):
+        """Mark duplicate rows, optionally only considering certain columns.
+
+        Rows are hashed block by block and shuffled by hash bucket, so that every
+        bucket resolves `keep` against the global row positions on its own. The
+        hash only routes the rows, equal rows always share a bucket and pandas
+        compares their values there.
+
+        Args:
+            subset: (optional) The column labels to consider.
+            keep: {'first', 'last', False} which occurrence is not marked.
+
+        Returns:
+            A new QueryCompiler with a single boolean column.
+        """
+        frame = (
+            self._modin_frame
+            if subset is None
+            else self.getitem_column_array(subset)._modin_frame
+        )
+
+        def hash_rows(df):
+            hashes = np.zeros(len(df), dtype=np.uint64)
+            for i in range(len(df.columns)):
+                hashes = hashes * np.uint64(1000003) ^ bucket_hashes(df.iloc[:, i])
+            return hashes
+
+        new_columns = pandas.Index(["__reduced__"])
+        new_modin_frame = frame.hash_shuffle_apply(
+            hash_rows,
+            lambda df: df.duplicated(keep=keep).to_frame("__reduced__"),
+            new_columns,
+            dtypes=pandas.Series([np.dtype(bool)], index=new_columns),
+        )
+        return self.__constructor__(new_modin_frame)
+
+    def drop_duplicates(self, subset=None, keep="first"):
+        """Remove duplicate rows, optionally only considering certain columns.
+
+        Args:
+            subset: (optional) The column labels to consider.
+            keep: {'first', 'last', False} which occurrence to keep.
+
+        Returns:
+            A new QueryCompiler.
+        """
+        duplicated = self.duplicated(subset=subset, keep=keep)._modin_frame
+        return self.__constructor__(
+            self._modin_frame.filter_rows(duplicated._map(lambda df: ~df))
+        )
+
     def drop(self, index=None, columns=None):
         """Remove row data for target index and columns.
 
@@ -1994,12 +3005,140 @@ class PandasQueryCompiler(BaseQueryCompiler):
         Returns:
             A new PandasQueryCompiler.
         """
+        if (
+            axis == 1
+            and len(self.index) > 0
+            and kwargs.get("result_type") is None
+            and (kwargs.get("raw", False) or getattr(func, "_modin_vectorized", False))
+        ):
+            kwargs = kwargs.copy()
+            kwargs.pop("raw", None)
+            kwargs.pop("result_type", None)
+            return self._apply_raw_rows(func, *kwargs.pop("args", ()), **kwargs)
         func = wrap_udf_function(func)
         new_modin_frame = self._modin_frame._apply_full_axis(
             axis, lambda df: df.apply(func, axis=axis, *args, **kwargs)
         )
         return self.__constructor__(new_modin_frame)
 
+    def _apply_raw_rows(self, func, *args, **kwargs):
+        """Apply a function to the rows as NumPy arrays, one row partition at a time.
+
+        Functions marked as vectorized receive the 2-D array of the full row
+        partition, other functions are applied to its rows without building a
+        Series per row, compiled with numba when it is installed.
+
+        Args:
+            func: The function to apply.
+
+        Returns:
+            A new PandasQueryCompiler with a single `__reduced__` column if `func`
+            returns scalars, or with the same columns if it returns rows.
+        """
+        vectorized = getattr(func, "_modin_vectorized", False)
+
+        def raw_apply(df):
+            values = df.values
+            if vectorized:
+                result = np.asarray(func(values, *args, **kwargs))
+            else:
+                result = _apply_along_rows(func, values, args, kwargs)
+            if result.ndim == 2:
+                return pandas.DataFrame(result, index=df.index, columns=df.columns)
+            return pandas.DataFrame(
+                {"__reduced__": pandas.Series(result, index=df.index).infer_objects()}
+            )
+
+        new_modin_frame = self._modin_frame._apply_full_axis(
+            1, raw_apply, new_index=self.index
+        )
+        return self.__constructor__(new_modin_frame)
+
+    def map_partitions(
+        self,
+        func,
+        new_columns=None,
+        dtypes=None,
+        preserve_index=False,
+        with_partition_info=False,
+    ):
+        """Apply a function to the pandas DataFrame of every row partition.
+
+        Args:
+            func: The function to apply. It receives all of the columns of a row
+                partition and returns a pandas DataFrame.
+            new_columns: (optional) The columns of the result. Computed if not
+                provided.
+            dtypes: (optional) A pandas Series with the data types of the result.
+            preserve_index: Whether or not `func` keeps the index of every row
+                partition, in which case the index is not recomputed.
+            with_partition_info: Whether or not to pass a `partition_info` dict with
+                the `number` of the row partition, the position of its first row
+                (`start`) and the total number of row partitions (`npartitions`)
+                to `func`.
+
+        Returns:
+            A new PandasQueryCompiler.
+        """
+        func = wrap_udf_function(func)
+        if with_partition_info:
+            lengths = self._modin_frame._row_lengths
+            starts = np.cumsum([0] + list(lengths[:-1]))
+
+            def partition_func(df, partition_idx):
+                return func(
+                    df,
+                    partition_info={
+                        "number": partition_idx,
+                        "start": starts[partition_idx],
+                        "npartitions": len(lengths),
+                    },
+                )
+
+        else:
+            partition_func = func
+        return self.__constructor__(
+            self._modin_frame._map_row_partitions(
+                partition_func,
+                new_columns=new_columns,
+                dtypes=dtypes,
+                preserve_index=preserve_index,
+                enumerate_partitions=with_partition_info,
+            )
+        )
+
+    def tree_reduce(self, map_func, reduce_func, split_every=8):
+        """Reduce the row partitions with a tree of tasks.
+
+        Args:
+            map_func: The function to apply to the pandas DataFrame of every row
+                partition.
+            reduce_func: The function that reduces the concatenated results of
+                `map_func`, or of itself.
+            split_every: The number of results to reduce in every task.
+
+        Returns:
+            A new PandasQueryCompiler. Series results are returned as a single row
+            with the `__reduced__` index.
+        """
+
+        def as_frame(func):
+            func = wrap_udf_function(func)
+
+            def frame_func(df):
+                result = func(df)
+                if isinstance(result, pandas.Series):
+                    return result.to_frame("__reduced__").T
+                return result
+
+            return frame_func
+
+        return self.__constructor__(
+            self._modin_frame._tree_reduce(
+                as_frame(map_func), as_frame(reduce_func), split_every
+            )
+        )
+
     # END UDF
 
     # Manual Partitioning methods (e.g. merge, groupby)
@@ -2032,6 +3171,15 @@ class PandasQueryCompiler(BaseQueryCompiler):
         lambda df, **kwargs: pandas.DataFrame(df.size()), lambda df, **kwargs: df.sum()
     )
 
+    groupby_approx_nunique = GroupbyReduceFunction.register(
+        lambda df, dropna=True, precision=DEFAULT_PRECISION: df.agg(
+            lambda values: HyperLogLog.from_values(values, precision, dropna)
+        ),
+        lambda df, **kwargs: df.agg(
+            lambda sketches: HyperLogLog.merge(sketches).count()
+        ),
+    )
+
     def groupby_dict_agg(self, by, func_dict, groupby_args, agg_args, drop=False):
         """Apply aggregation functions to a grouped dataframe per-column.
 
@@ -2122,6 +3270,10 @@ class PandasQueryCompiler(BaseQueryCompiler):
     def get_dummies(self, columns, **kwargs):
         """Convert categorical variables to dummy variables for certain columns.
 
+        The distinct values of the columns are gathered with a map-reduce first, so
+        that every row partition can be encoded independently against the same
+        sorted categories.
+
         Args:
             columns: The columns to convert.
 
@@ -2129,42 +3281,398 @@ class PandasQueryCompiler(BaseQueryCompiler):
             A new QueryCompiler.
         """
         # `columns` as None does not mean all columns, by default it means only
-        # non-numeric columns.
+        # the object and categorical columns, like in pandas.
         if columns is None:
-            columns = [c for c in self.columns if not is_numeric_dtype(self.dtypes[c])]
-            # If we aren't computing any dummies, there is no need for any
-            # remote compute.
-            if len(columns) == 0:
-                return self.copy()
+            columns = [
+                c
+                for c in self.columns
+                if self.dtypes[c] == np.dtype("O")
+                or is_categorical_dtype(self.dtypes[c])
+            ]
         elif not is_list_like(columns):
             columns = [columns]
+        # If we aren't computing any dummies, there is no need for any
+        # remote compute.
+        if len(columns) == 0:
+            return self.copy()
 
         # In some cases, we are mapping across all of the data. It is more
         # efficient if we are mapping over all of the data to do it this way
         # than it would be to reuse the code for specific columns.
         if len(columns) == len(self.columns):
-            new_modin_frame = self._modin_frame._apply_full_axis(
-                0, lambda df: pandas.get_dummies(df, **kwargs), new_index=self.index
-            )
-            untouched_frame = None
+            to_encode = self._modin_frame
         else:
-            new_modin_frame = self._modin_frame.mask(
-                col_indices=columns
-            )._apply_full_axis(
-                0, lambda df: pandas.get_dummies(df, **kwargs), new_index=self.index
+            to_encode = self._modin_frame.mask(col_indices=columns)
+        categories = self._dummies_categories(to_encode)
+
+        def encode(df):
+            # Every block gets the same categories, so it gets the same dummy
+            # columns, in the same order, as the whole columns would.
+            return pandas.get_dummies(
+                pandas.DataFrame(
+                    {
+                        i: pandas.Categorical(df.iloc[:, i], categories=categories[i])
+                        for i in range(len(df.columns))
+                    },
+                    index=df.index,
+                ).set_axis(df.columns, axis=1, inplace=False),
+                **kwargs
             )
-            untouched_frame = self.drop(columns=columns)
+
+        new_columns = encode(pandas.DataFrame(columns=to_encode.columns)).columns
+        new_modin_frame = to_encode._apply_full_axis(
+            1,
+            encode,
+            new_index=self.index,
+            new_columns=new_columns,
+            dtypes=kwargs.get("dtype") or np.uint8,
+        )
         # If we mapped over all the data we are done. If not, we need to
         # prepend the `new_modin_frame` with the raw data from the columns that were
         # not selected.
         if len(columns) != len(self.columns):
-            new_modin_frame = untouched_frame._modin_frame._concat(
+            new_modin_frame = self.drop(columns=columns)._modin_frame._concat(
                 1, [new_modin_frame], how="left", sort=False
             )
         return self.__constructor__(new_modin_frame)
 
+    def _dummies_categories(self, frame):
+        """Find the sorted categories of every column of a frame for `get_dummies`.
+
+        Args:
+            frame: The frame with the columns to encode.
+
+        Returns:
+            A list with the categories of every column.
+        """
+        dtypes = frame.dtypes
+        categories = [
+            dtype.categories if is_categorical_dtype(dtype) else None
+            for dtype in dtypes
+        ]
+        if all(c is not None for c in categories):
+            return categories
+        if len(frame.index) == 0:
+            return [
+                pandas.Categorical([]).categories if c is None else c
+                for c in categories
+            ]
+
+        def unique_values(df):
+            values = np.empty((1, len(df.columns)), dtype=object)
+            for i in range(len(df.columns)):
+                values[0, i] = df.iloc[:, i].dropna().unique()
+            return pandas.DataFrame(values, index=["__reduced__"], columns=df.columns)
+
+        def merge_unique_values(df):
+            values = np.empty((1, len(df.columns)), dtype=object)
+            for i in range(len(df.columns)):
+                values[0, i] = pandas.unique(np.concatenate(df.iloc[:, i].values))
+            return pandas.DataFrame(values, index=["__reduced__"], columns=df.columns)
+
+        uniques = (
+            frame._map_reduce(
+                0, unique_values, merge_unique_values, preserve_index=False
+            )
+            .to_pandas()
+            .iloc[0]
+        )
+        # The categories are sorted like pandas sorts the levels of the dummies,
+        # or kept in the order of appearance if the values are not comparable.
+        return [
+            pandas.Categorical(uniques.iloc[i]).categories
+            if categories[i] is None
+            else categories[i]
+            for i in range(len(categories))
+        ]
+
     # END Get_dummies
 
+    # Reshape
+    def stack(self, level, dropna):
+        """Stack column levels into the index, one row partition at a time.
+
+        Every row of the result comes from a single row of this frame, in order, so
+        the row partitions are stacked independently.
+
+        Args:
+            level: The column levels to stack.
+            dropna: Whether to drop the rows of the result with only missing values.
+
+        Returns:
+            A new PandasQueryCompiler. Series results have a single `__reduced__`
+            column.
+        """
+
+        def stack_rows(df):
+            result = df.stack(level=level, dropna=dropna)
+            if isinstance(result, pandas.Series):
+                return result.to_frame("__reduced__")
+            return result
+
+        return self.__constructor__(self._modin_frame._apply_full_axis(1, stack_rows))
+
+    def unstack(self, level, fill_value):
+        """Pivot index levels to the columns by scattering the rows to their cells.
+
+        The output row and column block of every row are found by unstacking the row
+        positions along the index, which is already known. The rows are then sent to
+        the row partition of the result that holds their output row, where the cells
+        are filled in with NumPy.
+
+        Note: The index must be a MultiIndex without missing values and the columns
+            must have NumPy dtypes.
+
+        Args:
+            level: The index levels to unstack.
+            fill_value: The value for the missing cells.
+
+        Returns:
+            A new PandasQueryCompiler.
+        """
+        positions = pandas.Series(np.arange(len(self.index)), index=self.index)
+        positions = positions.unstack(level, fill_value=-1)
+        keys = positions.columns
+        num_rows, stride = positions.shape
+        width = len(self.columns)
+
+        source = positions.values.ravel()
+        observed = source != -1
+        out_rows = np.empty(len(self.index), dtype=np.int64)
+        out_rows[source[observed]] = np.repeat(np.arange(num_rows), stride)[observed]
+        out_keys = np.empty(len(self.index), dtype=np.int64)
+        out_keys[source[observed]] = np.tile(np.arange(stride), num_rows)[observed]
+
+        # The columns of the result are the product of the columns and the keys,
+        # like pandas builds them.
+        if isinstance(self.columns, pandas.MultiIndex):
+            levels, codes = list(self.columns.levels), list(self.columns.codes)
+        else:
+            levels, codes = [self.columns], [np.arange(width)]
+        if isinstance(keys, pandas.MultiIndex):
+            key_levels, key_codes = list(keys.levels), list(keys.codes)
+        else:
+            key_levels, key_codes = [keys], [np.arange(stride)]
+        propagator = np.repeat(np.arange(width), stride)
+        new_columns = pandas.MultiIndex(
+            levels=levels + key_levels,
+            codes=[c.take(propagator) for c in codes]
+            + [np.tile(c, width) for c in key_codes],
+            names=list(self.columns.names) + list(keys.names),
+            verify_integrity=False,
+        )
+
+        # Missing cells promote the dtypes of all of the columns, like in pandas.
+        if observed.all():
+            promoted = [(dtype, fill_value) for dtype in self.dtypes]
+        else:
+            promoted = [maybe_promote(dtype, fill_value) for dtype in self.dtypes]
+        new_dtypes = pandas.Series(
+            np.repeat(np.array([dtype for dtype, _ in promoted], dtype=object), stride),
+            index=new_columns,
+        )
+
+        num_buckets = min(len(self._modin_frame._row_lengths), num_rows)
+        chunk = -(-num_rows // num_buckets)
+        row_lengths = [
+            min(chunk, num_rows - start) for start in range(0, num_rows, chunk)
+        ]
+
+        def build_rows(df):
+            num_local = -(-(int(df.index.max()) + 1) // stride)
+            cells = df.index.values
+            blocks = []
+            for i in range(len(df.columns)):
+                dtype, fill = promoted[i]
+                values = np.empty(num_local * stride, dtype=dtype)
+                if len(cells) < len(values):
+                    values.fill(fill)
+                values[cells] = df.iloc[:, i].values
+                blocks.append(values.reshape(num_local, stride))
+            return pandas.concat(
+                [pandas.DataFrame(block) for block in blocks], axis=1, copy=False
+            )
+
+        bucket_starts = np.cumsum([0] + row_lengths[:-1])
+        buckets = out_rows // chunk
+        targets = (out_rows - bucket_starts[buckets]) * stride + out_keys
+        return self.__constructor__(
+            self._modin_frame.scatter_rows(
+                buckets,
+                targets,
+                build_rows,
+                positions.index,
+                new_columns,
+                row_lengths,
+                new_dtypes,
+            )
+        )
+
+    def explode(self, column):
+        """Transform every list-like of a column to rows, one row partition at a time.
+
+        The rows of every row partition are exploded in a single task that also
+        returns their number, and the row partitions are rebalanced only if the
+        lengths of the lists make them badly skewed.
+
+        Args:
+            column: The column to explode.
+
+        Returns:
+            A new PandasQueryCompiler.
+        """
+
+        def explode_rows(df):
+            return df.explode(column)
+
+        new_modin_frame = self._modin_frame._map_row_partitions(
+            explode_rows, new_columns=self.columns, dtypes=self._modin_frame._dtypes
+        )
+        return self.__constructor__(new_modin_frame._rebalance_rows())
+
+    def lreshape(self, keys, values, dropna):
+        """Reshape wide-format data to long, one row partition at a time.
+
+        Like `melt`, every row partition gives one block of rows for every position
+        in the column groups, and the blocks are stacked by position.
+
+        Args:
+            keys: The labels of the new columns.
+            values: The lists of columns to stack into every new column.
+            dropna: Whether or not to drop the rows with missing values in the new
+                columns.
+
+        Returns:
+            A new PandasQueryCompiler.
+        """
+        all_cols = list(set().union(*[set(names) for names in values]))
+        id_cols = list(self.columns.difference(all_cols))
+        dtypes = self.dtypes
+        new_columns = pandas.Index(id_cols + list(keys))
+        new_dtypes = pandas.Series(
+            [dtypes[col] for col in id_cols]
+            + [find_common_type([dtypes[col] for col in names]) for names in values],
+            index=new_columns,
+        )
+
+        def reshape_rows(df, position):
+            result = pandas.concat(
+                [df[id_cols]]
+                + [
+                    df[names[position]].astype(new_dtypes[key]).rename(key)
+                    for key, names in zip(keys, values)
+                ],
+                axis=1,
+            )
+            if dropna:
+                result = result[result[list(keys)].notna().all(axis=1)]
+            return result
+
+        frames = [
+            self._modin_frame._map_row_partitions(
+                lambda df, position=position: reshape_rows(df, position),
+                new_columns=new_columns,
+                dtypes=new_dtypes,
+            )
+            for position in range(len(values[0]))
+        ]
+        result = self.__constructor__(
+            frames[0]._concat(0, frames[1:], how="outer", sort=False)
+        )
+        result.index = pandas.RangeIndex(len(result.index))
+        return result
+
+    def wide_to_long(self, stubnames, i, j, sep, suffix):
+        """Reshape wide-format data to long, one row partition at a time.
+
+        Args:
+            stubnames: The stub names of the wide columns.
+            i: The columns to use as the id variables.
+            j: The name of the suffix column.
+            sep: The separator between the stub names and the suffixes.
+            suffix: The regular expression of the suffixes.
+
+        Returns:
+            A new PandasQueryCompiler.
+        """
+
+        def wide_to_long_rows(df):
+            return pandas.wide_to_long(df, stubnames, i, j, sep=sep, suffix=suffix)
+
+        if len(self.index) == 0:
+            return self.default_to_pandas(
+                pandas.wide_to_long, stubnames, i, j, sep=sep, suffix=suffix
+            )
+        # The columns of the result are ordered like a Python set, so they are taken
+        # from the result of the first row.
+        meta = wide_to_long_rows(self.getitem_row_array([0]).to_pandas())
+        new_columns = meta.columns
+        if len(i) > 1:
+            # The rows of every id keep the order of the rows of the frame.
+            new_modin_frame = self._modin_frame._map_row_partitions(
+                lambda df: wide_to_long_rows(df)[new_columns], new_columns=new_columns
+            )
+            return self.__constructor__(new_modin_frame)
+        value_vars = []
+        for stub in stubnames:
+            pattern = re.compile(
+                r"^{stub}{sep}{suffix}$".format(
+                    stub=re.escape(stub), sep=re.escape(sep), suffix=suffix
+                )
+            )
+            value_vars.append([col for col in self.columns if pattern.match(col)])
+        stub_suffixes = [
+            [col.replace(stub + sep, "") for col in names]
+            for stub, names in zip(stubnames, value_vars)
+        ]
+        if len(stub_suffixes[0]) == 0 or any(
+            suffixes != stub_suffixes[0] for suffixes in stub_suffixes[1:]
+        ):
+            # The rows are sorted by the id and the suffix when the stubs have
+            # different suffixes, so sorting the rows by the id first makes the row
+            # partitions ordered too.
+            key = self.getitem_column_array(i).to_pandas().iloc[:, 0]
+            qc = self
+            if not key.is_monotonic_increasing:
+                qc = self.getitem_row_array(np.argsort(key.values, kind="mergesort"))
+            new_modin_frame = qc._modin_frame._map_row_partitions(
+                lambda df: wide_to_long_rows(df)[new_columns], new_columns=new_columns
+            )
+            return self.__constructor__(new_modin_frame)
+
+        # Otherwise the rows are stacked by suffix, like in `melt`, so every row
+        # partition gives one block of rows for every suffix.
+        all_value_vars = {col for names in value_vars for col in names}
+        id_vars = [col for col in self.columns if col not in all_value_vars]
+        suffixes = meta.index.get_level_values(-1)
+        value_dtypes = {
+            stub.rstrip(sep): meta[stub.rstrip(sep)].dtype for stub in stubnames
+        }
+
+        def suffix_rows(df, position):
+            result = wide_to_long_rows(
+                df[id_vars + [names[position] for names in value_vars]]
+            )
+            result = result[new_columns].astype(value_dtypes)
+            # The suffix is parsed like the ones of all of the columns.
+            result.index = result.index.set_levels(
+                suffixes[position : position + 1], level=-1
+            )
+            return result
+
+        frames = [
+            self._modin_frame._map_row_partitions(
+                lambda df, position=position: suffix_rows(df, position),
+                new_columns=new_columns,
+            )
+            for position in range(len(suffixes))
+        ]
+        return self.__constructor__(
+            frames[0]._concat(0, frames[1:], how="outer", sort=False)
+        )
+
+    # END Reshape
+
     # Indexing
     def view(self, index=None, columns=None):
         return self.__constructor__(
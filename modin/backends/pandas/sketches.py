@@ -0,0 +1,366 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Mergeable sketches used to compute approximate statistics in a single pass."""
+
+import datetime
+import numbers
+
+import numpy as np
+import pandas
+from pandas.core.dtypes.common import is_float_dtype, is_object_dtype, is_scalar
+
+DEFAULT_COMPRESSION = 200
+DEFAULT_PRECISION = 14
+
+
+class TDigest(object):
+    """A merging t-digest of the non-missing values of a column.
+
+    The digest keeps the values as weighted centroids that are small near the
+    tails and larger near the median, so that quantiles are most accurate where
+    they are most sensitive. Digests of disjoint sets of values can be merged,
+    which makes them suitable for the map and reduce phases of a MapReduce.
+
+    The count, minimum, maximum, mean and sum of squared deviations are tracked
+    exactly alongside the centroids.
+
+    Args:
+        means: The sorted means of the centroids.
+        weights: The number of values in every centroid.
+        compression: The accuracy of the digest. The number of centroids is about
+            half of this value, and the quantile error decreases linearly with it.
+        minimum: The minimum of the values.
+        maximum: The maximum of the values.
+        mean: The mean of the values.
+        m2: The sum of squared deviations of the values from their mean.
+    """
+
+    def __init__(
+        self,
+        means,
+        weights,
+        compression=DEFAULT_COMPRESSION,
+        minimum=np.nan,
+        maximum=np.nan,
+        mean=np.nan,
+        m2=np.nan,
+    ):
+        self.means = means
+        self.weights = weights
+        self.compression = compression
+        self.min = minimum
+        self.max = maximum
+        self.mean = mean
+        self.m2 = m2
+
+    @classmethod
+    def from_values(cls, values, compression=DEFAULT_COMPRESSION):
+        """Build a digest of the values, ignoring missing ones.
+
+        Args:
+            values: The values to summarize. Must be convertible to float.
+            compression: The accuracy of the digest.
+
+        Returns:
+            A new TDigest.
+        """
+        values = np.asarray(values, dtype=np.float64)
+        values = np.sort(values[~np.isnan(values)])
+        if len(values) == 0:
+            return cls(values, values, compression)
+        mean = values.mean()
+        return cls(
+            values,
+            np.ones(len(values)),
+            compression,
+            values[0],
+            values[-1],
+            mean,
+            ((values - mean) ** 2).sum(),
+        )._compress()
+
+    @classmethod
+    def merge(cls, digests, compression=None):
+        """Merge digests of disjoint sets of values into one.
+
+        Args:
+            digests: The digests to merge.
+            compression: (optional) The accuracy of the merged digest. Defaults to
+                the accuracy of the first digest.
+
+        Returns:
+            A new TDigest.
+        """
+        digests = [digest for digest in digests if digest.count > 0]
+        if compression is None:
+            compression = (
+                digests[0].compression if len(digests) else DEFAULT_COMPRESSION
+            )
+        if len(digests) == 0:
+            return cls(np.array([]), np.array([]), compression)
+        means = np.concatenate([digest.means for digest in digests])
+        weights = np.concatenate([digest.weights for digest in digests])
+        order = np.argsort(means, kind="stable")
+        counts = np.array([digest.count for digest in digests])
+        block_means = np.array([digest.mean for digest in digests])
+        count = counts.sum()
+        mean = (counts * block_means).sum() / count
+        # Chan et al. update of the sum of squared deviations.
+        m2 = (
+            sum(digest.m2 for digest in digests)
+            + (counts * (block_means - mean) ** 2).sum()
+        )
+        return cls(
+            means[order],
+            weights[order],
+            compression,
+            min(digest.min for digest in digests),
+            max(digest.max for digest in digests),
+            mean,
+            m2,
+        )._compress()
+
+    @property
+    def count(self):
+        """The number of values summarized by the digest."""
+        return self.weights.sum() if len(self.weights) else 0
+
+    def _compress(self):
+        """Merge neighbouring centroids that fall in the same unit of the scale.
+
+        Returns:
+            This TDigest.
+        """
+        if len(self.means) <= 1:
+            return self
+        total = self.weights.sum()
+        centers = (np.cumsum(self.weights) - self.weights / 2) / total
+        scale = self.compression / (2 * np.pi) * np.arcsin(2 * centers - 1)
+        bins = np.floor(scale - scale[0]).astype(np.int64)
+        starts = np.flatnonzero(np.r_[True, bins[1:] != bins[:-1]])
+        weights = np.add.reduceat(self.weights, starts)
+        self.means = np.add.reduceat(self.means * self.weights, starts) / weights
+        self.weights = weights
+        return self
+
+    def quantile(self, q):
+        """Estimate quantiles with linear interpolation between the values.
+
+        Args:
+            q: A float or array of floats between 0 and 1.
+
+        Returns:
+            The estimated quantiles, NaN if the digest is empty.
+        """
+        if self.count == 0:
+            return np.full(np.shape(q), np.nan)
+        total = self.count
+        # Rank of every centroid center, with the values at ranks 0.5 .. total - 0.5.
+        centers = np.cumsum(self.weights) - self.weights / 2
+        return np.interp(
+            np.asarray(q, dtype=np.float64) * (total - 1) + 0.5,
+            np.r_[0.5, centers, total - 0.5],
+            np.r_[self.min, self.means, self.max],
+        )
+
+    def var(self, ddof=1):
+        """The exact variance of the values."""
+        return self.m2 / (self.count - ddof) if self.count > ddof else np.nan
+
+
+def _object_value_key(value):
+    """Build a string that equal numbers, strings, timestamps or missing values share.
+
+    Numbers are keyed by their value, so that `1`, `1.0`, `True` and `Decimal(1)`
+    share a key as they do in pandas' hash tables, while `1` and `"1"` do not. All
+    of the missing values share a key.
+
+    Returns:
+        The key, or None for any other object.
+    """
+    if is_scalar(value) and pandas.isna(value):
+        return "nan"
+    if isinstance(value, str):
+        return "s" + value
+    if isinstance(value, (datetime.datetime, np.datetime64)):
+        return "t" + str(pandas.Timestamp(value).value)
+    if isinstance(value, (datetime.timedelta, np.timedelta64)):
+        return "d" + str(pandas.Timedelta(value).value)
+    if isinstance(value, (numbers.Number, np.number, np.bool_)):
+        try:
+            as_complex = complex(value)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        if as_complex.imag == 0:
+            # Adding 0.0 turns -0.0 into 0.0.
+            return "n" + repr(as_complex.real + 0.0)
+        return "c" + repr(as_complex)
+    return None
+
+
+def _object_hash_key(value):
+    """Build a string to hash a Python object with.
+
+    Equal numbers, strings, timestamps and missing values share a key, see
+    `_object_value_key`. Other objects are keyed by their type and `str`.
+    """
+    key = _object_value_key(value)
+    if key is None:
+        return "{}:{}".format(type(value).__name__, value)
+    return key
+
+
+def hash_values(values, dropna=True):
+    """Hash the values of a column to unsigned 64-bit integers.
+
+    Equal values get equal hashes. Distinct values get distinct hashes unless two
+    64-bit hashes collide, which for `n` distinct values happens with a probability
+    of about `n ** 2 / 2 ** 65`: 3 * 10 ** -8 for a million values and 3% for a
+    billion.
+
+    Args:
+        values: The values to hash.
+        dropna: Whether or not to drop missing values before hashing.
+
+    Returns:
+        A NumPy array of uint64, one hash per (non-missing) value.
+    """
+    values = pandas.Series(values)
+    if dropna:
+        values = values.dropna()
+    if is_object_dtype(values.dtype):
+        # pandas hashes the `str` of mixed objects, which would make `1` and `"1"`
+        # equal and `1` and `1.0` distinct, so the objects are keyed first.
+        return pandas.util.hash_array(
+            np.array([_object_hash_key(value) for value in values], dtype=object)
+        )
+    if is_float_dtype(values.dtype):
+        # Normalize -0.0 so that it hashes like 0.0.
+        values = values + 0.0
+    return pandas.util.hash_pandas_object(values, index=False).values
+
+
+def bucket_hashes(values):
+    """Hash the values of a column to route them to buckets.
+
+    Values that pandas takes for equal always get equal hashes, so a bucket holds
+    every copy of its values and the values can be compared by pandas bucket by
+    bucket. Distinct values may share a hash: all of the missing values do, and
+    so do all of the objects other than numbers, strings and timestamps.
+
+    Args:
+        values: The values to hash.
+
+    Returns:
+        A NumPy array of uint64, one hash per value.
+    """
+    values = pandas.Series(values)
+    if is_object_dtype(values.dtype):
+        return pandas.util.hash_array(
+            np.array(
+                [_object_value_key(value) or "o" for value in values], dtype=object
+            )
+        )
+    hashes = hash_values(values, dropna=False)
+    hashes[values.isna().values] = 0
+    return hashes
+
+
+class HyperLogLog(object):
+    """A HyperLogLog sketch estimating the number of distinct values of a column.
+
+    Every value is hashed to 64 bits, the first `precision` bits select one of the
+    registers and the register keeps the longest run of leading zeros seen in the
+    remaining bits. Sketches of any sets of values can be merged by taking the
+    maximum of the registers, which makes them suitable for the map and reduce
+    phases of a MapReduce.
+
+    Args:
+        registers: A NumPy array of uint8 of length `2 ** precision`.
+    """
+
+    def __init__(self, registers):
+        self.registers = registers
+
+    @property
+    def precision(self):
+        """The number of hash bits used to select a register."""
+        return int(np.log2(len(self.registers)))
+
+    @classmethod
+    def from_hashes(cls, hashes, precision=DEFAULT_PRECISION):
+        """Build a sketch of 64-bit hashes.
+
+        Args:
+            hashes: A NumPy array of uint64.
+            precision: The number of hash bits used to select a register. The
+                relative error of the estimate is about `1.04 / sqrt(2 ** precision)`.
+
+        Returns:
+            A new HyperLogLog.
+        """
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        index = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+        rest = hashes << np.uint64(precision)
+        # Count the leading zeros of the remaining bits with a binary search.
+        zeros = np.zeros(len(hashes), dtype=np.uint8)
+        for shift in (32, 16, 8, 4, 2, 1):
+            mask = rest < (np.uint64(1) << np.uint64(64 - shift))
+            zeros[mask] += shift
+            rest[mask] = rest[mask] << np.uint64(shift)
+        ranks = np.minimum(zeros + 1, 64 - precision + 1).astype(np.uint8)
+        registers = np.zeros(2 ** precision, dtype=np.uint8)
+        np.maximum.at(registers, index, ranks)
+        return cls(registers)
+
+    @classmethod
+    def from_values(cls, values, precision=DEFAULT_PRECISION, dropna=True):
+        """Build a sketch of the values of a column.
+
+        Args:
+            values: The values to summarize.
+            precision: The number of hash bits used to select a register.
+            dropna: Whether or not to ignore missing values.
+
+        Returns:
+            A new HyperLogLog.
+        """
+        return cls.from_hashes(hash_values(values, dropna), precision)
+
+    @classmethod
+    def merge(cls, sketches):
+        """Merge sketches of the same precision into one.
+
+        Args:
+            sketches: The sketches to merge.
+
+        Returns:
+            A new HyperLogLog.
+        """
+        return cls(np.maximum.reduce([sketch.registers for sketch in sketches]))
+
+    def count(self):
+        """Estimate the number of distinct values.
+
+        Returns:
+            The estimated number of distinct values.
+        """
+        m = len(self.registers)
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / np.sum(2.0 ** -self.registers.astype(np.float64))
+        zeros = np.count_nonzero(self.registers == 0)
+        if estimate <= 2.5 * m and zeros > 0:
+            # Linear counting is more accurate for small cardinalities.
+            estimate = m * np.log(m / zeros)
+        return int(round(estimate))
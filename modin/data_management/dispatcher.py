@@ -102,6 +102,18 @@ class EngineDispatcher(object):
     def from_non_pandas(cls, *args, **kwargs):
         return cls.__engine._from_non_pandas(*args, **kwargs)
 
+    @classmethod
+    def from_arrow(cls, table):
+        return cls.__engine._from_arrow(table)
+
+    @classmethod
+    def to_arrow(cls, qc):
+        return cls.__engine._to_arrow(qc)
+
+    @classmethod
+    def to_arrow_ipc(cls, qc, path):
+        return cls.__engine._to_arrow_ipc(qc, path)
+
     @classmethod
     def read_parquet(cls, **kwargs):
         return cls.__engine._read_parquet(**kwargs)
@@ -178,6 +190,26 @@ class EngineDispatcher(object):
     def to_pickle(cls, *args, **kwargs):
         return cls.__engine._to_pickle(*args, **kwargs)
 
+    @classmethod
+    def to_json(cls, *args, **kwargs):
+        return cls.__engine._to_json(*args, **kwargs)
+
+    @classmethod
+    def to_pickle_distributed(cls, *args, **kwargs):
+        return cls.__engine._to_pickle_distributed(*args, **kwargs)
+
+    @classmethod
+    def read_pickle_distributed(cls, **kwargs):
+        return cls.__engine._read_pickle_distributed(**kwargs)
+
+    @classmethod
+    def get_partitioned_state(cls, qc):
+        return cls.__engine._get_partitioned_state(qc)
+
+    @classmethod
+    def from_partitioned_state(cls, state):
+        return cls.__engine._from_partitioned_state(state)
+
 
 execution_engine.subscribe(EngineDispatcher._update_engine)
 partition_format.subscribe(EngineDispatcher._update_engine)
@@ -43,6 +43,18 @@ class BaseFactory(object):
     def _from_non_pandas(cls, *args, **kwargs):
         return cls.io_cls.from_non_pandas(*args, **kwargs)
 
+    @classmethod
+    def _from_arrow(cls, table):
+        return cls.io_cls.from_arrow(table)
+
+    @classmethod
+    def _to_arrow(cls, qc):
+        return cls.io_cls.to_arrow(qc)
+
+    @classmethod
+    def _to_arrow_ipc(cls, qc, path):
+        return cls.io_cls.to_arrow_ipc(qc, path)
+
     @classmethod
     def _read_parquet(cls, **kwargs):
         return cls.io_cls.read_parquet(**kwargs)
@@ -119,6 +131,26 @@ class BaseFactory(object):
     def _to_pickle(cls, *args, **kwargs):
         return cls.io_cls.to_pickle(*args, **kwargs)
 
+    @classmethod
+    def _to_json(cls, *args, **kwargs):
+        return cls.io_cls.to_json(*args, **kwargs)
+
+    @classmethod
+    def _to_pickle_distributed(cls, *args, **kwargs):
+        return cls.io_cls.to_pickle_distributed(*args, **kwargs)
+
+    @classmethod
+    def _read_pickle_distributed(cls, **kwargs):
+        return cls.io_cls.read_pickle_distributed(**kwargs)
+
+    @classmethod
+    def _get_partitioned_state(cls, qc):
+        return cls.io_cls.get_partitioned_state(qc)
+
+    @classmethod
+    def _from_partitioned_state(cls, state):
+        return cls.io_cls.from_partitioned_state(state)
+
 
 class PandasOnRayFactory(BaseFactory):
     @classmethod
@@ -183,6 +215,18 @@ class ExperimentalBaseFactory(BaseFactory):
                 del kwargs["max_sessions"]
         return cls.io_cls.read_sql(**kwargs)
 
+    @classmethod
+    def _to_sql(cls, *args, **kwargs):
+        if execution_engine.get() != "Ray":
+            for arg, default in (("max_sessions", None), ("staging", False)):
+                if arg in kwargs:
+                    if kwargs[arg] != default:
+                        warnings.warn(
+                            "Distributed to_sql() was only implemented for Ray engine."
+                        )
+                    del kwargs[arg]
+        return cls.io_cls.to_sql(*args, **kwargs)
+
 
 class ExperimentalPandasOnRayFactory(ExperimentalBaseFactory, PandasOnRayFactory):
     @classmethod
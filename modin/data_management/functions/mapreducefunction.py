@@ -18,7 +18,7 @@ class MapReduceFunction(Function):
     @classmethod
     def call(cls, map_function, reduce_function, **call_kwds):
         def caller(query_compiler, *args, **kwargs):
-            preserve_index = call_kwds.pop("preserve_index", True)
+            preserve_index = call_kwds.get("preserve_index", True)
             return query_compiler.__constructor__(
                 query_compiler._modin_frame._map_reduce(
                     call_kwds.get("axis")
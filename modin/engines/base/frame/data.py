@@ -19,6 +19,7 @@ from pandas.core.dtypes.common import is_numeric_dtype
 from typing import Union
 
 from modin.backends.pandas.query_compiler import PandasQueryCompiler
+from modin.data_management.utils import compute_chunksize
 from modin.error_message import ErrorMessage
 from modin.backends.pandas.parsers import find_common_type_cat as find_common_type
 
@@ -78,6 +79,7 @@ class BasePandasFrame(object):
             )
         self._column_widths_cache = column_widths
         self._dtypes = dtypes
+        self._repr_cache = {}
         self._filter_empties()
         if validate_axes is not False:
             self._validate_internal_indices(mode=validate_axes)
@@ -194,6 +196,7 @@ class BasePandasFrame(object):
         else:
             new_index = self._validate_set_axis(new_index, self._index_cache)
             self._index_cache = new_index
+        self._repr_cache = {}
         self._apply_index_objs(axis=0)
 
     def _set_columns(self, new_columns):
@@ -209,6 +212,7 @@ class BasePandasFrame(object):
             self._columns_cache = new_columns
             if self._dtypes is not None:
                 self._dtypes.index = new_columns
+        self._repr_cache = {}
         self._apply_index_objs(axis=1)
 
     def _set_axis(self, axis, new_axis, cache_only=False):
@@ -224,6 +228,7 @@ class BasePandasFrame(object):
                 Whether to change only external indices, or propagate it
                 into partitions
         """
+        self._repr_cache = {}
         if axis:
             if not cache_only:
                 self._set_columns(new_axis)
@@ -335,9 +340,9 @@ class BasePandasFrame(object):
         args = args_dict.get(mode, args_dict["custom"])
 
         if args.get("validate_index", True):
-            self._validate_axis_equality(axis=0)
+            self._validate_axis_equality(axis=0, force=args.get("force", False))
         if args.get("validate_columns", True):
-            self._validate_axis_equality(axis=1)
+            self._validate_axis_equality(axis=1, force=args.get("force", False))
 
     def _apply_index_objs(self, axis=None):
         """Lazily applies the index object (Index or Columns) to the partitions.
@@ -1128,6 +1133,229 @@ class BasePandasFrame(object):
             self._column_widths,
         )
 
+    def _overlap_fold(self, func, before, after=0):
+        """Perform a function over the rows with every row block overlapping its neighbours.
+
+        Note: The data shape is not changed (length and width of the table).
+
+        Args:
+            func: The function to apply. The result of `func` at any row must only
+                depend on the `before` preceding and `after` following rows.
+            before: The number of preceding rows each row block needs, either an int
+                or a list with one value per row block.
+            after: The number of following rows each row block needs, either an int
+                or a list with one value per row block.
+
+        Returns:
+             A new dataframe.
+        """
+        self._filter_empties()
+        if isinstance(before, int):
+            before = [before] * len(self._row_lengths)
+        if isinstance(after, int):
+            after = [after] * len(self._row_lengths)
+        new_partitions = self._frame_mgr_cls.map_overlapping_partitions(
+            self._partitions, self._row_lengths, func, before, after
+        )
+        return self.__constructor__(
+            new_partitions,
+            self.index,
+            self.columns,
+            self._row_lengths,
+            self._column_widths,
+        )
+
+    def _scan(self, func, skipna=True):
+        """Perform a prefix scan over the rows, one row block at a time.
+
+        Note: The data shape is not changed (length and width of the table).
+
+        Args:
+            func: The scan to apply, e.g. `pandas.DataFrame.cumsum` or a forward fill.
+                The value of the scan at any row must only depend on its value at the
+                previous row and on the row itself.
+            skipna: Whether or not missing values in the result of `func` are skipped
+                by the scan (e.g. `cumsum(skipna=True)`).
+
+        Returns:
+             A new dataframe.
+        """
+        new_partitions = self._frame_mgr_cls.scan(
+            self._partitions, self._column_widths, func, skipna
+        )
+        return self.__constructor__(
+            new_partitions,
+            self.index,
+            self.columns,
+            self._row_lengths,
+            self._column_widths,
+        )
+
+    def _rebalance_rows(self, max_skew=2):
+        """Move rows between the row partitions if they are badly skewed.
+
+        Args:
+            max_skew: The number of times the size of an even row partition that a
+                row partition may reach before the rows are rebalanced.
+
+        Returns:
+             This dataframe if it is balanced enough, otherwise a new dataframe with
+             evenly sized row partitions.
+        """
+        self._filter_empties()
+        num_splits = self._frame_mgr_cls._compute_num_partitions()
+        chunksize = compute_chunksize(
+            pandas.DataFrame(index=self.index), num_splits, axis=0
+        )
+        if len(self.index) == 0 or max(self._row_lengths) <= max_skew * chunksize:
+            return self
+        num_row_splits = -(-len(self.index) // chunksize)
+        size, extra = divmod(len(self.index), num_row_splits)
+        new_lengths = [size + 1] * extra + [size] * (num_row_splits - extra)
+        new_partitions = self._frame_mgr_cls.rebalance_rows(
+            self._partitions, self._row_lengths, new_lengths
+        )
+        return self.__constructor__(
+            new_partitions,
+            self.index,
+            self.columns,
+            new_lengths,
+            self._column_widths,
+            self._dtypes,
+        )
+
+    def _map_row_partitions(
+        self,
+        func,
+        new_columns=None,
+        dtypes=None,
+        preserve_index=False,
+        enumerate_partitions=False,
+    ):
+        """Apply a function to all of the columns of every row partition.
+
+        Args:
+            func: The function to apply to pandas DataFrames.
+            new_columns: (optional) The columns of the result. Computed if not
+                provided.
+            dtypes: (optional) A pandas Series with the data types of the result.
+            preserve_index: Whether or not `func` keeps the index of every row
+                partition, in which case the index is not recomputed.
+            enumerate_partitions: Whether or not to pass the position of the row
+                partition to `func` as the `partition_idx` keyword argument.
+
+        Returns:
+             A new dataframe.
+        """
+        new_partitions = self._frame_mgr_cls.map_axis_partitions(
+            1,
+            self._partitions,
+            func,
+            keep_partitioning=True,
+            enumerate_partitions=enumerate_partitions,
+        )
+        if preserve_index:
+            new_index = self.index
+            new_row_lengths = self._row_lengths
+        else:
+            new_index = self._frame_mgr_cls.get_indices(
+                0, new_partitions, lambda df: df.index
+            )
+            new_row_lengths = None
+        columns_known = new_columns is not None
+        if not columns_known:
+            new_columns = self._frame_mgr_cls.get_indices(
+                1, new_partitions, lambda df: df.columns
+            )
+        result = self.__constructor__(
+            new_partitions, new_index, new_columns, new_row_lengths, None, dtypes
+        )
+        if columns_known:
+            result._apply_index_objs(axis=1)
+        return result
+
+    def _tree_reduce(self, map_func, reduce_func, split_every):
+        """Reduce the row partitions to a single partition in a tree of tasks.
+
+        Args:
+            map_func: The function to apply to all of the columns of every row
+                partition.
+            reduce_func: The function that reduces the concatenated results of
+                `map_func` or of itself.
+            split_every: The number of results to reduce in every task.
+
+        Returns:
+             A new dataframe with a single partition.
+        """
+        new_partitions = self._frame_mgr_cls.tree_reduce(
+            self._partitions,
+            self._build_mapreduce_func(0, map_func),
+            self._build_mapreduce_func(0, reduce_func),
+            split_every,
+        )
+        new_index = self._frame_mgr_cls.get_indices(
+            0, new_partitions, lambda df: df.index
+        )
+        new_columns = self._frame_mgr_cls.get_indices(
+            1, new_partitions, lambda df: df.columns
+        )
+        return self.__constructor__(new_partitions, new_index, new_columns)
+
+    def _hash_reduce(self, map_func, reduce_func, combine_func, num_buckets=None):
+        """Reduce the columns by shuffling hashed keys into buckets.
+
+        Args:
+            map_func: Function that takes a row block and returns a DataFrame
+                indexed by non-negative integer keys.
+            reduce_func: Function that takes the rows of all blocks sharing a bucket
+                and returns a DataFrame with one row and one column per column of
+                this dataframe.
+            combine_func: Function that combines the results of `reduce_func` of
+                every bucket into one row.
+            num_buckets: (optional) The number of buckets. Defaults to the number of
+                row partitions.
+
+        Returns:
+             A new dataframe with a single row.
+        """
+        if num_buckets is None:
+            num_buckets = len(self._row_lengths)
+        new_partitions = self._frame_mgr_cls.hash_reduce(
+            self._partitions, map_func, reduce_func, combine_func, num_buckets
+        )
+        result = self.__constructor__(
+            new_partitions, ["__reduced__"], self.columns, [1], [len(self.columns)]
+        )
+        result._apply_index_objs()
+        return result
+
+    def _matmul(self, other, dtype):
+        """Matrix multiply with another dataframe without materializing either.
+
+        Note: The columns of this dataframe must line up with the index of `other`.
+
+        Args:
+            other: The dataframe to multiply with.
+            dtype: The dtype to compute the product in.
+
+        Returns:
+             A new dataframe with the index of this dataframe and the columns of
+             `other`.
+        """
+        new_partitions = self._frame_mgr_cls.block_matmul(
+            self._partitions, other._partitions, self._column_widths, dtype
+        )
+        result = self.__constructor__(
+            new_partitions,
+            self.index,
+            other.columns,
+            self._row_lengths,
+            other._column_widths,
+            pandas.Series([dtype] * len(other.columns), index=other.columns),
+        )
+        result._apply_index_objs()
+        return result
+
     def filter_full_axis(self, axis, func):
         """Filter data based on the function provided along an entire axis.
 
@@ -1699,6 +1927,177 @@ class BasePandasFrame(object):
             )
         return self.__constructor__(new_partitions, new_index, new_columns)
 
+    def hash_shuffle_apply(
+        self, hash_func, func, new_columns, dtypes=None, num_buckets=None
+    ):
+        """Shuffle rows by a hash of their values and apply a function per bucket.
+
+        Args:
+            hash_func: Function that takes a pandas DataFrame and returns an array of
+                non-negative integer hashes, one per row. Rows with equal values must
+                get equal hashes.
+            func: The function to apply to every bucket. It receives the rows of the
+                bucket in their original order, indexed by their global position, and
+                must return a DataFrame with the same index and `new_columns`.
+            new_columns: The columns of the result.
+            dtypes: (optional) The data types of the result.
+            num_buckets: (optional) The number of buckets to shuffle the rows into.
+                Defaults to the number of row partitions.
+
+        Returns:
+             A new dataframe with the same index and row partitioning as this one.
+        """
+        if len(self.index) == 0:
+            empty = func(self.to_pandas().reset_index(drop=True))
+            return self.from_pandas(empty.set_axis(self.index, axis=0, inplace=False))
+        self._filter_empties()
+        if num_buckets is None:
+            num_buckets = len(self._partitions)
+        new_partitions = self._frame_mgr_cls.hash_shuffle(
+            self._partitions, self._row_lengths, hash_func, func, num_buckets
+        )
+        result = self.__constructor__(
+            new_partitions,
+            self.index,
+            new_columns,
+            self._row_lengths,
+            [len(new_columns)],
+            dtypes,
+        )
+        result._apply_index_objs(axis=0)
+        return result
+
+    def scatter_rows(
+        self, buckets, targets, func, new_index, new_columns, row_lengths, dtypes=None
+    ):
+        """Send every row to a row partition of the result and build the partitions.
+
+        Args:
+            buckets: Array with the row partition of the result every row goes to.
+            targets: Array with the integer label every row gets in that partition.
+            func: The function that builds a row partition of the result from its
+                rows, given in their original order and indexed by their targets.
+            new_index: The index of the result.
+            new_columns: The columns of the result.
+            row_lengths: The number of rows in each row partition of the result,
+                every row partition must get at least one row of this dataframe.
+            dtypes: (optional) The data types of the result.
+
+        Returns:
+             A new dataframe.
+        """
+        self._filter_empties()
+        splits = np.cumsum(self._row_lengths[:-1])
+        new_partitions = self._frame_mgr_cls.scatter_rows(
+            self._partitions,
+            np.split(np.asarray(buckets), splits),
+            np.split(np.asarray(targets), splits),
+            func,
+            min(
+                self._frame_mgr_cls._compute_num_partitions(), max(len(new_columns), 1)
+            ),
+        )
+        result = self.__constructor__(
+            new_partitions, new_index, new_columns, row_lengths, None, dtypes
+        )
+        result._apply_index_objs()
+        return result
+
+    def apply_with_row_blocks(
+        self,
+        other,
+        selections,
+        func,
+        new_columns,
+        summary_funcs=None,
+        kwargs=None,
+        row_lengths=None,
+        dtypes=None,
+    ):
+        """Apply a function to every row block and selected row blocks of another.
+
+        Args:
+            other: The dataframe to select the row blocks from.
+            selections: For every row block of this dataframe, the list of
+                `(index, summary)` pairs of the row blocks of `other` it is applied
+                with. `summary` is None to take the whole block, or a key of
+                `summary_funcs`.
+            func: The function that takes a row block of this dataframe and the
+                concatenated rows selected from `other`, and returns a DataFrame
+                with `new_columns`.
+            new_columns: The columns of the result.
+            summary_funcs: (optional) Functions that reduce a row block of `other`
+                to the rows other blocks need from it.
+            kwargs: (optional) The keyword arguments of `func` for every row block.
+            row_lengths: (optional) The number of rows `func` returns for every row
+                block. Computed if not provided.
+            dtypes: (optional) The data types of the result.
+
+        Returns:
+             A new dataframe with a row partition per row block of this dataframe
+             and a default index.
+        """
+        self._filter_empties()
+        other._filter_empties()
+        if kwargs is None:
+            kwargs = [{}] * len(self._partitions)
+        new_partitions = self._frame_mgr_cls.apply_with_row_partitions(
+            self._partitions,
+            other._partitions,
+            selections,
+            func,
+            summary_funcs or {},
+            min(
+                self._frame_mgr_cls._compute_num_partitions(), max(len(new_columns), 1)
+            ),
+            kwargs,
+        )
+        if row_lengths is None:
+            row_lengths = [part.length() for part in new_partitions.T[0]]
+        result = self.__constructor__(
+            new_partitions,
+            pandas.RangeIndex(sum(row_lengths)),
+            new_columns,
+            row_lengths,
+            None,
+            dtypes,
+        )
+        result._apply_index_objs()
+        return result
+
+    def filter_rows(self, mask):
+        """Filter rows by a boolean mask without materializing it.
+
+        Args:
+            mask: A single column dataframe of booleans with the same index and row
+                partitioning as this one. Rows where the mask is True are kept.
+
+        Returns:
+             A new dataframe.
+        """
+        if len(self.index) == 0:
+            return self.copy()
+        new_partitions = self._frame_mgr_cls.broadcast_apply(
+            0,
+            lambda df, r: df[r.squeeze(axis=1).values],
+            self._partitions,
+            mask._partitions,
+        )
+        new_index = self._frame_mgr_cls.get_indices(
+            0, new_partitions, lambda df: df.index
+        )
+        if len(new_index) == 0:
+            # Keep the type of the index when every row is filtered out.
+            new_index = self.index[:0]
+        return self.__constructor__(
+            new_partitions,
+            new_index,
+            self.columns,
+            None,
+            self._column_widths,
+            self._dtypes,
+        )
+
     @classmethod
     def from_pandas(cls, df):
         """Improve simple Pandas DataFrame to an advanced and superior Modin DataFrame.
@@ -1728,10 +2127,31 @@ class BasePandasFrame(object):
         Returns:
             Pandas DataFrame.
         """
+        if self._dtypes is not None and len(self.index) and len(self.columns):
+            df = self._frame_mgr_cls.to_pandas_preallocated(
+                self._partitions,
+                self.index,
+                self.columns,
+                self._row_lengths,
+                self._column_widths,
+                self._dtypes,
+            )
+            if df is not None:
+                return df
         df = self._frame_mgr_cls.to_pandas(self._partitions)
         if df.empty:
             if len(self.columns) != 0:
                 df = pandas.DataFrame(columns=self.columns)
+                if self._dtypes is not None:
+                    # The columns of an empty frame keep their data types.
+                    df = pandas.DataFrame(
+                        {
+                            i: pandas.Series(dtype=dtype)
+                            for i, dtype in enumerate(self._dtypes)
+                        },
+                        index=df.index,
+                    )
+                    df.columns = self.columns
             else:
                 df = pandas.DataFrame(columns=self.columns, index=self.index)
         else:
@@ -1743,12 +2163,88 @@ class BasePandasFrame(object):
             df.columns = self.columns
         return df
 
+    def build_repr_df(self, num_rows, num_cols=None):
+        """Build the pandas DataFrame that is used to render this dataframe.
+
+        Only the row and column blocks holding the first and last `num_rows // 2 + 1`
+        rows (and columns) are fetched, the rest of the slicing is done locally. The
+        result is cached until the labels of this dataframe change.
+
+        Parameters
+        ----------
+            num_rows : int,
+                The number of rows to display.
+            num_cols : int (optional),
+                The number of columns to display. If None, all columns are kept.
+
+        Returns
+        -------
+            Pandas DataFrame.
+        """
+        key = (num_rows, num_cols)
+        if key in self._repr_cache:
+            return self._repr_cache[key]
+
+        def head_tail(lengths, num):
+            total = sum(lengths)
+            if num is None or total <= num:
+                positions = np.arange(total)
+            else:
+                # Add one here so that pandas automatically adds the dots
+                # It turns out to be faster to extract 2 extra rows and columns than
+                # to build the dots ourselves.
+                num_for_head = num // 2 + 1
+                positions = np.concatenate(
+                    [np.arange(num_for_head), np.arange(total - num_for_head, total)]
+                )
+            bounds = np.cumsum([0] + list(lengths))
+            block_idx = np.digitize(positions, bounds[1:])
+            blocks = np.unique(block_idx)
+            local_bounds = np.cumsum([0] + [lengths[i] for i in blocks])
+            block_starts = np.zeros(len(lengths), dtype=np.int64)
+            block_starts[blocks] = bounds[blocks] - local_bounds[:-1]
+            return positions, blocks, positions - block_starts[block_idx]
+
+        if len(self.index) == 0 or len(self.columns) == 0:
+            result = pandas.DataFrame(index=self.index, columns=self.columns)
+        else:
+            row_positions, row_blocks, local_rows = head_tail(
+                self._row_lengths, num_rows
+            )
+            col_positions, col_blocks, local_cols = head_tail(
+                self._column_widths, num_cols
+            )
+            df = self._frame_mgr_cls.to_pandas(
+                self._partitions[np.ix_(row_blocks, col_blocks)]
+            )
+            result = df.iloc[local_rows, local_cols]
+            # The labels are kept as they are when nothing is cut, as pandas renders
+            # a RangeIndex differently from the Int64Index of its positions.
+            result.index = (
+                self.index
+                if len(row_positions) == len(self.index)
+                else self.index[row_positions]
+            )
+            result.columns = (
+                self.columns
+                if len(col_positions) == len(self.columns)
+                else self.columns[col_positions]
+            )
+        self._repr_cache[key] = result
+        return result
+
     def to_numpy(self):
         """Converts Modin DataFrame to a 2D NumPy array.
 
         Returns:
             NumPy array.
         """
+        if self._dtypes is not None and len(self.index) and len(self.columns):
+            arr = self._frame_mgr_cls.to_numpy_preallocated(
+                self._partitions, self._row_lengths, self._column_widths, self._dtypes
+            )
+            if arr is not None:
+                return arr
         return self._frame_mgr_cls.to_numpy(self._partitions)
 
     def transpose(self):
@@ -17,6 +17,8 @@ import pandas
 from modin.error_message import ErrorMessage
 from modin.data_management.utils import compute_chunksize
 from pandas.api.types import union_categoricals
+from pandas.core.dtypes.cast import find_common_type
+from pandas.core.internals import BlockManager, make_block
 
 
 class BaseFrameManager(object):
@@ -76,6 +78,15 @@ class BaseFrameManager(object):
 
     @classmethod
     def groupby_reduce(cls, axis, partitions, by, map_func, reduce_func):
+        if by.shape[axis ^ 1] > 1:
+            # The keys span several blocks, so they are combined into one block per
+            # partition of the grouped axis.
+            by_axis_parts = (
+                cls.row_partitions(by) if axis == 0 else cls.column_partitions(by)
+            )
+            by = np.array(
+                [part.apply(lambda df: df, num_splits=1)[0] for part in by_axis_parts]
+            )
         by_parts = np.squeeze(by)
         if len(by_parts.shape) == 0:
             by_parts = np.array([by_parts.item()])
@@ -232,7 +243,14 @@ class BaseFrameManager(object):
         )
 
     @classmethod
-    def map_axis_partitions(cls, axis, partitions, map_func, keep_partitioning=False):
+    def map_axis_partitions(
+        cls,
+        axis,
+        partitions,
+        map_func,
+        keep_partitioning=False,
+        enumerate_partitions=False,
+    ):
         """
         Applies `map_func` to every partition.
 
@@ -246,6 +264,9 @@ class BaseFrameManager(object):
                 The function to apply.
             keep_partitioning : boolean. Default is False
                 The flag to keep partitions for Modin Frame.
+            enumerate_partitions : boolean. Default is False
+                Whether or not to pass the position of the axis partition to
+                `map_func` as the `partition_idx` keyword argument.
 
         Returns
         -------
@@ -276,8 +297,12 @@ class BaseFrameManager(object):
         # load-balance the data as well.
         result_blocks = np.array(
             [
-                part.apply(preprocessed_map_func, num_splits=num_splits)
-                for part in partitions
+                part.apply(
+                    preprocessed_map_func, num_splits=num_splits, partition_idx=i
+                )
+                if enumerate_partitions
+                else part.apply(preprocessed_map_func, num_splits=num_splits)
+                for i, part in enumerate(partitions)
             ]
         )
         # If we are mapping over columns, they are returned to use the same as
@@ -285,6 +310,665 @@ class BaseFrameManager(object):
         # the structure to the correct order.
         return result_blocks.T if not axis else result_blocks
 
+    @classmethod
+    def tree_reduce(cls, partitions, map_func, reduce_func, split_every):
+        """
+        Reduce the row partitions pairwise, or more, up to a single partition.
+
+        Parameters
+        ----------
+            partitions : NumPy array
+                The partitions of Modin Frame.
+            map_func : callable
+                The function to apply to every row partition. It receives all of the
+                columns of the row partition.
+            reduce_func : callable
+                The function that reduces the concatenation of up to `split_every`
+                results of `map_func` or of itself.
+            split_every : int
+                The number of results to reduce in every task.
+
+        Returns
+        -------
+        NumPy array
+            An array with a single partition holding the result of the reduction.
+        """
+        map_func = cls.preprocess_func(map_func)
+        reduce_func = cls.preprocess_func(reduce_func)
+        results = [
+            part.apply(map_func, num_splits=1)[0]
+            for part in cls.row_partitions(partitions)
+        ]
+        # The reduction is always applied at least once.
+        while True:
+            results = [
+                cls._column_partitions_class(results[i : i + split_every]).apply(
+                    reduce_func, num_splits=1
+                )[0]
+                for i in range(0, len(results), split_every)
+            ]
+            if len(results) == 1:
+                return np.array([results])
+
+    @classmethod
+    def map_overlapping_partitions(cls, partitions, lengths, map_func, before, after):
+        """
+        Applies `map_func` to every partition extended with rows of its neighbours.
+
+        Parameters
+        ----------
+            partitions : NumPy array
+                The partitions of Modin Frame.
+            lengths : list
+                The number of rows in each row partition.
+            map_func : callable
+                The function to apply. It must not change the number of rows.
+            before : list
+                The number of trailing rows of the preceding partitions to prepend to
+                each row partition.
+            after : list
+                The number of leading rows of the following partitions to append to
+                each row partition.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions with the same partitioning as `partitions`.
+
+        Notes
+        -----
+        The borrowed rows (the halo) only provide context for `map_func` and are
+        dropped from its result, so each partition is computed independently of the
+        others and only the halo rows are moved between them.
+        """
+
+        def halo_func(df, halo, length):
+            return map_func(df).iloc[halo : halo + length]
+
+        halo_func = cls.preprocess_func(halo_func)
+
+        def halo_blocks(row_idx, col_idx):
+            blocks = [partitions[row_idx][col_idx]]
+            need, i = before[row_idx], row_idx - 1
+            while need > 0 and i >= 0:
+                take = min(need, lengths[i])
+                blocks.insert(
+                    0,
+                    partitions[i][col_idx].mask(
+                        slice(lengths[i] - take, lengths[i]), slice(None)
+                    ),
+                )
+                need, i = need - take, i - 1
+            halo = before[row_idx] - need
+            need, i = after[row_idx], row_idx + 1
+            while need > 0 and i < len(lengths):
+                take = min(need, lengths[i])
+                blocks.append(partitions[i][col_idx].mask(slice(0, take), slice(None)))
+                need, i = need - take, i + 1
+            return blocks, halo
+
+        new_partitions = []
+        for row_idx in range(len(partitions)):
+            row = []
+            for col_idx in range(len(partitions[row_idx])):
+                blocks, halo = halo_blocks(row_idx, col_idx)
+                row.extend(
+                    cls._column_partitions_class(blocks).apply(
+                        halo_func, num_splits=1, halo=halo, length=lengths[row_idx]
+                    )
+                )
+            new_partitions.append(row)
+        return np.array(new_partitions)
+
+    @classmethod
+    def rebalance_rows(cls, partitions, lengths, new_lengths):
+        """
+        Move rows between the row partitions to give them new lengths.
+
+        Parameters
+        ----------
+            partitions : NumPy array
+                The partitions of Modin Frame.
+            lengths : list
+                The number of rows in each row partition.
+            new_lengths : list
+                The number of rows of each new row partition, in total the same
+                number of rows.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions with the row partitioning of `new_lengths`.
+
+        Notes
+        -----
+        Every new partition is built in its own task from the pieces of the
+        partitions whose rows it takes, so only the rows that move are copied and
+        no task holds more than a new partition.
+        """
+        starts = np.cumsum([0] + list(lengths))
+        new_partitions = []
+        new_start = 0
+        for new_length in new_lengths:
+            new_end = new_start + new_length
+            pieces = []
+            for i in range(
+                np.searchsorted(starts, new_start, side="right") - 1, len(lengths)
+            ):
+                if starts[i] >= new_end:
+                    break
+                pieces.append(
+                    (
+                        i,
+                        max(new_start, starts[i]) - starts[i],
+                        min(new_end, starts[i + 1]) - starts[i],
+                    )
+                )
+            row = []
+            for col_idx in range(len(partitions[0])):
+                blocks = [
+                    partitions[i][col_idx]
+                    if start == 0 and end == lengths[i]
+                    else partitions[i][col_idx].mask(slice(start, end), slice(None))
+                    for i, start, end in pieces
+                ]
+                if len(blocks) == 1:
+                    row.append(blocks[0])
+                else:
+                    row.extend(
+                        cls._column_partitions_class(blocks).apply(
+                            lambda df: df, num_splits=1
+                        )
+                    )
+            new_partitions.append(row)
+            new_start = new_end
+        return np.array(new_partitions)
+
+    @classmethod
+    def scan(cls, partitions, widths, scan_func, skipna=True):
+        """
+        Applies a prefix scan to the rows of the partitions in two passes.
+
+        Parameters
+        ----------
+            partitions : NumPy array
+                The partitions of Modin Frame.
+            widths : list
+                The number of columns in each column partition.
+            scan_func : callable
+                The scan to apply (e.g. `pandas.DataFrame.cumsum`). Scanning the last
+                row of `scan_func(top)` followed by `bottom` must give the rows of
+                `scan_func` of `top` followed by `bottom` that belong to `bottom`.
+            skipna : boolean
+                Whether or not missing values in the result of `scan_func` are
+                skipped, in which case the last valid value is carried over.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions with the same partitioning as `partitions`.
+
+        Notes
+        -----
+        The first pass computes the last row of the scan of every partition, the
+        second pass seeds the scan of every partition with the exclusive scan of
+        those rows over the preceding row partitions. Only one row per row
+        partition is brought to the driver.
+        """
+
+        def last_row(df):
+            result = scan_func(df)
+            return (result.ffill() if skipna else result).iloc[[-1]]
+
+        last_rows = cls.map_partitions(partitions[:-1], last_row)
+        carries = scan_func(cls.to_pandas(last_rows)) if len(last_rows) else None
+        if skipna and carries is not None:
+            carries = carries.ffill()
+
+        def apply_carry(df, carry):
+            carry = carry.set_axis(df.columns, axis=1, inplace=False)
+            return scan_func(pandas.concat([carry, df])).iloc[1:]
+
+        preprocessed_scan_func = cls.preprocess_func(scan_func)
+        apply_carry = cls.preprocess_func(apply_carry)
+        starts = np.cumsum([0] + list(widths))
+        return np.array(
+            [
+                [
+                    part.apply(preprocessed_scan_func)
+                    if row_idx == 0
+                    else part.apply(
+                        apply_carry,
+                        carry=carries.iloc[
+                            [row_idx - 1], starts[col_idx] : starts[col_idx + 1]
+                        ],
+                    )
+                    for col_idx, part in enumerate(partitions[row_idx])
+                ]
+                for row_idx in range(len(partitions))
+            ]
+        )
+
+    @classmethod
+    def block_matmul(cls, left, right, left_widths, dtype):
+        """
+        Matrix multiply two sets of partitions block by block.
+
+        Parameters
+        ----------
+            left : NumPy array
+                The partitions of the left Modin Frame.
+            right : NumPy array
+                The partitions of the right Modin Frame. The number of rows must be
+                equal to the number of columns of `left`.
+            left_widths : list
+                The number of columns in each column partition of `left`.
+            dtype : NumPy dtype
+                The dtype to compute the product in.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions with the row partitioning of `left` and the
+            column partitioning of `right`.
+
+        Notes
+        -----
+        The rows of `right` are first repartitioned to match the column partitions
+        of `left`. Every pair of blocks sharing the inner dimension is then
+        multiplied in its own task and the partial products are summed along the
+        inner dimension, so neither frame is brought to the driver. BLAS threading
+        within a task is left to NumPy.
+        """
+
+        def multiply(df, other):
+            return pandas.DataFrame(
+                df.to_numpy(dtype=dtype) @ other.to_numpy(dtype=dtype)
+            )
+
+        def sum_partials(df, num_partials):
+            values = df.to_numpy(dtype=dtype)
+            return pandas.DataFrame(
+                values.reshape(num_partials, -1, values.shape[1]).sum(axis=0)
+            )
+
+        multiply = cls.preprocess_func(multiply)
+        sum_partials = cls.preprocess_func(sum_partials)
+        aligned = np.array(
+            [
+                cls._column_partitions_class(col).shuffle(
+                    lambda df: df, list(left_widths)
+                )
+                for col in right.T
+            ]
+        ).T
+        new_partitions = []
+        for row in left:
+            new_row = []
+            for k in range(aligned.shape[1]):
+                partials = [
+                    cls._column_partitions_class([part]).apply(
+                        multiply,
+                        num_splits=1,
+                        other_axis_partition=cls._column_partitions_class(
+                            [aligned[j][k]]
+                        ),
+                    )[0]
+                    for j, part in enumerate(row)
+                ]
+                new_row.append(
+                    cls._column_partitions_class(partials).apply(
+                        sum_partials, num_splits=1, num_partials=len(partials)
+                    )[0]
+                )
+            new_partitions.append(new_row)
+        return np.array(new_partitions)
+
+    @classmethod
+    def _shuffle_to_buckets(cls, partitions, bucket_rows, num_buckets, kwargs=None):
+        """
+        Split the row partitions into the pieces that go to every bucket.
+
+        Parameters
+        ----------
+            partitions : NumPy array
+                The partitions of Modin Frame.
+            bucket_rows : callable
+                Function that takes the pandas DataFrame of a row partition and
+                returns its rows sorted by bucket, with the bucket as the first level
+                of a MultiIndex.
+            num_buckets : int
+                The number of buckets.
+            kwargs : list (optional)
+                The keyword arguments of `bucket_rows` for every row partition.
+
+        Returns
+        -------
+        tuple
+            The bucketed row partitions, the matrix of the number of rows every row
+            partition sends to every bucket, and the matrix of the pieces.
+        """
+
+        def count_rows(df):
+            return pandas.DataFrame(
+                np.bincount(df.index.get_level_values(0), minlength=num_buckets)
+            )
+
+        bucket_rows = cls.preprocess_func(bucket_rows)
+        row_parts = cls.row_partitions(partitions)
+        if kwargs is None:
+            kwargs = [{}] * len(row_parts)
+        bucketed = [
+            part.apply(bucket_rows, num_splits=1, **part_kwargs)[0]
+            for part, part_kwargs in zip(row_parts, kwargs)
+        ]
+        count_parts = [part.apply(count_rows) for part in bucketed]
+        counts = np.array(
+            [part.to_pandas().squeeze(axis=1).values for part in count_parts]
+        ).reshape(len(bucketed), num_buckets)
+
+        grid = np.array(
+            [
+                cls._column_partitions_class([part]).shuffle(
+                    lambda df: df, list(counts[i])
+                )
+                for i, part in enumerate(bucketed)
+            ]
+        ).reshape(len(bucketed), num_buckets)
+        return bucketed, counts, grid
+
+    @classmethod
+    def apply_with_row_partitions(
+        cls, left, right, selections, apply_func, summary_funcs, num_splits, kwargs
+    ):
+        """
+        Apply a function to every row partition and selected row partitions of another.
+
+        Parameters
+        ----------
+            left : NumPy array
+                The partitions of the left Modin Frame.
+            right : NumPy array
+                The partitions of the right Modin Frame.
+            selections : list
+                For every row partition of `left`, the list of `(index, summary)`
+                pairs of the row partitions of `right` it is applied with, in the
+                order their rows are concatenated. `summary` is None to take every
+                row of the partition, or a key of `summary_funcs`.
+            apply_func : callable
+                The function to apply. It receives the pandas DataFrame of a row
+                partition of `left` and the concatenated rows selected from `right`.
+            summary_funcs : dict
+                Functions that reduce a row partition of `right` to the rows other
+                partitions need from it (e.g. the last row of every group).
+            num_splits : int
+                The number of column partitions to split the results into.
+            kwargs : list
+                The keyword arguments of `apply_func` for every row partition of
+                `left`.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions with a row partition per row partition of
+            `left`.
+
+        Notes
+        -----
+        Every row partition of `right` is combined and summarized at most once and
+        only the selected ones are moved to the tasks that need them.
+        """
+
+        def combine(parts):
+            return [part.apply(lambda df: df, num_splits=1)[0] for part in parts]
+
+        apply_func = cls.preprocess_func(apply_func)
+        left_blocks = combine(cls.row_partitions(left))
+        right_blocks = combine(cls.row_partitions(right))
+        summaries = {}
+
+        def right_block(idx, summary):
+            if summary is None:
+                return right_blocks[idx]
+            if (idx, summary) not in summaries:
+                summaries[(idx, summary)] = right_blocks[idx].apply(
+                    cls.preprocess_func(summary_funcs[summary])
+                )
+            return summaries[(idx, summary)]
+
+        new_partitions = []
+        for left_block, selection, part_kwargs in zip(left_blocks, selections, kwargs):
+            blocks = [right_block(idx, summary) for idx, summary in selection]
+            if len(blocks) == 0:
+                # An empty frame with the columns of `right`.
+                blocks = [right_blocks[0].mask(slice(0, 0), slice(None))]
+            result = cls._column_partitions_class([left_block]).apply(
+                apply_func,
+                num_splits=1,
+                other_axis_partition=cls._column_partitions_class(blocks),
+                **part_kwargs,
+            )
+            # The result is split along the columns by its row axis partition.
+            new_partitions.append(
+                cls._row_partition_class(result).apply(
+                    lambda df: df, num_splits=num_splits
+                )
+            )
+        return np.array(new_partitions)
+
+    @classmethod
+    def scatter_rows(cls, partitions, buckets, targets, apply_func, num_splits):
+        """
+        Send every row to a given bucket and apply a function to every bucket.
+
+        Parameters
+        ----------
+            partitions : NumPy array
+                The partitions of Modin Frame.
+            buckets : list
+                For every row partition, the array with the bucket of its rows.
+            targets : list
+                For every row partition, the array with the integer labels the rows
+                get in their bucket.
+            apply_func : callable
+                The function to apply to every bucket. It receives the rows of the
+                bucket in their original order, indexed by their targets.
+            num_splits : int
+                The number of column partitions to split the results into.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions with a row partition per bucket. Every
+            bucket must get at least one row.
+        """
+        num_buckets = max(int(b.max()) for b in buckets if len(b) > 0) + 1
+
+        def bucket_rows(df, bucket, target):
+            order = np.argsort(bucket, kind="stable")
+            result = df.iloc[order]
+            result.index = pandas.MultiIndex.from_arrays([bucket[order], target[order]])
+            return result
+
+        def apply_bucket(df):
+            return apply_func(df.droplevel(0))
+
+        _, counts, grid = cls._shuffle_to_buckets(
+            partitions,
+            bucket_rows,
+            num_buckets,
+            [
+                {"bucket": np.asarray(bucket, dtype=np.int64), "target": target}
+                for bucket, target in zip(buckets, targets)
+            ],
+        )
+        apply_bucket = cls.preprocess_func(apply_bucket)
+        results = [
+            cls._column_partitions_class(
+                list(grid[counts[:, b].nonzero()[0], b])
+            ).apply(apply_bucket, num_splits=1)
+            for b in range(num_buckets)
+        ]
+        # The results are split along the columns by their row axis partitions.
+        return np.array(
+            [
+                cls._row_partition_class(result).apply(
+                    lambda df: df, num_splits=num_splits
+                )
+                for result in results
+            ]
+        )
+
+    @classmethod
+    def hash_shuffle(cls, partitions, lengths, hash_func, apply_func, num_buckets):
+        """
+        Apply a function to groups of rows that share a hash bucket.
+
+        Parameters
+        ----------
+            partitions : NumPy array
+                The partitions of Modin Frame.
+            lengths : list
+                The number of rows in each row partition.
+            hash_func : callable
+                Function that takes a pandas DataFrame and returns an array of
+                non-negative integer hashes, one per row.
+            apply_func : callable
+                The function to apply to every bucket. It receives a pandas
+                DataFrame indexed by the global row positions in ascending order
+                and must return a DataFrame with the same index.
+            num_buckets : int
+                The number of buckets to shuffle the rows into.
+
+        Returns
+        -------
+        NumPy array
+            An array of new partitions with a single column partition and the
+            original row partitioning.
+
+        Notes
+        -----
+        Rows are routed to buckets and back through `shuffle` of the axis
+        partitions, so only the per-block bucket counts are brought to the driver.
+        """
+        starts = np.cumsum([0] + list(lengths[:-1]))
+
+        def bucket_rows(df, start):
+            buckets = np.asarray(hash_func(df), dtype=np.uint64) % np.uint64(
+                num_buckets
+            )
+            order = np.argsort(buckets, kind="stable")
+            result = df.iloc[order]
+            result.index = pandas.MultiIndex.from_arrays(
+                [buckets[order].astype(np.int64), order + start]
+            )
+            return result
+
+        def apply_bucket(df):
+            return apply_func(df.droplevel(0))
+
+        bucketed, counts, grid = cls._shuffle_to_buckets(
+            partitions, bucket_rows, num_buckets, [{"start": start} for start in starts]
+        )
+
+        apply_bucket = cls.preprocess_func(apply_bucket)
+        routed = np.empty((num_buckets, len(bucketed)), dtype=object)
+        for b in range(num_buckets):
+            sources = counts[:, b].nonzero()[0]
+            if len(sources) == 0:
+                continue
+            result = cls._column_partitions_class(list(grid[sources, b])).apply(
+                apply_bucket, num_splits=1
+            )[0]
+            routed[b, sources] = cls._column_partitions_class([result]).shuffle(
+                lambda df: df, list(counts[sources, b])
+            )
+
+        def sort_rows(df):
+            return df.sort_index()
+
+        sort_rows = cls.preprocess_func(sort_rows)
+        new_partitions = []
+        for i in range(len(bucketed)):
+            sources = counts[i].nonzero()[0]
+            if len(sources) == 0:
+                # Row partitions without rows get an empty block of the result.
+                b = counts.sum(axis=0).nonzero()[0][0]
+                block = routed[b, counts[:, b].nonzero()[0][0]]
+                blocks = [block.mask(slice(0, 0), slice(None))]
+            else:
+                blocks = list(routed[sources, i])
+            new_partitions.append(
+                cls._column_partitions_class(blocks).apply(sort_rows, num_splits=1)
+            )
+        return np.array(new_partitions)
+
+    @classmethod
+    def hash_reduce(cls, partitions, map_func, reduce_func, combine_func, num_buckets):
+        """
+        Reduce the partitions through groups of keys that share a hash bucket.
+
+        Parameters
+        ----------
+            partitions : NumPy array
+                The partitions of Modin Frame.
+            map_func : callable
+                Function that takes the pandas DataFrame of a row partition and
+                returns a DataFrame indexed by non-negative integer keys.
+            reduce_func : callable
+                Function that takes the rows of all `map_func` results that share a
+                bucket, indexed by their keys, and returns a single row DataFrame.
+            combine_func : callable
+                Function that takes the results of `reduce_func` for every bucket
+                and returns a single row DataFrame.
+            num_buckets : int
+                The number of buckets to shuffle the keys into.
+
+        Returns
+        -------
+        NumPy array
+            An array with a single partition holding the result of `combine_func`.
+
+        Notes
+        -----
+        Equal keys always end up in the same bucket, so `reduce_func` sees all of
+        the rows for any given key while no task has to hold more than one bucket.
+        Only the per-partition bucket counts are brought to the driver.
+        """
+
+        def bucket_rows(df):
+            result = map_func(df)
+            buckets = np.asarray(result.index, dtype=np.uint64) % np.uint64(num_buckets)
+            order = np.argsort(buckets, kind="stable")
+            result = result.iloc[order]
+            result.index = pandas.MultiIndex.from_arrays(
+                [buckets[order].astype(np.int64), result.index]
+            )
+            return result
+
+        def apply_bucket(df):
+            return reduce_func(df.droplevel(0))
+
+        bucketed, counts, grid = cls._shuffle_to_buckets(
+            partitions, bucket_rows, num_buckets
+        )
+
+        apply_bucket = cls.preprocess_func(apply_bucket)
+        results = [
+            cls._column_partitions_class(
+                list(grid[counts[:, b].nonzero()[0], b])
+            ).apply(apply_bucket, num_splits=1)[0]
+            for b in range(num_buckets)
+            if counts[:, b].any()
+        ]
+        if len(results) == 0:
+            # No keys at all, reduce the empty result of the first partition.
+            results = [bucketed[0].apply(apply_bucket)]
+        combine_func = cls.preprocess_func(combine_func)
+        return np.array(
+            [cls._column_partitions_class(results).apply(combine_func, num_splits=1)]
+        )
+
     @classmethod
     def concat(cls, axis, left_parts, right_parts):
         """Concatenate the blocks with another set of blocks.
@@ -369,20 +1053,178 @@ class BaseFrameManager(object):
         """
         return np.block([[block.to_numpy() for block in row] for row in partitions])
 
+    @classmethod
+    def _iter_blocks(cls, partitions):
+        """Retrieve the blocks of the partitions one at a time.
+
+        Returns:
+            A generator of the row position, the column position and the block of
+            every partition.
+        """
+        for i, row in enumerate(partitions):
+            for j, part in enumerate(row):
+                yield i, j, part.to_pandas()
+
+    @classmethod
+    def _copy_blocks(cls, partitions, row_lengths, column_widths, dtypes, copy_func):
+        """Copy the internal blocks of the partitions, checking their data types.
+
+        Args:
+            partitions: The partitions to copy.
+            row_lengths: The number of rows of every row of partitions.
+            column_widths: The number of columns of every column of partitions.
+            dtypes: A NumPy array with the data type of every column.
+            copy_func: The function to copy the values of an internal pandas block
+                with, called with the column positions of the values (a slice or an
+                array), the slice of their rows and the values.
+
+        Returns:
+            True if every block is copied, False if a block does not have the shape
+            or the data types it should.
+        """
+        row_offsets = np.cumsum([0] + list(row_lengths))
+        col_offsets = np.cumsum([0] + list(column_widths))
+        for i, j, df in cls._iter_blocks(partitions):
+            if not isinstance(df, pandas.DataFrame) or df.shape != (
+                row_lengths[i],
+                column_widths[j],
+            ):
+                return False
+            rows = slice(row_offsets[i], row_offsets[i + 1])
+            for block in df._data.blocks:
+                locs = block.mgr_locs
+                # numpy copies into a slice faster than into a list of positions
+                if locs.is_slice_like and locs.as_slice.step in (None, 1):
+                    positions = slice(
+                        col_offsets[j] + locs.as_slice.start,
+                        col_offsets[j] + locs.as_slice.stop,
+                    )
+                else:
+                    positions = col_offsets[j] + locs.as_array
+                if any(dtype != block.dtype for dtype in dtypes[positions]):
+                    return False
+                copy_func(positions, rows, block.values)
+        return True
+
+    @classmethod
+    def to_pandas_preallocated(
+        cls, partitions, index, columns, row_lengths, column_widths, dtypes
+    ):
+        """Convert the partitions into a pandas DataFrame, copying every block once.
+
+        The arrays of the DataFrame, one per data type, are allocated up front and
+        every block is copied into them as soon as it is retrieved, so the blocks
+        are never concatenated.
+
+        Args:
+            partitions: The partitions to convert.
+            index: The index of the DataFrame.
+            columns: The columns of the DataFrame.
+            row_lengths: The number of rows of every row of partitions.
+            column_widths: The number of columns of every column of partitions.
+            dtypes: The data types of the columns.
+
+        Returns:
+            A pandas DataFrame, or None if some of the data types are not NumPy
+            types or don't match the data types of the blocks.
+        """
+        dtypes = np.asarray(dtypes, dtype=object)
+        if len(dtypes) != len(columns) or not all(
+            isinstance(dtype, np.dtype) for dtype in dtypes
+        ):
+            return None
+        groups = {}
+        for i, dtype in enumerate(dtypes):
+            groups.setdefault(dtype, []).append(i)
+        # the position of every column in the array of its data type
+        group_positions = np.empty(len(dtypes), dtype=int)
+        for positions in groups.values():
+            group_positions[positions] = np.arange(len(positions))
+        # pandas keeps the values of a column contiguous
+        arrays = {
+            dtype: np.empty((len(positions), len(index)), dtype=dtype)
+            for dtype, positions in groups.items()
+        }
+
+        def copy_func(positions, rows, values):
+            arrays[values.dtype][group_positions[positions], rows] = values
+
+        if not cls._copy_blocks(
+            partitions, row_lengths, column_widths, dtypes, copy_func
+        ):
+            return None
+        blocks = [
+            make_block(arrays[dtype], placement=positions)
+            for dtype, positions in groups.items()
+        ]
+        return pandas.DataFrame(BlockManager(blocks, [columns, index]))
+
+    @classmethod
+    def to_numpy_preallocated(cls, partitions, row_lengths, column_widths, dtypes):
+        """Convert the partitions into a NumPy array, copying every block once.
+
+        The array is allocated up front with the data type pandas would use and
+        every block is copied into it as soon as it is retrieved.
+
+        Args:
+            partitions: The partitions to convert.
+            row_lengths: The number of rows of every row of partitions.
+            column_widths: The number of columns of every column of partitions.
+            dtypes: The data types of the columns.
+
+        Returns:
+            A NumPy array, or None if some of the data types are not NumPy types,
+            don't match the data types of the blocks or can't be cast to a common
+            type without pandas.
+        """
+        dtypes = np.asarray(dtypes, dtype=object)
+        if not all(isinstance(dtype, np.dtype) for dtype in dtypes):
+            return None
+        dtype = find_common_type(list(dtypes))
+        # pandas boxes datetimes and timedeltas when it casts them to objects
+        if dtype == np.dtype("O") and any(t != dtype for t in dtypes):
+            return None
+        result = np.empty((sum(row_lengths), sum(column_widths)), dtype=dtype)
+
+        def copy_func(positions, rows, values):
+            result[rows, positions] = values.T
+
+        if not cls._copy_blocks(
+            partitions, row_lengths, column_widths, dtypes, copy_func
+        ):
+            return None
+        return result
+
+    @classmethod
+    def _put_blocks(cls, blocks):
+        """Put the blocks of a pandas DataFrame into partitions.
+
+        The blocks are views of the DataFrame, so they are copied before they are
+        put, in case the DataFrame is changed afterwards.
+
+        Args:
+            blocks: A 2D list of the blocks.
+
+        Returns:
+            A 2D list of partitions.
+        """
+        put_func = cls._partition_class.put
+        return [[put_func(block.copy()) for block in row] for row in blocks]
+
     @classmethod
     def from_pandas(cls, df, return_dims=False):
         num_splits = cls._compute_num_partitions()
-        put_func = cls._partition_class.put
         row_chunksize, col_chunksize = compute_chunksize(df, num_splits)
-        parts = [
+        blocks = [
             [
-                put_func(df.iloc[i : i + row_chunksize, j : j + col_chunksize].copy())
+                df.iloc[i : i + row_chunksize, j : j + col_chunksize]
                 for j in range(0, len(df.columns), col_chunksize)
             ]
             for i in range(0, len(df), row_chunksize)
         ]
+        parts = np.array(cls._put_blocks(blocks))
         if not return_dims:
-            return np.array(parts)
+            return parts
         else:
             row_lengths = [
                 row_chunksize
@@ -396,7 +1238,7 @@ class BaseFrameManager(object):
                 else len(df.columns) % col_chunksize or col_chunksize
                 for i in range(0, len(df.columns), col_chunksize)
             ]
-            return np.array(parts), row_lengths, col_widths
+            return parts, row_lengths, col_widths
 
     @classmethod
     def get_indices(cls, axis, partitions, index_func=None):
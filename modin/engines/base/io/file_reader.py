@@ -11,12 +11,28 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+import hashlib
 import os
+import pickle
 import re
+import shutil
+import uuid
+
+import numpy as np
+import pandas
+from pandas.api.types import is_object_dtype
+
+import modin
 from modin import partition_format
 
 S3_ADDRESS_REGEX = re.compile("[sS]3://(.*?)/(.*)")
 NOT_IMPLEMENTED_MESSAGE = "Implement in children classes!"
+# The directory to cache the parsed partitions of the files read in. Caching is off
+# when it is not set.
+READ_CACHE_ENV = "MODIN_READ_CACHE_DIR"
+READ_CACHE_MANIFEST = "manifest.pkl"
+# The names of the arguments that hold the path of the file read in.
+PATH_ARGUMENTS = ["filepath_or_buffer", "path_or_buf", "path", "io"]
 
 
 class FileReader:
@@ -26,12 +42,26 @@ class FileReader:
 
     @classmethod
     def read(cls, *args, **kwargs):
+        cache_dir = os.environ.get(READ_CACHE_ENV)
+        cache_key = None
+        if cache_dir and len(args) == 0:
+            cache_key = cls._read_cache_key(kwargs)
+        if cache_key is not None:
+            query_compiler = cls._load_from_read_cache(cache_dir, cache_key)
+            if query_compiler is not None:
+                return query_compiler
+        query_compiler = cls._read_and_cast(*args, **kwargs)
+        if cache_key is not None and hasattr(query_compiler, "_modin_frame"):
+            cls._store_in_read_cache(cache_dir, cache_key, query_compiler)
+        return query_compiler
+
+    @classmethod
+    def _read_and_cast(cls, *args, **kwargs):
         query_compiler = cls._read(*args, **kwargs)
         # TODO (devin-petersohn): Make this section more general for non-pandas kernel
         # implementations.
         if partition_format.get().lower() != "pandas":
             raise NotImplementedError("FIXME")
-        import pandas
 
         if hasattr(query_compiler, "dtypes") and any(
             isinstance(t, pandas.CategoricalDtype) for t in query_compiler.dtypes
@@ -50,6 +80,184 @@ class FileReader:
     def _read(cls, *args, **kwargs):
         raise NotImplementedError(NOT_IMPLEMENTED_MESSAGE)
 
+    @classmethod
+    def _read_cache_key(cls, kwargs):
+        """Get the key of a read in the cache of parsed files.
+
+        The key is made of the path, the size and the modification time of the file,
+        and of the other arguments of the read. Reads of anything but a local file,
+        or with arguments that can't be compared across processes (e.g. functions),
+        are not cached.
+
+        Returns:
+            The key as a string, or None if the read can't be cached.
+        """
+        path_argument = next((arg for arg in PATH_ARGUMENTS if arg in kwargs), None)
+        if path_argument is None:
+            return None
+        path = kwargs[path_argument]
+        if not isinstance(path, str) or S3_ADDRESS_REGEX.search(path):
+            return None
+        path = os.path.abspath(path)
+        if not os.path.isfile(path):
+            return None
+        other_kwargs = sorted(
+            (name, value) for name, value in kwargs.items() if name != path_argument
+        )
+        normalized = _normalize_read_argument(other_kwargs)
+        if normalized is None:
+            return None
+        stat = os.stat(path)
+        key = repr(
+            (
+                cls._read.__qualname__,
+                path,
+                stat.st_size,
+                stat.st_mtime_ns,
+                normalized,
+                modin.__version__,
+            )
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    @classmethod
+    def _load_from_read_cache(cls, cache_dir, cache_key):
+        """Build the query compiler of a cached read.
+
+        Every partition is loaded from its file by a separate task.
+
+        Returns:
+            A new query compiler, or None if the read is not in the cache.
+        """
+        entry = os.path.join(cache_dir, cache_key)
+        try:
+            with open(os.path.join(entry, READ_CACHE_MANIFEST), "rb") as f:
+                manifest = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+        dtypes = manifest["dtypes"]
+        cum_widths = np.cumsum([0] + manifest["column_widths"])
+
+        def load_partition(df, file_path, partition_dtypes):
+            import pyarrow as pa
+
+            if file_path.endswith(".pkl"):
+                return pandas.read_pickle(file_path)
+            with pa.memory_map(file_path, "r") as source:
+                result = pa.ipc.open_file(source).read_pandas()
+            if not result.dtypes.equals(partition_dtypes):
+                result = result.astype(
+                    dict(zip(result.columns, partition_dtypes.values))
+                )
+            return result
+
+        empty = cls.frame_partition_cls.put(pandas.DataFrame())
+        partitions = np.array(
+            [
+                [
+                    empty.apply(
+                        load_partition,
+                        file_path=os.path.join(entry, name),
+                        partition_dtypes=dtypes.iloc[
+                            cum_widths[j] : cum_widths[j + 1]
+                        ].reset_index(drop=True),
+                    )
+                    for j, name in enumerate(row_files)
+                ]
+                for row_files in manifest["files"]
+            ]
+        )
+        frame = cls.frame_cls(
+            partitions,
+            manifest["index"],
+            manifest["columns"],
+            manifest["row_lengths"],
+            manifest["column_widths"],
+            dtypes,
+        )
+        frame._apply_index_objs()
+        return cls.query_compiler_cls(frame)
+
+    @classmethod
+    def _store_in_read_cache(cls, cache_dir, cache_key, query_compiler):
+        """Write the partitions of a read into the cache of parsed files.
+
+        Every partition is written to a file by the task that holds it. The entry is
+        written to a temporary directory that is renamed once complete, so readers
+        never see a partially written entry. The partitions with object columns are
+        pickled, as Arrow does not keep their missing values and types (e.g. NaN
+        comes back as None), and the others are written to Arrow files.
+        """
+        frame = query_compiler._modin_frame
+        entry = os.path.join(cache_dir, cache_key)
+        if os.path.exists(entry):
+            return
+        tmp_entry = "{}.tmp-{}".format(entry, uuid.uuid4().hex)
+
+        def store_partition(df, file_path):
+            import pyarrow as pa
+
+            if file_path.endswith(".pkl"):
+                df.to_pickle(file_path)
+                return pandas.DataFrame()
+            # the labels are kept in the manifest
+            table = pa.Table.from_pandas(
+                df.set_axis([str(i) for i in range(len(df.columns))], axis=1),
+                preserve_index=False,
+            )
+            with pa.OSFile(file_path, "wb") as sink:
+                writer = pa.RecordBatchFileWriter(sink, table.schema)
+                writer.write_table(table)
+                writer.close()
+            return pandas.DataFrame()
+
+        cum_widths = np.cumsum([0] + frame._column_widths)
+        extensions = [
+            "pkl"
+            if any(
+                is_object_dtype(dtype)
+                for dtype in frame.dtypes.iloc[cum_widths[j] : cum_widths[j + 1]]
+            )
+            else "arrow"
+            for j in range(frame._partitions.shape[1])
+        ]
+        files = [
+            [
+                "part-{}-{}.{}".format(i, j, extension)
+                for j, extension in enumerate(extensions)
+            ]
+            for i in range(frame._partitions.shape[0])
+        ]
+        try:
+            os.makedirs(tmp_entry)
+            written = np.array(
+                [
+                    [
+                        part.apply(
+                            store_partition, file_path=os.path.join(tmp_entry, name)
+                        )
+                        for part, name in zip(row, row_files)
+                    ]
+                    for row, row_files in zip(frame._partitions, files)
+                ]
+            )
+            # blocking operation
+            frame._frame_mgr_cls.to_pandas(written)
+            manifest = {
+                "index": frame.index,
+                "columns": frame.columns,
+                "row_lengths": frame._row_lengths,
+                "column_widths": frame._column_widths,
+                "dtypes": frame.dtypes,
+                "files": files,
+            }
+            with open(os.path.join(tmp_entry, READ_CACHE_MANIFEST), "wb") as f:
+                pickle.dump(manifest, f)
+            os.rename(tmp_entry, entry)
+        except Exception:
+            # another process may have stored the same read in the meantime
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
     @classmethod
     def get_path(cls, file_path):
         if S3_ADDRESS_REGEX.search(file_path):
@@ -146,3 +354,29 @@ class FileReader:
     @classmethod
     def materialize(cls, obj_id):
         raise NotImplementedError(NOT_IMPLEMENTED_MESSAGE)
+
+
+def _normalize_read_argument(value):
+    """Get a representation of a read argument that is the same across processes.
+
+    Returns:
+        The representation, or None if there is none (e.g. for functions or buffers).
+    """
+    if value is None or isinstance(value, (str, bytes, bool, int, float, type)):
+        return value
+    if isinstance(value, np.dtype) or isinstance(
+        value, pandas.api.extensions.ExtensionDtype
+    ):
+        return str(value)
+    if isinstance(value, (list, tuple)):
+        items = [_normalize_read_argument(item) for item in value]
+        if any(item is None and orig is not None for item, orig in zip(items, value)):
+            return None
+        return (type(value).__name__, tuple(items))
+    if isinstance(value, (set, frozenset)):
+        items = _normalize_read_argument(list(value))
+        return None if items is None else ("set", tuple(sorted(map(repr, items[1]))))
+    if isinstance(value, dict):
+        items = _normalize_read_argument(list(value.items()))
+        return None if items is None else ("dict", items[1])
+    return None
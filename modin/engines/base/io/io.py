@@ -11,12 +11,24 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+import json
+import os
+import pickle
+
+import numpy as np
 import pandas
 from collections import OrderedDict
+from pandas.io.common import infer_compression
+from pandas.api.types import is_extension_array_dtype
 from modin.error_message import ErrorMessage
+from modin.data_management.utils import compute_chunksize
 from modin.backends.base.query_compiler import BaseQueryCompiler
 
 
+class _ArrowConversionError(Exception):
+    """Raised when Arrow converts a row partition to a different number of rows."""
+
+
 class BaseIO(object):
     query_compiler_cls: BaseQueryCompiler = None
     frame_cls = None
@@ -605,3 +617,591 @@ class BaseIO(object):
             return pandas.to_pickle(
                 obj, path, compression=compression, protocol=protocol
             )
+
+    @classmethod
+    def to_json(cls, qc, path_or_buf=None, **kwargs):
+        """Convert the frame to JSON, rendering every row partition in parallel.
+
+        Line-delimited records are rendered by one task per row partition and the
+        rendered blocks are written in order, one at a time. The other formats
+        default to pandas.
+
+        Args:
+            qc: The query compiler of the frame to convert.
+            path_or_buf: The path of the file to write to. The JSON is returned as a
+                string if None.
+            kwargs: The arguments of `pandas.DataFrame.to_json`.
+        """
+        compression = kwargs.get("compression", "infer")
+        if isinstance(path_or_buf, str):
+            compression = infer_compression(path_or_buf, compression)
+        if (
+            kwargs.get("orient") != "records"
+            or not kwargs.get("lines", False)
+            or not (path_or_buf is None or isinstance(path_or_buf, str))
+            or (path_or_buf is not None and compression is not None)
+            or len(qc.index) == 0
+        ):
+            ErrorMessage.default_to_pandas("`to_json`")
+            return qc.to_pandas().to_json(path_or_buf, **kwargs)
+        # this validates the arguments like pandas does
+        qc.getitem_row_array([0]).to_pandas().head(0).to_json(**kwargs)
+        columns = qc.columns
+
+        def render(df):
+            df.columns = columns
+            return pandas.DataFrame([df.to_json(**kwargs)])
+
+        frame = qc._modin_frame
+        frame_mgr_cls = frame._frame_mgr_cls
+        render = frame_mgr_cls.preprocess_func(render)
+        blocks = [
+            part.apply(render, num_splits=1)[0]
+            for part in frame_mgr_cls.row_partitions(frame._partitions)
+        ]
+        rendered = (block.to_pandas().iloc[0, 0] for block in blocks)
+        if path_or_buf is None:
+            return "\n".join(text for text in rendered if len(text))
+        with open(path_or_buf, "w") as f:
+            separator = ""
+            for text in rendered:
+                if len(text):
+                    f.write(separator)
+                    f.write(text)
+                    separator = "\n"
+
+    @classmethod
+    def _get_arrow_schema(cls, qc, preserve_index):
+        """Get the Arrow schema of a frame from the schemas of its row partitions.
+
+        The types of the object columns are inferred from their values, so every
+        column takes the type of the row partitions where it is not all null.
+
+        Args:
+            qc: The query compiler of the frame.
+            preserve_index: Whether to store the index as columns.
+
+        Returns:
+            The schema, or None if the row partitions have different types for the
+            same column.
+        """
+        import pyarrow as pa
+
+        columns = qc.columns
+        frame = qc._modin_frame
+        frame_mgr_cls = frame._frame_mgr_cls
+
+        def get_schema(df):
+            df.columns = columns
+            return pandas.DataFrame(
+                [pa.Schema.from_pandas(df, preserve_index=preserve_index).serialize()]
+            )
+
+        get_schema = frame_mgr_cls.preprocess_func(get_schema)
+        schemas = [
+            pa.ipc.read_schema(pa.py_buffer(block.to_pandas().iloc[0, 0]))
+            for block in [
+                part.apply(get_schema, num_splits=1)[0]
+                for part in frame_mgr_cls.row_partitions(frame._partitions)
+            ]
+        ]
+        metadata = json.loads(schemas[0].metadata[b"pandas"])
+        descriptions = [
+            {
+                column["field_name"]: column
+                for column in json.loads(schema.metadata[b"pandas"])["columns"]
+            }
+            for schema in schemas
+        ]
+        fields = []
+        for i, name in enumerate(schemas[0].names):
+            typed = [
+                k for k, schema in enumerate(schemas) if schema.types[i] != pa.null()
+            ]
+            if len({schemas[k].types[i] for k in typed}) > 1:
+                return None
+            k = typed[0] if typed else 0
+            fields.append(pa.field(name, schemas[k].types[i]))
+            # the pandas type of the column is inferred from the values too
+            if name in descriptions[k]:
+                metadata["columns"] = [
+                    descriptions[k][name] if column["field_name"] == name else column
+                    for column in metadata["columns"]
+                ]
+        return pa.schema(
+            fields,
+            metadata={**schemas[0].metadata, b"pandas": json.dumps(metadata).encode()},
+        )
+
+    @classmethod
+    def _to_record_batches(cls, qc, schema, preserve_index):
+        """Convert a frame to Arrow, one row partition per task.
+
+        Every task serializes its record batches to an Arrow stream, which the
+        batches yielded here are read from without a copy.
+
+        Args:
+            qc: The query compiler of the frame to convert.
+            schema: The schema of the frame, see `_get_arrow_schema`.
+            preserve_index: Whether to store the index as columns.
+
+        Returns:
+            A generator of the record batches of the frame, in order. It raises
+            `_ArrowConversionError` if the batches of a row partition do not have
+            as many rows as the partition.
+        """
+        import pyarrow as pa
+
+        columns = qc.columns
+        frame = qc._modin_frame
+        frame_mgr_cls = frame._frame_mgr_cls
+
+        def to_batches(df):
+            # pyarrow 0.16 gets the length of the views of the extension and tz-aware
+            # blocks of a partition wrong
+            if any(is_extension_array_dtype(dtype) for dtype in df.dtypes):
+                df = df.copy()
+            # pyarrow takes the columns by the names in the schema
+            df.columns = schema.names[: len(columns)]
+            table = pa.Table.from_pandas(
+                df, schema=schema, preserve_index=preserve_index
+            )
+            sink = pa.BufferOutputStream()
+            writer = pa.RecordBatchStreamWriter(sink, schema)
+            writer.write_table(table)
+            writer.close()
+            return pandas.DataFrame([sink.getvalue().to_pybytes()])
+
+        to_batches = frame_mgr_cls.preprocess_func(to_batches)
+        blocks = [
+            part.apply(to_batches, num_splits=1)[0]
+            for part in frame_mgr_cls.row_partitions(frame._partitions)
+        ]
+        for block, length in zip(blocks, frame._row_lengths):
+            batches = list(pa.ipc.open_stream(block.to_pandas().iloc[0, 0]))
+            if sum(batch.num_rows for batch in batches) != length:
+                raise _ArrowConversionError
+            yield from batches
+
+    @classmethod
+    def _get_arrow_table_schema(cls, qc):
+        """Get the Arrow schema a frame is converted with as a whole.
+
+        A RangeIndex is kept in the metadata, like pyarrow does, instead of being
+        stored as a column.
+
+        Args:
+            qc: The query compiler of the frame.
+
+        Returns:
+            A tuple of the schema of the record batches, whether they store the
+            index as columns and the schema with the metadata of the whole frame,
+            or None if the row partitions have different types for the same column.
+        """
+        import pyarrow as pa
+
+        index = qc.index
+        preserve_index = not isinstance(index, pandas.RangeIndex)
+        schema = cls._get_arrow_schema(qc, preserve_index)
+        if schema is None or preserve_index:
+            return schema, preserve_index, schema
+        metadata = json.loads(schema.metadata[b"pandas"])
+        # pyarrow leaves out the levels of the columns without the index
+        metadata["column_indexes"] = json.loads(
+            pa.Schema.from_pandas(pandas.DataFrame(columns=qc.columns)).metadata[
+                b"pandas"
+            ]
+        )["column_indexes"]
+        metadata["index_columns"] = [
+            {
+                "kind": "range",
+                "name": index.name,
+                "start": index.start,
+                "stop": index.stop,
+                "step": index.step,
+            }
+        ]
+        return (
+            schema,
+            preserve_index,
+            schema.with_metadata(
+                {**schema.metadata, b"pandas": json.dumps(metadata).encode()}
+            ),
+        )
+
+    @classmethod
+    def to_arrow(cls, qc):
+        """Convert the frame to a pyarrow Table, one row partition per task.
+
+        The Table is assembled from the record batches of the row partitions
+        without a copy. A RangeIndex is kept in the metadata, like pyarrow does.
+
+        Args:
+            qc: The query compiler of the frame to convert.
+
+        Returns:
+            A pyarrow Table.
+        """
+        import pyarrow as pa
+
+        if len(qc.index) == 0:
+            return pa.Table.from_pandas(qc.to_pandas())
+        schema, preserve_index, table_schema = cls._get_arrow_table_schema(qc)
+        if schema is not None:
+            try:
+                batches = list(cls._to_record_batches(qc, schema, preserve_index))
+            except _ArrowConversionError:
+                pass
+            else:
+                return pa.Table.from_batches(batches, schema).replace_schema_metadata(
+                    table_schema.metadata
+                )
+        ErrorMessage.default_to_pandas("`to_arrow`")
+        return pa.Table.from_pandas(qc.to_pandas())
+
+    @classmethod
+    def to_arrow_ipc(cls, qc, path):
+        """Write the frame to an Arrow IPC file, one record batch per row partition.
+
+        Every row partition is converted to Arrow by its own task and the batches
+        are written to the file in order, one at a time, so the frame is never
+        collected. The file can be read with `pyarrow.ipc.open_file`.
+
+        Args:
+            qc: The query compiler of the frame to write.
+            path: The path of the file to write to.
+        """
+        import pyarrow as pa
+
+        if len(qc.index):
+            schema, preserve_index, table_schema = cls._get_arrow_table_schema(qc)
+            # the dictionaries of categorical columns are not written by batches
+            if schema is not None and not any(
+                pa.types.is_dictionary(t) for t in schema.types
+            ):
+                try:
+                    with pa.OSFile(path, "wb") as sink:
+                        writer = pa.RecordBatchFileWriter(sink, table_schema)
+                        for batch in cls._to_record_batches(qc, schema, preserve_index):
+                            writer.write_batch(batch)
+                        writer.close()
+                    return
+                except _ArrowConversionError:
+                    pass
+            ErrorMessage.default_to_pandas("`to_arrow_ipc`")
+        table = pa.Table.from_pandas(qc.to_pandas())
+        with pa.OSFile(path, "wb") as sink:
+            writer = pa.RecordBatchFileWriter(sink, table.schema)
+            writer.write_table(table)
+            writer.close()
+
+    @classmethod
+    def from_arrow(cls, table):
+        """Convert a pyarrow Table to a frame without converting it on the driver.
+
+        The rows are split into even chunks of record batches, slicing the batches
+        where needed, and the columns into even chunks of columns, all without a
+        copy. Every partition is converted to pandas by its own task.
+
+        Args:
+            table: The pyarrow Table to convert.
+
+        Returns:
+            A query compiler with the frame.
+        """
+        import pyarrow as pa
+
+        if table.num_rows == 0 or any(
+            pa.types.is_dictionary(column.type)
+            and any(
+                not chunk.dictionary.equals(column.chunk(0).dictionary)
+                for chunk in column.chunks
+            )
+            for column in table.columns
+        ):
+            # pyarrow unifies the different dictionaries of a categorical column
+            # only when it converts the whole column
+            if table.num_rows > 0:
+                ErrorMessage.default_to_pandas("`from_arrow`")
+            return cls.from_pandas(table.to_pandas())
+        frame_mgr_cls = cls.frame_cls._frame_mgr_cls
+        put_func = frame_mgr_cls._partition_class.put
+        num_splits = frame_mgr_cls._compute_num_partitions()
+        schema = table.schema
+        metadata = json.loads((schema.metadata or {}).get(b"pandas", b"{}"))
+        index_columns = metadata.get("index_columns", [])
+        index_positions = [
+            schema.get_field_index(name)
+            for name in index_columns
+            if isinstance(name, str)
+        ]
+        column_positions = [
+            i for i in range(len(schema.names)) if i not in index_positions
+        ]
+        # the labels and the data types of the columns, with the pandas metadata
+        meta = table.slice(0, 1).to_pandas().iloc[:0]
+        if len(column_positions) == 0:
+            return cls.from_pandas(table.to_pandas())
+        # The integer and boolean columns with nulls anywhere are converted to
+        # float and object columns, whether or not a block has nulls.
+        dtypes = [
+            np.dtype("float64")
+            if dtype.kind in "iu" and table.column(k).null_count
+            else np.dtype("O")
+            if dtype.kind == "b" and table.column(k).null_count
+            else dtype
+            for k, dtype in zip(column_positions, meta.dtypes)
+        ]
+
+        row_chunksize = compute_chunksize(
+            pandas.DataFrame(index=pandas.RangeIndex(table.num_rows)),
+            num_splits,
+            axis=0,
+        )
+        col_chunksize = compute_chunksize(meta, num_splits, axis=1)
+        row_chunks = [[]]
+        length = 0
+        for batch in table.to_batches():
+            offset = 0
+            while offset < batch.num_rows:
+                if length == row_chunksize:
+                    row_chunks.append([])
+                    length = 0
+                size = min(batch.num_rows - offset, row_chunksize - length)
+                row_chunks[-1].append(batch.slice(offset, size))
+                offset += size
+                length += size
+        col_chunks = [
+            column_positions[i : i + col_chunksize]
+            for i in range(0, len(column_positions), col_chunksize)
+        ]
+        # The index is converted with the first column of blocks and is applied to
+        # the other blocks from there.
+        col_chunks[0] = col_chunks[0] + index_positions
+
+        def get_block(batches, positions, block_dtypes):
+            # the columns of the batches are put without a copy
+            return pandas.DataFrame(
+                [
+                    [
+                        block_dtypes,
+                        pa.Table.from_arrays(
+                            [
+                                pa.chunked_array(
+                                    [batch.column(k) for batch in batches],
+                                    schema.types[k],
+                                )
+                                for k in positions
+                            ],
+                            schema=pa.schema(
+                                [schema.field(k) for k in positions],
+                                metadata=schema.metadata,
+                            ),
+                        ),
+                    ]
+                ]
+            )
+
+        def to_pandas(df):
+            block_dtypes = df.iloc[0, 0]
+            result = df.iloc[0, 1].to_pandas(split_blocks=True)
+            if any(d != dtype for d, dtype in zip(result.dtypes, block_dtypes)):
+                columns = result.columns
+                result.columns = pandas.RangeIndex(len(columns))
+                result = result.astype(dict(enumerate(block_dtypes)))
+                result.columns = columns
+            return result
+
+        to_pandas = frame_mgr_cls.preprocess_func(to_pandas)
+        block_dtypes = [
+            [
+                dtypes[column_positions.index(k)]
+                for k in positions
+                if k in column_positions
+            ]
+            for positions in col_chunks
+        ]
+        parts = np.array(
+            [
+                [
+                    put_func(get_block(batches, positions, chunk_dtypes)).apply(
+                        to_pandas
+                    )
+                    for positions, chunk_dtypes in zip(col_chunks, block_dtypes)
+                ]
+                for batches in row_chunks
+            ]
+        )
+        row_lengths = [
+            sum(batch.num_rows for batch in batches) for batches in row_chunks
+        ]
+        column_widths = [len(positions) for positions in col_chunks]
+        column_widths[0] -= len(index_positions)
+        range_index = [descr for descr in index_columns if isinstance(descr, dict)]
+        if len(index_positions):
+            index = frame_mgr_cls.get_indices(0, parts, lambda df: df.index)
+        elif len(range_index):
+            descr = range_index[0]
+            index = pandas.RangeIndex(
+                descr["start"],
+                descr["start"] + descr["step"] * table.num_rows,
+                descr["step"],
+                name=descr["name"],
+            )
+        else:
+            index = pandas.RangeIndex(table.num_rows)
+        frame = cls.frame_cls(
+            parts,
+            index,
+            meta.columns,
+            row_lengths,
+            column_widths,
+            pandas.Series(dtypes, index=meta.columns),
+        )
+        frame._apply_index_objs()
+        return cls.query_compiler_cls(frame)
+
+    # The name of the file with the metadata of a frame pickled one file per partition.
+    PICKLE_MANIFEST = "manifest.pkl"
+    PICKLE_FORMAT_VERSION = 1
+
+    @classmethod
+    def to_pickle_distributed(cls, qc, path, compression="infer", protocol=4):
+        """Pickle a frame into a directory, one file per partition.
+
+        Every partition is pickled into its own file by the task that holds it, so
+        the frame is never collected. The manifest with the labels, the partition
+        shapes and the data types is written last, once every partition is written.
+
+        Args:
+            qc: The query compiler of the frame to pickle.
+            path: The directory to write the files to. It is created if it does not
+                exist.
+            compression: The compression of the partition files, as in
+                `pandas.to_pickle`. "infer" writes them uncompressed.
+            protocol: The pickle protocol to use.
+        """
+        if compression == "infer":
+            compression = None
+        os.makedirs(path, exist_ok=True)
+        manifest = cls._get_partition_manifest(qc)
+        frame = qc._modin_frame
+
+        def write_partition(df, file_path):
+            df.to_pickle(file_path, compression=compression, protocol=protocol)
+            return pandas.DataFrame()
+
+        files = [
+            ["part-{}-{}.pkl".format(i, j) for j in range(frame._partitions.shape[1])]
+            for i in range(frame._partitions.shape[0])
+        ]
+        written = np.array(
+            [
+                [
+                    part.apply(write_partition, file_path=os.path.join(path, name))
+                    for part, name in zip(row, row_files)
+                ]
+                for row, row_files in zip(frame._partitions, files)
+            ]
+        )
+        # blocking operation
+        frame._frame_mgr_cls.to_pandas(written)
+        manifest.update(files=files, compression=compression)
+        with open(os.path.join(path, cls.PICKLE_MANIFEST), "wb") as f:
+            pickle.dump(manifest, f, protocol=protocol)
+
+    @classmethod
+    def read_pickle_distributed(cls, path):
+        """Load a frame pickled with `to_pickle_distributed`.
+
+        Every partition is loaded from its file by a separate task.
+
+        Args:
+            path: The directory the frame was pickled to.
+
+        Returns:
+            A new query compiler.
+        """
+        with open(os.path.join(path, cls.PICKLE_MANIFEST), "rb") as f:
+            manifest = pickle.load(f)
+        compression = manifest["compression"]
+
+        def read_partition(df, file_path):
+            return pandas.read_pickle(file_path, compression=compression)
+
+        empty = cls.frame_cls._frame_mgr_cls._partition_class.put(pandas.DataFrame())
+        partitions = np.array(
+            [
+                [
+                    empty.apply(read_partition, file_path=os.path.join(path, name))
+                    for name in row_files
+                ]
+                for row_files in manifest["files"]
+            ]
+        )
+        return cls._from_partition_manifest(manifest, partitions)
+
+    @classmethod
+    def get_partitioned_state(cls, qc):
+        """Get the state of a frame that keeps its partitioning, for pickling.
+
+        Args:
+            qc: The query compiler of the frame.
+
+        Returns:
+            A dict with the metadata of the frame and its partitions as pandas
+            DataFrames.
+        """
+        state = cls._get_partition_manifest(qc)
+        state["blocks"] = [
+            [part.to_pandas() for part in row] for row in qc._modin_frame._partitions
+        ]
+        return state
+
+    @classmethod
+    def from_partitioned_state(cls, state):
+        """Build a frame from the state returned by `get_partitioned_state`.
+
+        Args:
+            state: The state of the frame.
+
+        Returns:
+            A new query compiler.
+        """
+        put = cls.frame_cls._frame_mgr_cls._partition_class.put
+        partitions = np.array(
+            [[put(block) for block in row] for row in state["blocks"]]
+        )
+        return cls._from_partition_manifest(state, partitions)
+
+    @classmethod
+    def _get_partition_manifest(cls, qc):
+        frame = qc._modin_frame
+        return {
+            "version": cls.PICKLE_FORMAT_VERSION,
+            "index": frame.index,
+            "columns": frame.columns,
+            "row_lengths": frame._row_lengths,
+            "column_widths": frame._column_widths,
+            "dtypes": frame._dtypes,
+        }
+
+    @classmethod
+    def _from_partition_manifest(cls, manifest, partitions):
+        if manifest["version"] > cls.PICKLE_FORMAT_VERSION:
+            raise ValueError(
+                "Unsupported version {} of the pickled frame".format(
+                    manifest["version"]
+                )
+            )
+        frame = cls.frame_cls(
+            partitions,
+            manifest["index"],
+            manifest["columns"],
+            manifest["row_lengths"],
+            manifest["column_widths"],
+            manifest["dtypes"],
+        )
+        # the partitions may have been pickled before their labels were set
+        frame._apply_index_objs()
+        return cls.query_compiler_cls(frame)
@@ -0,0 +1,119 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+"""Process-wide pool of SQLAlchemy engines shared by the SQL readers.
+
+`pandas.read_sql` builds a new engine, and so a new database connection, every
+time it is given a connection string. Ray and Dask workers are long-lived
+processes, so keeping the engines in a per-process cache lets successive
+partition reads (and successive `read_sql` calls) reuse open connections.
+"""
+
+from contextlib import contextmanager
+import os
+import threading
+import time
+
+
+class SQLConnectionPool(object):
+    """Cache of SQLAlchemy engines keyed by connection URL.
+
+    Args:
+        max_sessions: the maximum number of connections checked out of the pool at
+            the same time in this process. If None, there is no limit.
+        idle_timeout: number of seconds after which an engine which has not been
+            used is disposed, closing its pooled connections.
+    """
+
+    def __init__(self, max_sessions=None, idle_timeout=300):
+        self.idle_timeout = idle_timeout
+        self._lock = threading.Lock()
+        # url -> [engine, number of checked out connections, last time used]
+        self._engines = {}
+        self._sessions = (
+            threading.BoundedSemaphore(max_sessions) if max_sessions else None
+        )
+
+    @contextmanager
+    def connect(self, url):
+        """Check out a connection to `url`, creating the engine if needed.
+
+        Args:
+            url: database string URI.
+
+        Yields:
+            SQLAlchemy Connection that is returned to the pool on exit.
+        """
+        if self._sessions is not None:
+            self._sessions.acquire()
+        try:
+            entry = self._checkout(url)
+            try:
+                with entry[0].connect() as conn:
+                    yield conn
+            finally:
+                with self._lock:
+                    entry[1] -= 1
+                    entry[2] = time.monotonic()
+        finally:
+            if self._sessions is not None:
+                self._sessions.release()
+
+    def dispose(self):
+        """Dispose all the engines which have no connections checked out."""
+        with self._lock:
+            self._evict(lambda entry: entry[1] == 0)
+
+    def _checkout(self, url):
+        from sqlalchemy import create_engine
+
+        with self._lock:
+            now = time.monotonic()
+            self._evict(
+                lambda entry: entry[1] == 0 and now - entry[2] >= self.idle_timeout
+            )
+            entry = self._engines.get(url)
+            if entry is None:
+                entry = self._engines[url] = [create_engine(url), 0, now]
+            entry[1] += 1
+            entry[2] = now
+            return entry
+
+    def _evict(self, predicate):
+        for url in [url for url, entry in self._engines.items() if predicate(entry)]:
+            self._engines.pop(url)[0].dispose()
+
+
+def _env_number(name, default):
+    value = os.environ.get(name, None)
+    return default if value is None else type(default)(value)
+
+
+_pool = SQLConnectionPool(
+    max_sessions=_env_number("MODIN_SQL_MAX_SESSIONS", 0) or None,
+    idle_timeout=_env_number("MODIN_SQL_IDLE_TIMEOUT", 300.0),
+)
+
+
+@contextmanager
+def sql_connection(con):
+    """Yield a pooled connection if `con` is a connection string, `con` otherwise.
+
+    Args:
+        con: SQLAlchemy connectable or database string URI.
+    """
+    if isinstance(con, str):
+        with _pool.connect(con) as conn:
+            yield conn
+    else:
+        yield con
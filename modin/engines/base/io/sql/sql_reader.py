@@ -17,6 +17,7 @@ import pandas
 import warnings
 
 from modin.engines.base.io.file_reader import FileReader
+from modin.engines.base.io.sql.connection_pool import sql_connection
 
 
 class SQLReader(FileReader):
@@ -57,10 +58,13 @@ class SQLReader(FileReader):
             )
             return cls.single_worker_read(sql, con=con, index_col=index_col, **kwargs)
         row_cnt_query = "SELECT COUNT(*) FROM ({}) as foo".format(sql)
-        row_cnt = pandas.read_sql(row_cnt_query, con).squeeze()
-        cols_names_df = pandas.read_sql(
-            "SELECT * FROM ({}) as foo LIMIT 0".format(sql), con, index_col=index_col
-        )
+        with sql_connection(con) as conn:
+            row_cnt = pandas.read_sql(row_cnt_query, conn).squeeze()
+            cols_names_df = pandas.read_sql(
+                "SELECT * FROM ({}) as foo LIMIT 0".format(sql),
+                conn,
+                index_col=index_col,
+            )
         cols_names = cols_names_df.columns
         from modin.pandas import DEFAULT_NPARTITIONS
 
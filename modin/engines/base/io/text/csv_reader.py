@@ -13,14 +13,44 @@
 
 from modin.engines.base.io.text.text_file_reader import TextFileReader
 from modin.data_management.utils import compute_chunksize
+from pandas.core.dtypes.common import is_datetime64_any_dtype, is_list_like
 from pandas.io.parsers import _validate_usecols_arg
 import pandas
 import sys
 
 
 class CSVReader(TextFileReader):
+    @classmethod
+    def _unique_date_columns(cls, parse_dates, names, kwargs):
+        """Find the columns of `parse_dates` that can be parsed by distinct value.
+
+        Args:
+            parse_dates: The `parse_dates` argument of `read_csv`.
+            names: The column names.
+            kwargs: The other arguments of `read_csv`.
+
+        Returns:
+            A list of column names, or None if pandas has to parse the dates.
+        """
+        if (
+            not isinstance(parse_dates, list)
+            or len(parse_dates) == 0
+            or kwargs.get("date_parser") is not None
+            or kwargs.get("index_col") is not None
+            or not isinstance(kwargs.get("dtype"), (dict, type(None)))
+        ):
+            return None
+        names = list(names)
+        if any(
+            is_list_like(c) or c not in names or names.count(c) > 1 for c in parse_dates
+        ):
+            return None
+        return list(parse_dates)
+
     @classmethod
     def _read(cls, filepath_or_buffer, **kwargs):
+        # The arguments as given, in case the file has to be read again.
+        read_kwargs = dict(kwargs)
         if isinstance(filepath_or_buffer, str):
             if not cls.file_exists(filepath_or_buffer):
                 return cls.single_worker_read(filepath_or_buffer, **kwargs)
@@ -93,6 +123,16 @@ class CSVReader(TextFileReader):
             parse_dates=parse_dates,
             usecols=usecols,
         )
+        date_columns = cls._unique_date_columns(parse_dates, names, kwargs)
+        if date_columns is not None:
+            # The date columns are read as strings and converted by the partitions,
+            # parsing every distinct string once.
+            dtype = kwargs.get("dtype")
+            partition_kwargs.update(
+                parse_dates=False,
+                dtype={**(dtype or {}), **{c: object for c in date_columns}},
+                date_columns=date_columns,
+            )
         encoding = kwargs.get("encoding", None)
         quotechar = kwargs.get("quotechar", '"').encode(
             encoding if encoding is not None else "UTF-8"
@@ -204,6 +244,20 @@ class CSVReader(TextFileReader):
             dtypes.index = column_names
         else:
             dtypes = pandas.Series(dtypes, index=column_names)
+        if date_columns is not None:
+            # pandas keeps a column as strings if any of its values cannot be
+            # parsed, while every partition decided for its own rows. The dtypes of
+            # the partitions are combined to object if any of them kept the strings.
+            failed = [c for c in date_columns if not is_datetime64_any_dtype(dtypes[c])]
+            if len(failed) > 0:
+                return cls._read(
+                    filepath_or_buffer,
+                    **dict(
+                        read_kwargs,
+                        parse_dates=[c for c in parse_dates if c not in failed]
+                        or False,
+                    ),
+                )
         new_frame = cls.frame_cls(
             partition_ids,
             new_index,
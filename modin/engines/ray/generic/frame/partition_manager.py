@@ -11,6 +11,8 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 
 from modin.engines.base.frame.partition_manager import BaseFrameManager
@@ -21,6 +23,46 @@ import ray
 class RayFrameManager(BaseFrameManager):
     """This method implements the interface in `BaseFrameManager`."""
 
+    @classmethod
+    def _put_blocks(cls, blocks):
+        """Put the blocks of a pandas DataFrame into partitions from a pool of threads.
+
+        Ray serializes every block into the object store as it is put, so the
+        views are not copied first.
+
+        Args:
+            blocks: A 2D list of the blocks.
+
+        Returns:
+            A 2D list of partitions.
+        """
+        put_func = cls._partition_class.put
+        with ThreadPoolExecutor(max_workers=cls._compute_num_partitions()) as pool:
+            futures = [
+                [pool.submit(put_func, block) for block in row] for row in blocks
+            ]
+        return [[future.result() for future in row] for row in futures]
+
+    @classmethod
+    def _iter_blocks(cls, partitions):
+        """Retrieve the blocks of the partitions in the order they are computed.
+
+        Returns:
+            A generator of the row position, the column position and the block of
+            every partition.
+        """
+        positions = {}
+        for i, row in enumerate(partitions):
+            for j, part in enumerate(row):
+                part.drain_call_queue()
+                positions.setdefault(part.oid, []).append((i, j))
+        pending = list(positions)
+        while len(pending):
+            ready, pending = ray.wait(pending, num_returns=1)
+            block = ray.get(ready[0])
+            for i, j in positions[ready[0]]:
+                yield i, j, block
+
     @classmethod
     def to_numpy(cls, partitions):
         """Convert this object into a NumPy array from the partitions.
@@ -11,6 +11,9 @@
 # ANY KIND, either express or implied. See the License for the specific language
 # governing permissions and limitations under the License.
 
+import uuid
+import warnings
+
 import pandas
 
 from modin.engines.base.io import BaseIO
@@ -18,12 +21,28 @@ from modin.engines.base.io import BaseIO
 
 class RayIO(BaseIO):
     @classmethod
-    def to_sql(cls, qc, **kwargs):
+    def to_sql(cls, qc, max_sessions=None, staging=False, **kwargs):
         """Write records stored in a DataFrame to a SQL database.
+
+        Every row partition inserts its own rows over a separate connection.
+
         Args:
             qc: the query compiler of the DF that we want to run to_sql on
+            max_sessions: the maximum number of simultaneous connections allowed to use.
+                If None, all row partitions are written at once.
+            staging: write the rows into a temporary staging table first and move them
+                into the target table in a single transaction once every partition is
+                written, so readers never observe a partially written table.
             kwargs: parameters for pandas.to_sql(**kwargs)
         """
+        if not isinstance(kwargs["con"], str):
+            warnings.warn(
+                "To use parallel implementation of `to_sql`, pass the database URI "
+                "string instead of {}.".format(type(kwargs["con"]))
+            )
+            return BaseIO.to_sql(qc, **kwargs)
+        if max_sessions is not None and max_sessions < 1:
+            raise ValueError("max_sessions must be a positive integer")
         # we first insert an empty DF in order to create the full table in the database
         # This also helps to validate the input against pandas
         # we would like to_sql() to complete only when all rows have been inserted into the database
@@ -31,6 +50,14 @@ class RayIO(BaseIO):
         # so at the end, the blocking operation will be this empty DF to_pandas
 
         empty_df = qc.getitem_row_array([0]).to_pandas().head(0)
+        if staging:
+            name, if_exists = kwargs["name"], kwargs.get("if_exists", "fail")
+            if if_exists == "fail" and cls._sql_has_table(
+                kwargs["con"], name, kwargs.get("schema")
+            ):
+                raise ValueError("Table '{}' already exists.".format(name))
+            kwargs["name"] = "{}_staging_{}".format(name, uuid.uuid4().hex[:8])
+            kwargs["if_exists"] = "fail"
         empty_df.to_sql(**kwargs)
         # so each partition will append its respective DF
         kwargs["if_exists"] = "append"
@@ -41,6 +68,98 @@ class RayIO(BaseIO):
             df.to_sql(**kwargs)
             return pandas.DataFrame()
 
-        result = qc._modin_frame._apply_full_axis(1, func, new_index=[], new_columns=[])
-        # blocking operation
-        result.to_pandas()
+        frame_mgr_cls = qc._modin_frame._frame_mgr_cls
+        partitions = qc._modin_frame._partitions
+        # every row partition opens its own connection, so limiting the number of
+        # row partitions written at once limits the number of open sessions
+        step = len(partitions) if max_sessions is None else max_sessions
+        try:
+            for start in range(0, len(partitions), step):
+                result = frame_mgr_cls.map_axis_partitions(
+                    1, partitions[start : start + step], func, keep_partitioning=True
+                )
+                # blocking operation
+                frame_mgr_cls.to_pandas(result)
+            if staging:
+                cls._swap_staging_table(
+                    kwargs["con"],
+                    kwargs["name"],
+                    name,
+                    kwargs.get("schema"),
+                    if_exists,
+                    empty_df.columns,
+                )
+        except Exception:
+            if staging:
+                cls._drop_sql_table(kwargs["con"], kwargs["name"], kwargs.get("schema"))
+            raise
+
+    @staticmethod
+    def _sql_has_table(con, name, schema=None):
+        import sqlalchemy as sa
+
+        engine = sa.create_engine(con)
+        try:
+            with engine.connect() as conn:
+                return engine.dialect.has_table(conn, name, schema=schema)
+        finally:
+            engine.dispose()
+
+    @staticmethod
+    def _drop_sql_table(con, name, schema=None):
+        import sqlalchemy as sa
+
+        engine = sa.create_engine(con)
+        try:
+            table = sa.Table(name, sa.MetaData(), schema=schema)
+            with engine.begin() as conn:
+                table.drop(conn, checkfirst=True)
+        finally:
+            engine.dispose()
+
+    @staticmethod
+    def _swap_staging_table(con, staging_name, name, schema, if_exists, columns):
+        """Move the rows of a fully written staging table into the target table.
+
+        The move happens in one transaction: with `if_exists="append"` the rows are
+        copied into the existing table, otherwise the target is dropped (if present)
+        and the staging table is renamed in its place. Atomicity relies on the
+        database supporting transactional DDL (e.g. SQLite, PostgreSQL).
+        """
+        import sqlalchemy as sa
+
+        engine = sa.create_engine(con)
+        preparer = engine.dialect.identifier_preparer
+
+        def qualified(table):
+            if schema is None:
+                return preparer.quote(table)
+            return "{}.{}".format(preparer.quote_schema(schema), preparer.quote(table))
+
+        try:
+            with engine.begin() as conn:
+                exists = engine.dialect.has_table(conn, name, schema=schema)
+                if exists and if_exists == "append":
+                    column_list = ", ".join(preparer.quote(str(c)) for c in columns)
+                    conn.execute(
+                        sa.text(
+                            "INSERT INTO {0} ({2}) SELECT {2} FROM {1}".format(
+                                qualified(name), qualified(staging_name), column_list
+                            )
+                        )
+                    )
+                    conn.execute(
+                        sa.text("DROP TABLE {}".format(qualified(staging_name)))
+                    )
+                else:
+                    if exists:
+                        conn.execute(sa.text("DROP TABLE {}".format(qualified(name))))
+                    conn.execute(
+                        sa.text(
+                            "ALTER TABLE {} RENAME TO {}".format(
+                                qualified(staging_name), preparer.quote(name)
+                            )
+                        )
+                    )
+        finally:
+            engine.dispose()
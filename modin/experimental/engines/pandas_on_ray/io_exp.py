@@ -181,17 +181,19 @@ def _read_sql_with_offset_pandas_on_ray(
     """
 
     from .sql import query_put_bounders
+    from modin.engines.base.io.sql.connection_pool import sql_connection
 
     query_with_bounders = query_put_bounders(sql, partition_column, start, end)
-    pandas_df = pandas.read_sql(
-        query_with_bounders,
-        con,
-        index_col=index_col,
-        coerce_float=coerce_float,
-        params=params,
-        parse_dates=parse_dates,
-        columns=columns,
-        chunksize=chunksize,
-    )
+    with sql_connection(con) as conn:
+        pandas_df = pandas.read_sql(
+            query_with_bounders,
+            conn,
+            index_col=index_col,
+            coerce_float=coerce_float,
+            params=params,
+            parse_dates=parse_dates,
+            columns=columns,
+            chunksize=chunksize,
+        )
     index = len(pandas_df)
     return _split_result_for_readers(1, num_splits, pandas_df) + [index]
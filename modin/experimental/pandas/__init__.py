@@ -19,7 +19,22 @@ os.environ["MODIN_EXPERIMENTAL"] = "True"
 # in the user code
 from .numpy_wrap import _CAUGHT_NUMPY  # noqa F401
 from modin.pandas import *  # noqa F401, F403
-from .io_exp import read_sql  # noqa F401
+from .io_exp import (  # noqa F401
+    read_sql,
+    to_sql,
+    read_pickle_distributed,
+    to_pickle_distributed,
+    from_arrow,
+    to_arrow,
+    to_arrow_ipc,
+)
+from .approx import (  # noqa F401
+    approx_quantile,
+    approx_median,
+    approx_describe,
+    approx_nunique,
+)
+from .partitions import map_partitions, reduce_partitions, vectorized  # noqa F401
 import warnings
 
 
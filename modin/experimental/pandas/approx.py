@@ -0,0 +1,140 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+import numpy as np
+from pandas.core.dtypes.common import is_list_like
+
+from . import DataFrame, Series
+from modin.backends.pandas.sketches import DEFAULT_COMPRESSION, DEFAULT_PRECISION
+from modin.pandas.groupby import DataFrameGroupBy
+
+
+def _validate_percentiles(q):
+    if any(not 0 <= value <= 1 for value in q):
+        raise ValueError(
+            "percentiles should all be in the interval [0, 1]. "
+            "Try {} instead.".format(np.array(q) / 100.0)
+        )
+
+
+def approx_quantile(obj, q=0.5, compression=DEFAULT_COMPRESSION):
+    """ Estimate quantiles over the rows in a single parallel pass.
+
+    The values of every column are summarized per partition with a mergeable
+    t-digest, and the digests are merged to estimate the quantiles. Missing values
+    are ignored and non-numeric columns are dropped.
+
+    Args:
+        obj: Modin DataFrame or Series.
+        q: A float or array of floats between 0 and 1, the quantiles to compute.
+        compression: The accuracy of the estimate. The memory used per column and
+                     partition grows linearly with it and the error decreases
+                     linearly with it.
+
+    Returns:
+        The same type as `DataFrame.quantile` or `Series.quantile` would return.
+    """
+    scalar = not is_list_like(q)
+    qs = [q] if scalar else list(q)
+    _validate_percentiles(qs)
+    query_compiler = obj._query_compiler.approx_quantile(qs, compression)
+    if isinstance(obj, Series):
+        result = Series(query_compiler=query_compiler)
+        if scalar:
+            return result.iloc[0]
+        result.name = obj.name
+        return result
+    result = DataFrame(query_compiler=query_compiler)
+    return result.iloc[0] if scalar else result
+
+
+def approx_median(obj, compression=DEFAULT_COMPRESSION):
+    """ Estimate the median over the rows in a single parallel pass.
+
+    Args:
+        obj: Modin DataFrame or Series.
+        compression: The accuracy of the estimate (see `approx_quantile`).
+
+    Returns:
+        The same type as `DataFrame.median` or `Series.median` would return.
+    """
+    result = approx_quantile(obj, 0.5, compression)
+    if isinstance(obj, DataFrame):
+        result.name = None
+    return result
+
+
+def approx_describe(obj, percentiles=None, compression=DEFAULT_COMPRESSION):
+    """ Describe the numeric columns in a single parallel pass.
+
+    The count, mean, std, min and max are exact, the percentiles are estimated
+    with mergeable t-digests (see `approx_quantile`).
+
+    Args:
+        obj: Modin DataFrame or Series.
+        percentiles: The percentiles to include in the output, the median is always
+                     included.
+        compression: The accuracy of the estimated percentiles.
+
+    Returns:
+        The same type as `DataFrame.describe` or `Series.describe` would return.
+    """
+    if percentiles is None:
+        percentiles = [0.25, 0.5, 0.75]
+    else:
+        percentiles = list(percentiles)
+        _validate_percentiles(percentiles)
+        if 0.5 not in percentiles:
+            percentiles.append(0.5)
+    unique_percentiles = np.unique(percentiles)
+    if len(unique_percentiles) < len(percentiles):
+        raise ValueError("percentiles cannot contain duplicates")
+    query_compiler = obj._query_compiler.approx_describe(
+        unique_percentiles, compression
+    )
+    if isinstance(obj, Series):
+        result = Series(query_compiler=query_compiler)
+        result.name = obj.name
+        return result
+    return DataFrame(query_compiler=query_compiler)
+
+
+def approx_nunique(obj, dropna=True, precision=DEFAULT_PRECISION):
+    """ Estimate the number of distinct values in a single parallel pass.
+
+    The values of every column are summarized per partition with a HyperLogLog
+    sketch, and the sketches are merged to estimate the number of distinct values.
+    Groupby objects merge the sketches of every group in the reduce phase.
+
+    Args:
+        obj: Modin DataFrame, Series, DataFrameGroupBy or SeriesGroupBy.
+        dropna: Don't include NaN in the counts.
+        precision: The number of hash bits that select a register of the sketches.
+                   The sketches use `2 ** precision` bytes per column and partition
+                   and the relative error is about `1.04 / sqrt(2 ** precision)`.
+
+    Returns:
+        The same type as the `nunique` method of `obj` would return.
+    """
+    if isinstance(obj, DataFrameGroupBy):
+        return obj._wrap_aggregation(
+            type(obj._query_compiler).groupby_approx_nunique,
+            lambda df, **kwargs: df.nunique(dropna=dropna),
+            drop=False,
+            numeric_only=False,
+            dropna=dropna,
+            precision=precision,
+        )
+    return obj._reduce_dimension(
+        obj._query_compiler.approx_nunique(dropna=dropna, precision=precision)
+    )
@@ -68,3 +68,167 @@ def read_sql(
     ), "This only works in experimental mode"
     _, _, _, kwargs = inspect.getargvalues(inspect.currentframe())
     return DataFrame(query_compiler=EngineDispatcher.read_sql(**kwargs))
+
+
+def to_sql(
+    df,
+    name,
+    con,
+    schema=None,
+    if_exists="fail",
+    index=True,
+    index_label=None,
+    chunksize=None,
+    dtype=None,
+    method=None,
+    max_sessions=None,
+    staging=False,
+):
+    """ Write records stored in a DataFrame to a SQL database, one connection per row partition.
+
+    Args:
+        df: Modin DataFrame or Series to write.
+        name: Name of SQL table.
+        con: Database string URI; other connectables fall back to a single writer.
+        schema: Specify the schema (if database flavor supports this).
+        if_exists: How to behave if the table already exists: {'fail', 'replace', 'append'}.
+        index: Write DataFrame index as a column.
+        index_label: Column label for index column(s).
+        chunksize: Number of rows in each batch to be written at a time by every writer.
+        dtype: Specifying the datatype for columns.
+        method: Controls the SQL insertion clause used: None (executemany), 'multi'
+                (multiple values in a single INSERT clause) or a callable.
+        max_sessions: the maximum number of simultaneous connections allowed to use
+        staging: write the rows into a staging table and move them into `name` in a
+                 single transaction once all partitions are written.
+    """
+    assert (
+        os.environ.get("MODIN_EXPERIMENTAL", "").title() == "True"
+    ), "This only works in experimental mode"
+    new_query_compiler = df._query_compiler
+    # writing the index to the database by inserting it to the DF
+    if index:
+        if not index_label:
+            index_label = "index"
+        new_query_compiler = new_query_compiler.insert(0, index_label, df.index)
+        # so pandas._to_sql will not write the index to the database as well
+        index = False
+
+    EngineDispatcher.to_sql(
+        new_query_compiler,
+        name=name,
+        con=con,
+        schema=schema,
+        if_exists=if_exists,
+        index=index,
+        index_label=index_label,
+        chunksize=chunksize,
+        dtype=dtype,
+        method=method,
+        max_sessions=max_sessions,
+        staging=staging,
+    )
+
+
+def to_pickle_distributed(obj, path, compression="infer", protocol=4):
+    """ Pickle a DataFrame into a directory, one file per partition.
+
+    The partitions are written in parallel and the frame is never collected, so it
+    can be loaded back with `read_pickle_distributed` in parallel too.
+
+    Args:
+        obj: Modin DataFrame to pickle.
+        path: Directory to write the manifest and the partition files to.
+        compression: Compression of the partition files: {'infer', 'gzip', 'bz2',
+                     'zip', 'xz', None}. 'infer' writes them uncompressed.
+        protocol: Pickle protocol to use.
+    """
+    assert (
+        os.environ.get("MODIN_EXPERIMENTAL", "").title() == "True"
+    ), "This only works in experimental mode"
+    if not isinstance(obj, DataFrame):
+        raise TypeError(
+            "to_pickle_distributed only supports Modin DataFrames, not {}".format(
+                type(obj)
+            )
+        )
+    EngineDispatcher.to_pickle_distributed(
+        obj._query_compiler, path, compression=compression, protocol=protocol
+    )
+
+
+def read_pickle_distributed(path):
+    """ Load a DataFrame pickled with `to_pickle_distributed`.
+
+    Every partition is loaded from its own file in parallel.
+
+    Args:
+        path: Directory the DataFrame was pickled to.
+
+    Returns:
+        Modin DataFrame.
+    """
+    assert (
+        os.environ.get("MODIN_EXPERIMENTAL", "").title() == "True"
+    ), "This only works in experimental mode"
+    return DataFrame(query_compiler=EngineDispatcher.read_pickle_distributed(path=path))
+
+
+def from_arrow(table):
+    """ Convert a pyarrow Table to a DataFrame without converting it in the driver.
+
+    The record batches of the table are split into partitions without a copy and
+    every partition is converted to pandas in parallel.
+
+    Args:
+        table: pyarrow Table to convert.
+
+    Returns:
+        Modin DataFrame.
+    """
+    assert (
+        os.environ.get("MODIN_EXPERIMENTAL", "").title() == "True"
+    ), "This only works in experimental mode"
+    return DataFrame(query_compiler=EngineDispatcher.from_arrow(table))
+
+
+def to_arrow(df):
+    """ Convert a DataFrame to a pyarrow Table, one row partition at a time.
+
+    Every row partition is converted to record batches in parallel and the Table is
+    assembled from the batches without a copy.
+
+    Args:
+        df: Modin DataFrame to convert.
+
+    Returns:
+        pyarrow Table.
+    """
+    assert (
+        os.environ.get("MODIN_EXPERIMENTAL", "").title() == "True"
+    ), "This only works in experimental mode"
+    if not isinstance(df, DataFrame):
+        raise TypeError(
+            "to_arrow only supports Modin DataFrames, not {}".format(type(df))
+        )
+    return EngineDispatcher.to_arrow(df._query_compiler)
+
+
+def to_arrow_ipc(df, path):
+    """ Write a DataFrame to an Arrow IPC file, one row partition at a time.
+
+    Every row partition is converted to record batches in parallel and the batches
+    are written to the file in order, so the DataFrame is never collected.
+
+    Args:
+        df: Modin DataFrame to write.
+        path: Path of the file to write to.
+    """
+    assert (
+        os.environ.get("MODIN_EXPERIMENTAL", "").title() == "True"
+    ), "This only works in experimental mode"
+    if not isinstance(df, DataFrame):
+        raise TypeError(
+            "to_arrow_ipc only supports Modin DataFrames, not {}".format(type(df))
+        )
+    EngineDispatcher.to_arrow_ipc(df._query_compiler, path)
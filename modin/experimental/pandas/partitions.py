@@ -0,0 +1,125 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+import pandas
+from pandas.api.types import pandas_dtype
+
+from . import DataFrame
+
+
+def _meta_dtypes(meta):
+    """Convert the declared output of a partition function to a Series of dtypes."""
+    if isinstance(meta, pandas.DataFrame):
+        return meta.dtypes
+    if isinstance(meta, pandas.Series):
+        return meta.map(pandas_dtype)
+    meta = dict(meta)
+    return pandas.Series(
+        [pandas_dtype(dtype) for dtype in meta.values()],
+        index=pandas.Index(list(meta.keys())),
+        dtype=object,
+    )
+
+
+def vectorized(func):
+    """ Mark a function as operating on whole blocks of rows at once.
+
+    `DataFrame.apply(func, axis=1)` then calls `func` once per row partition with a
+    2-D NumPy array of its rows instead of once per row. `func` must return a 1-D
+    array with one value per row, or a 2-D array of the same shape as its input.
+
+    Args:
+        func: The function to mark.
+
+    Returns:
+        `func` itself.
+    """
+    func._modin_vectorized = True
+    return func
+
+
+def map_partitions(
+    df,
+    func,
+    *args,
+    meta=None,
+    preserve_index=False,
+    with_partition_info=False,
+    **kwargs
+):
+    """ Apply a vectorized function to the pandas DataFrame of every row partition.
+
+    Args:
+        df: Modin DataFrame.
+        func: The function to apply. It is called with a pandas DataFrame holding all
+              of the columns of a row partition, `args` and `kwargs`, and must return a
+              pandas DataFrame (a Series is converted to a single column).
+        meta: The columns and dtypes of the result, as an empty pandas DataFrame, a
+              Series of dtypes indexed by column or a dict/list of (column, dtype)
+              pairs. When provided, the columns and dtypes of the result are not
+              computed from the partitions.
+        preserve_index: Whether `func` keeps the index of every row partition (e.g. it
+                        only adds or transforms columns). The index of the result is
+                        then not computed from the partitions.
+        with_partition_info: Pass a `partition_info` keyword argument to `func`, a dict
+                             with the `number` of the row partition, the position of
+                             its first row (`start`) and the total number of row
+                             partitions (`npartitions`).
+
+    Returns:
+        Modin DataFrame.
+    """
+    dtypes = None if meta is None else _meta_dtypes(meta)
+
+    def partition_func(partition, **info):
+        result = func(partition, *args, **info, **kwargs)
+        return result.to_frame() if isinstance(result, pandas.Series) else result
+
+    partition_func.__name__ = getattr(func, "__name__", "partition_func")
+    return DataFrame(
+        query_compiler=df._query_compiler.map_partitions(
+            partition_func,
+            new_columns=None if dtypes is None else dtypes.index,
+            dtypes=dtypes,
+            preserve_index=preserve_index,
+            with_partition_info=with_partition_info,
+        )
+    )
+
+
+def reduce_partitions(df, map_func, reduce_func=None, split_every=8):
+    """ Reduce a DataFrame with a tree of tasks over its row partitions.
+
+    `map_func` is applied to the pandas DataFrame of every row partition. The results
+    are concatenated along the rows `split_every` at a time and reduced with
+    `reduce_func`, repeatedly, until a single result remains.
+
+    Args:
+        df: Modin DataFrame.
+        map_func: The function to apply to every row partition. Returns a pandas
+                  DataFrame or Series.
+        reduce_func: The function that reduces the concatenated results of `map_func`
+                     or of itself. Defaults to `map_func`.
+        split_every: The number of results to reduce in every task.
+
+    Returns:
+        Modin DataFrame, or Modin Series if the reduction returns a Series.
+    """
+    if reduce_func is None:
+        reduce_func = map_func
+    if split_every < 2:
+        raise ValueError("split_every must be at least 2")
+    query_compiler = df._query_compiler.tree_reduce(map_func, reduce_func, split_every)
+    if query_compiler.index.equals(pandas.Index(["__reduced__"])):
+        return df._reduce_dimension(query_compiler)
+    return DataFrame(query_compiler=query_compiler)
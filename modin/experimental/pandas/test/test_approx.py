@@ -0,0 +1,112 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+import numpy as np
+import pandas
+import pytest
+import modin.experimental.pandas as pd
+from modin.pandas.test.utils import df_equals, df_almost_equals
+
+pd.DEFAULT_NPARTITIONS = 4
+
+
+def _large_frame():
+    random_state = np.random.RandomState(42)
+    df = pandas.DataFrame(
+        {
+            "normal": random_state.randn(2 ** 15),
+            "exponential": random_state.exponential(size=2 ** 15),
+            "int": random_state.randint(-1000, 1000, size=2 ** 15),
+            "str": ["a", "b"] * 2 ** 14,
+        }
+    )
+    df.iloc[::5, 0] = np.nan
+    return df
+
+
+def test_approx_quantile_small_is_exact():
+    pandas_df = pandas.DataFrame(
+        {"a": [3.0, 1.0, 2.0, np.nan, 10.0, 4.0], "b": [1, 2, 3, 4, 5, 6]}
+    )
+    modin_df = pd.DataFrame(pandas_df)
+    q = [0, 0.1, 0.3, 0.5, 0.95, 1]
+    df_almost_equals(pd.approx_quantile(modin_df, q), pandas_df.quantile(q))
+    df_equals(pd.approx_median(modin_df), pandas_df.median())
+    df_equals(pd.approx_quantile(modin_df["a"], 0.3), pandas_df["a"].quantile(0.3))
+    df_equals(pd.approx_quantile(modin_df["b"], q), pandas_df["b"].quantile(q))
+
+
+@pytest.mark.parametrize("compression", [50, 200])
+def test_approx_quantile_rank_error(compression):
+    pandas_df = _large_frame()
+    modin_df = pd.DataFrame(pandas_df)
+    q = [0.001, 0.01, 0.25, 0.5, 0.75, 0.99, 0.999]
+    result = pd.approx_quantile(modin_df, q, compression=compression)
+    assert list(result.columns) == ["normal", "exponential", "int"]
+    for col in result.columns:
+        values = np.sort(pandas_df[col].dropna().values)
+        ranks = np.searchsorted(values, result[col].values) / len(values)
+        np.testing.assert_allclose(ranks, q, atol=5.0 / compression)
+
+
+def test_approx_describe():
+    pandas_df = _large_frame()
+    modin_df = pd.DataFrame(pandas_df)
+    percentiles = [0.05, 0.25, 0.75]
+    modin_result = pd.approx_describe(modin_df, percentiles=percentiles)
+    pandas_result = pandas_df.describe(percentiles=percentiles)
+    df_equals(modin_result.index, pandas_result.index)
+    df_equals(modin_result.columns, pandas_result.columns)
+    exact = ["count", "mean", "std", "min", "max"]
+    df_almost_equals(modin_result.loc[exact], pandas_result.loc[exact])
+    value_range = (pandas_result.loc["max"] - pandas_result.loc["min"]).values
+    np.testing.assert_allclose(
+        modin_result.drop(exact).values / value_range,
+        pandas_result.drop(exact).values / value_range,
+        atol=0.01,
+    )
+    df_equals(
+        pd.approx_describe(modin_df["str"]), pandas_df["str"].describe(),
+    )
+
+    with pytest.raises(ValueError):
+        pd.approx_describe(modin_df, percentiles=[5])
+
+
+@pytest.mark.parametrize("dropna", [True, False])
+def test_approx_nunique(dropna):
+    pandas_df = _large_frame()
+    pandas_df["id"] = np.random.RandomState(0).randint(0, 10 ** 9, len(pandas_df))
+    modin_df = pd.DataFrame(pandas_df)
+    modin_result = pd.approx_nunique(modin_df, dropna=dropna)
+    pandas_result = pandas_df.nunique(dropna=dropna)
+    np.testing.assert_allclose(modin_result.values, pandas_result.values, rtol=0.03)
+    df_equals(modin_result.index, pandas_result.index)
+    assert pd.approx_nunique(modin_df["str"], dropna=dropna) == pandas_df[
+        "str"
+    ].nunique(dropna=dropna)
+
+
+def test_approx_nunique_groupby():
+    pandas_df = _large_frame()
+    pandas_df["key"] = np.arange(len(pandas_df)) % 3
+    modin_df = pd.DataFrame(pandas_df)
+    modin_result = pd.approx_nunique(modin_df.groupby("key"))
+    pandas_result = pandas_df.groupby("key").nunique()
+    df_equals(modin_result.index, pandas_result.index)
+    df_equals(modin_result.columns, pandas_result.columns)
+    np.testing.assert_allclose(modin_result.values, pandas_result.values, rtol=0.03)
+    df_equals(
+        pd.approx_nunique(modin_df.groupby("key")["str"]),
+        pandas_df.groupby("key")["str"].nunique(),
+    )
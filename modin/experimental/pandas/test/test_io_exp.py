@@ -12,6 +12,8 @@
 # governing permissions and limitations under the License.
 
 import os
+import shutil
+import numpy as np
 import pandas
 import pytest
 import modin.experimental.pandas as pd
@@ -62,3 +64,165 @@ def test_from_sql_defaults(make_sql_connection):  # noqa: F811
 
     df_equals(modin_df_from_query, pandas_df)
     df_equals(modin_df_from_table, pandas_df)
+
+
+@pytest.mark.skipif(
+    os.environ.get("MODIN_ENGINE", "Ray").title() == "Dask",
+    reason="Dask does not have experimental API",
+)
+@pytest.mark.parametrize("staging", [False, True])
+@pytest.mark.parametrize("if_exists", ["replace", "append"])
+def test_to_sql_distributed(make_sql_connection, staging, if_exists):  # noqa: F811
+    filename = "test_to_sql_distributed.db"
+    table = "test_to_sql_distributed"
+    conn = make_sql_connection(filename)
+    data = {"col1": list(range(64)), "col2": [float(i) / 2 for i in range(64)]}
+    pandas_df = pandas.DataFrame(data)
+    modin_df = pd.DataFrame(data)
+    # pre-existing table which is either replaced or appended to
+    pandas_df.head(3).to_sql(table, conn, index=False)
+    pd.to_sql(
+        modin_df,
+        table,
+        conn,
+        if_exists=if_exists,
+        index=False,
+        method="multi",
+        max_sessions=2,
+        staging=staging,
+    )
+    if if_exists == "append":
+        pandas_df = pandas.concat([pandas_df.head(3), pandas_df], ignore_index=True)
+
+    df_equals(pandas.read_sql(table, conn), pandas_df)
+    with pytest.raises(ValueError):
+        pd.to_sql(modin_df, table, conn, if_exists="fail", staging=staging)
+
+
+@pytest.mark.skipif(
+    os.environ.get("MODIN_ENGINE", "Ray").title() == "Dask",
+    reason="Dask does not have experimental API",
+)
+@pytest.mark.parametrize("compression", ["infer", "gzip"])
+def test_pickle_distributed(compression):
+    path = "test_pickle_distributed"
+    data = {
+        "col{}".format(i): np.arange(256) * i if i % 2 else np.arange(256).astype(str)
+        for i in range(40)
+    }
+    pandas_df = pandas.DataFrame(data, index=pandas.date_range("2020", periods=256))
+    modin_df = pd.DataFrame(pandas_df)
+    try:
+        pd.to_pickle_distributed(modin_df, path, compression=compression)
+        partitions = modin_df._query_compiler._modin_frame._partitions
+        assert len(os.listdir(path)) == partitions.size + 1
+        result = pd.read_pickle_distributed(path)
+        df_equals(result, pandas_df)
+        assert result._query_compiler._modin_frame._partitions.shape == partitions.shape
+    finally:
+        shutil.rmtree(path, ignore_errors=True)
+
+    with pytest.raises(TypeError):
+        pd.to_pickle_distributed(modin_df["col1"], path)
+
+
+@pytest.mark.skipif(
+    os.environ.get("MODIN_ENGINE", "Ray").title() == "Dask",
+    reason="Dask does not have experimental API",
+)
+@pytest.mark.parametrize("index", [None, "col1", ["col1", "col2"]])
+def test_arrow(index):
+    import pyarrow as pa
+
+    data = {
+        "col{}".format(i): np.arange(256) * i if i % 2 else np.arange(256).astype(str)
+        for i in range(40)
+    }
+    data["col_categorical"] = pandas.Categorical(np.arange(256) % 3)
+    data["col_nulls"] = [None] * 128 + ["a"] * 128
+    data["col_tz"] = pandas.date_range("2020", periods=256, tz="US/Eastern")
+    pandas_df = pandas.DataFrame(data)
+    if index is not None:
+        pandas_df = pandas_df.set_index(index)
+    table = pa.Table.from_pandas(pandas_df)
+
+    for batches in [table, pa.Table.from_batches(table.to_batches(100))]:
+        modin_df = pd.from_arrow(batches)
+        df_equals(modin_df, pandas_df)
+        assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+
+    result = pd.to_arrow(pd.DataFrame(pandas_df))
+    assert result.equals(table)
+    assert result.schema.metadata == table.schema.metadata
+    df_equals(result.to_pandas(), pandas_df)
+
+    with pytest.raises(TypeError):
+        pd.to_arrow(pd.DataFrame(pandas_df)["col3"])
+
+
+@pytest.mark.skipif(
+    os.environ.get("MODIN_ENGINE", "Ray").title() == "Dask",
+    reason="Dask does not have experimental API",
+)
+@pytest.mark.parametrize("index", [None, "col1"])
+def test_to_arrow_ipc(index):
+    import pyarrow as pa
+
+    path = "test_to_arrow_ipc.arrow"
+    data = {
+        "col{}".format(i): np.arange(256) * i if i % 2 else np.arange(256).astype(str)
+        for i in range(40)
+    }
+    data["col_nulls"] = [None] * 128 + ["a"] * 128
+    data["col_tz"] = pandas.date_range("2020", periods=256, tz="US/Eastern")
+    pandas_df = pandas.DataFrame(data)
+    if index is not None:
+        pandas_df = pandas_df.set_index(index)
+    modin_df = pd.DataFrame(pandas_df)
+    try:
+        pd.to_arrow_ipc(modin_df, path)
+        reader = pa.ipc.open_file(path)
+        partitions = modin_df._query_compiler._modin_frame._partitions
+        assert reader.num_record_batches == partitions.shape[0]
+        table = reader.read_all()
+        assert table.equals(pa.Table.from_pandas(pandas_df))
+        df_equals(table.to_pandas(), pandas_df)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+    # the dictionaries of categorical columns are written with the whole frame
+    pandas_df["col_categorical"] = pandas.Categorical(np.arange(256) % 3)
+    try:
+        with pytest.warns(UserWarning):
+            pd.to_arrow_ipc(pd.DataFrame(pandas_df), path)
+        df_equals(pa.ipc.open_file(path).read_pandas(), pandas_df)
+    finally:
+        if os.path.exists(path):
+            os.remove(path)
+
+    with pytest.raises(TypeError):
+        pd.to_arrow_ipc(modin_df["col3"], path)
+
+
+@pytest.mark.skipif(
+    os.environ.get("MODIN_ENGINE", "Ray").title() == "Dask",
+    reason="Dask does not have experimental API",
+)
+def test_from_arrow_nulls_after_first_row():
+    import pyarrow as pa
+
+    table = pa.Table.from_pydict(
+        {
+            "col_int": pa.array(list(range(255)) + [None], pa.int64()),
+            "col_bool": pa.array([True] * 255 + [None], pa.bool_()),
+            "col_str": pa.array(["a"] * 256),
+        }
+    )
+    pandas_df = table.to_pandas()
+    modin_df = pd.from_arrow(table)
+    df_equals(modin_df, pandas_df)
+    assert modin_df._query_compiler._modin_frame._partitions.shape[0] > 1
+    assert modin_df.dtypes.equals(pandas_df.dtypes)
+    assert modin_df._to_pandas().dtypes.equals(pandas_df.dtypes)
+    assert modin_df["col_bool"].iloc[-1] is None
@@ -0,0 +1,96 @@
+# Licensed to Modin Development Team under one or more contributor license agreements.
+# See the NOTICE file distributed with this work for additional information regarding
+# copyright ownership.  The Modin Development Team licenses this file to you under the
+# Apache License, Version 2.0 (the "License"); you may not use this file except in
+# compliance with the License.  You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software distributed under
+# the License is distributed on an "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF
+# ANY KIND, either express or implied. See the License for the specific language
+# governing permissions and limitations under the License.
+
+import numpy as np
+import pandas
+import pytest
+import modin.experimental.pandas as pd
+from modin.pandas.test.utils import df_equals
+
+pd.DEFAULT_NPARTITIONS = 4
+
+pandas_df = pandas.DataFrame(
+    {"a": np.arange(256), "b": np.arange(256) / 2, "c": ["x", "y"] * 128}
+)
+
+
+@pytest.mark.parametrize(
+    "meta",
+    [
+        None,
+        {"a": "int64", "b": "float64", "c": object, "d": "float64"},
+        pandas_df.assign(d=0.0).iloc[:0],
+    ],
+)
+def test_map_partitions(meta):
+    def add_column(df, offset):
+        return df.assign(d=df["a"] + df["b"] + offset)
+
+    modin_result = pd.map_partitions(
+        pd.DataFrame(pandas_df), add_column, 1, meta=meta, preserve_index=True
+    )
+    pandas_result = add_column(pandas_df, 1)
+    df_equals(modin_result, pandas_result)
+    df_equals(modin_result.dtypes, pandas_result.dtypes)
+
+
+def test_map_partitions_with_partition_info():
+    def first_row(df, partition_info=None):
+        return df.iloc[:1].assign(
+            number=partition_info["number"],
+            start=partition_info["start"],
+            npartitions=partition_info["npartitions"],
+        )
+
+    result = pd.map_partitions(
+        pd.DataFrame(pandas_df), first_row, with_partition_info=True
+    )._to_pandas()
+    npartitions = len(result)
+    assert npartitions > 1
+    assert list(result["number"]) == list(range(npartitions))
+    assert list(result["start"]) == list(result["a"])
+    assert (result["npartitions"] == npartitions).all()
+
+
+@pytest.mark.parametrize("split_every", [2, 8])
+def test_reduce_partitions(split_every):
+    modin_df = pd.DataFrame(pandas_df)
+    df_equals(
+        pd.reduce_partitions(
+            modin_df, lambda df: df[["a", "b"]].sum(), split_every=split_every
+        ),
+        pandas_df[["a", "b"]].sum(),
+    )
+    df_equals(
+        pd.reduce_partitions(
+            modin_df,
+            lambda df: df.groupby("c")[["a", "b"]].sum(),
+            lambda df: df.groupby(level=0).sum(),
+            split_every=split_every,
+        ),
+        pandas_df.groupby("c")[["a", "b"]].sum(),
+    )
+
+
+def test_vectorized():
+    @pd.vectorized
+    def scalar_per_row(values):
+        return values[:, 0] + values[:, 1]
+
+    @pd.vectorized
+    def row_per_row(values, factor):
+        return values * factor
+
+    modin_df = pd.DataFrame(pandas_df[["a", "b"]])
+    df_equals(modin_df.apply(scalar_per_row, axis=1), pandas_df["a"] + pandas_df["b"])
+    df_equals(modin_df.apply(row_per_row, axis=1, args=(2,)), pandas_df[["a", "b"]] * 2)
@@ -24,6 +24,7 @@ from pandas.core.dtypes.common import (
     is_numeric_dtype,
     is_datetime_or_timedelta_dtype,
     is_dtype_equal,
+    is_extension_array_dtype,
     is_object_dtype,
 )
 from pandas.core.indexing import convert_to_index_sliceable
@@ -58,54 +59,9 @@ class BasePandasDataset(object):
             sib._siblings += [sibling]
 
     def _build_repr_df(self, num_rows, num_cols):
-        # Fast track for empty dataframe.
-        if len(self.index) == 0 or (
-            hasattr(self, "columns") and len(self.columns) == 0
-        ):
-            return pandas.DataFrame(
-                index=self.index,
-                columns=self.columns if hasattr(self, "columns") else None,
-            )
-        if len(self.index) <= num_rows:
-            row_indexer = slice(None)
-        else:
-            # Add one here so that pandas automatically adds the dots
-            # It turns out to be faster to extract 2 extra rows and columns than to
-            # build the dots ourselves.
-            num_rows_for_head = num_rows // 2 + 1
-            num_rows_for_tail = (
-                num_rows_for_head
-                if len(self.index) > num_rows
-                else len(self.index) - num_rows_for_head
-                if len(self.index) - num_rows_for_head >= 0
-                else None
-            )
-            row_indexer = list(range(len(self.index))[:num_rows_for_head]) + (
-                list(range(len(self.index))[-num_rows_for_tail:])
-                if num_rows_for_tail is not None
-                else []
-            )
-        if hasattr(self, "columns"):
-            if len(self.columns) <= num_cols:
-                col_indexer = slice(None)
-            else:
-                num_cols_for_front = num_cols // 2 + 1
-                num_cols_for_back = (
-                    num_cols_for_front
-                    if len(self.columns) > num_cols
-                    else len(self.columns) - num_cols_for_front
-                    if len(self.columns) - num_cols_for_front >= 0
-                    else None
-                )
-                col_indexer = list(range(len(self.columns))[:num_cols_for_front]) + (
-                    list(range(len(self.columns))[-num_cols_for_back:])
-                    if num_cols_for_back is not None
-                    else []
-                )
-            indexer = row_indexer, col_indexer
-        else:
-            indexer = row_indexer
-        return self.iloc[indexer]._query_compiler.to_pandas()
+        return self._query_compiler.build_repr_df(
+            num_rows, num_cols if hasattr(self, "columns") else None
+        )
 
     def _update_inplace(self, new_query_compiler):
         """Updates the current DataFrame inplace.
@@ -1098,11 +1054,13 @@ class BasePandasDataset(object):
                     subset = list(subset)
             else:
                 subset = [subset]
-            duplicates = self.duplicated(keep=keep, subset=subset)
-        else:
-            duplicates = self.duplicated(keep=keep)
-        indices = duplicates.values.nonzero()[0]
-        return self.drop(index=self.index[indices], inplace=inplace)
+            missing = pandas.Index(subset).difference(self._query_compiler.columns)
+            if len(missing) > 0:
+                raise KeyError(missing)
+        new_query_compiler = self._query_compiler.drop_duplicates(
+            subset=subset, keep=keep
+        )
+        return self._create_or_update_from_compiler(new_query_compiler, inplace)
 
     def eq(self, other, axis="columns", level=None):
         """Checks element-wise that this is equal to other.
@@ -2048,18 +2006,25 @@ class BasePandasDataset(object):
                 and isinstance(self.index, pandas.MultiIndex)
             )
         ):
+            # pandas does not take `axis` together with `index` or `columns`.
+            axis_kwargs = (
+                {"labels": labels, "axis": axis}
+                if labels is not None
+                else {
+                    name: value
+                    for name, value in [("index", index), ("columns", columns)]
+                    if value is not None
+                }
+            )
             return self._default_to_pandas(
                 "reindex",
-                labels=labels,
-                index=index,
-                columns=columns,
-                axis=axis,
                 method=method,
                 copy=copy,
                 level=level,
                 fill_value=fill_value,
                 limit=limit,
                 tolerance=tolerance,
+                **axis_kwargs,
             )
         if axis == 0 and labels is not None:
             index = labels
@@ -3102,6 +3067,25 @@ class BasePandasDataset(object):
         index=True,
         indent=None,
     ):  # pragma: no cover
+        from .dataframe import DataFrame
+
+        if isinstance(self, DataFrame):
+            from modin.data_management.dispatcher import EngineDispatcher
+
+            return EngineDispatcher.to_json(
+                self._query_compiler,
+                path_or_buf,
+                orient=orient,
+                date_format=date_format,
+                double_precision=double_precision,
+                force_ascii=force_ascii,
+                date_unit=date_unit,
+                default_handler=default_handler,
+                lines=lines,
+                compression=compression,
+                index=index,
+                indent=indent,
+            )
         return self._default_to_pandas(
             "to_json",
             path_or_buf,
@@ -3358,7 +3342,48 @@ class BasePandasDataset(object):
         return self.set_axis(labels=new_labels, axis=axis, inplace=not copy)
 
     def unstack(self, level=-1, fill_value=None):
-        return self._default_to_pandas("unstack", level=level, fill_value=fill_value)
+        from .dataframe import DataFrame
+        from .series import Series
+
+        if isinstance(level, (tuple, list)) and len(level) == 0:
+            # pandas has no level to unstack and returns the object as is.
+            return self.copy()
+        if not isinstance(self.index, pandas.MultiIndex) and isinstance(
+            self, DataFrame
+        ):
+            return self.T.stack(dropna=False)
+        if (
+            isinstance(self, DataFrame)
+            and isinstance(self.columns, pandas.MultiIndex)
+            and isinstance(level, (tuple, list))
+            and len(level) > 1
+        ):
+            # pandas unstacks the levels one at a time when the columns are a
+            # MultiIndex, so the result has every combination of the values of the
+            # levels rather than only the observed ones.
+            levels = [self.index._get_level_number(lev) for lev in level]
+            result = self
+            for i in range(len(levels)):
+                result = result.unstack(levels[i], fill_value=fill_value)
+                # Same renumbering of the remaining levels as pandas.
+                levels = [v if i > v else v - 1 for v in levels]
+            return result
+        dtypes = self._query_compiler.dtypes
+        if (
+            not isinstance(self.index, pandas.MultiIndex)
+            or len(self.index) == 0
+            or any((codes == -1).any() for codes in self.index.codes)
+            or any(is_extension_array_dtype(dtype) for dtype in dtypes)
+        ):
+            return self._default_to_pandas(
+                "unstack", level=level, fill_value=fill_value
+            )
+        result = DataFrame(
+            query_compiler=self._query_compiler.unstack(level, fill_value)
+        )
+        if isinstance(self, Series):
+            result.columns = result.columns.droplevel(0)
+        return result
 
     def var(
         self, axis=None, skipna=None, level=None, ddof=1, numeric_only=None, **kwargs
@@ -3465,7 +3490,26 @@ class BasePandasDataset(object):
         return self.iloc[key]
 
     def __getstate__(self):
-        return self._default_to_pandas("__getstate__")
+        """Get the state of the object for pickling.
+
+        The partitions are pickled one by one with the metadata of the frame, so
+        the object is never collected into a single pandas object and unpickles
+        into the same partitioning.
+        """
+        from modin.data_management.dispatcher import EngineDispatcher
+
+        return {
+            "_query_compiler": EngineDispatcher.get_partitioned_state(
+                self._query_compiler
+            )
+        }
+
+    def __setstate__(self, state):
+        from modin.data_management.dispatcher import EngineDispatcher
+
+        self._query_compiler = EngineDispatcher.from_partitioned_state(
+            state["_query_compiler"]
+        )
 
     def __gt__(self, right):
         return self.gt(right)
@@ -3577,6 +3621,10 @@ class BasePandasDataset(object):
             "__len__",
             "_create_or_update_from_compiler",
             "_update_inplace",
+            "__getstate__",
+            "__setstate__",
+            "__reduce__",
+            "__reduce_ex__",
         ]
         if item not in default_behaviors:
             method = object.__getattribute__(self, item)
@@ -13,11 +13,15 @@
 
 import pandas
 from pandas.core.common import apply_if_callable, is_bool_indexer
+from pandas.core.dtypes.cast import find_common_type
 from pandas.core.dtypes.common import (
     infer_dtype_from_object,
     is_dict_like,
+    is_hashable,
+    is_integer_dtype,
     is_list_like,
     is_numeric_dtype,
+    is_scalar,
 )
 from pandas.core.indexes.api import ensure_index_from_sequences
 from pandas.core.indexing import check_bool_indexer
@@ -276,17 +280,10 @@ class DataFrame(BasePandasDataset):
         Returns:
             Series
         """
+        if subset is not None and not is_list_like(subset):
+            subset = [subset]
         df = self[subset] if subset is not None else self
-        # if the number of columns we are checking for duplicates is larger than 1, we must
-        # hash them to generate a single value that can be compared across rows.
-        if len(df.columns) > 1:
-            hashed = df.apply(lambda s: hash(tuple(s)), axis=1).to_frame()
-        else:
-            hashed = df
-        duplicates = hashed.apply(lambda s: s.duplicated(keep=keep)).squeeze(axis=1)
-        # remove Series name which was assigned automatically by .apply
-        duplicates.name = None
-        return duplicates
+        return self._reduce_dimension(df._query_compiler.duplicated(keep=keep))
 
     @property
     def empty(self):
@@ -368,6 +365,10 @@ class DataFrame(BasePandasDataset):
             ).__name__
         except Exception:
             return_type = type(self).__name__
+        if axis == 1 and list(query_compiler.columns) == ["__reduced__"]:
+            # Raw and vectorized functions that return scalars are applied to NumPy
+            # arrays, so the empty DataFrame above cannot tell the return type.
+            return_type = "Series"
         if return_type not in ["DataFrame", "Series"]:
             return query_compiler.to_pandas().squeeze()
         else:
@@ -377,7 +378,11 @@ class DataFrame(BasePandasDataset):
             if isinstance(result, Series):
                 if axis == 0 and result.name == self.index[0] or result.name == 0:
                     result.name = None
-                elif axis == 1 and result.name == self.columns[0] or result.name == 0:
+                elif (
+                    axis == 1
+                    and result.name == self.columns[0]
+                    or result.name in [0, "__reduced__"]
+                ):
                     result.name = None
             return result
 
@@ -621,16 +626,66 @@ class DataFrame(BasePandasDataset):
         )
 
     def corr(self, method="pearson", min_periods=1):
-        return self._default_to_pandas(
-            pandas.DataFrame.corr, method=method, min_periods=min_periods
+        if method not in ["pearson", "spearman"]:
+            return self._default_to_pandas(
+                pandas.DataFrame.corr, method=method, min_periods=min_periods
+            )
+        numeric_df = self.drop(
+            columns=[
+                i for i in self.dtypes.index if not is_numeric_dtype(self.dtypes[i])
+            ]
+        )
+        return self.__constructor__(
+            query_compiler=numeric_df._query_compiler.corr(
+                method=method, min_periods=min_periods
+            )
         )
 
     def corrwith(self, other, axis=0, drop=False, method="pearson"):
-        if isinstance(other, DataFrame):
-            other = other._query_compiler.to_pandas()
-        return self._default_to_pandas(
-            pandas.DataFrame.corrwith, other, axis=axis, drop=drop, method=method
+        axis = self._get_axis_number(axis)
+        if (
+            not isinstance(other, DataFrame)
+            or axis != 0
+            or method != "pearson"
+            or not self.index.equals(other.index)
+        ):
+            if isinstance(other, DataFrame):
+                other = other._query_compiler.to_pandas()
+            return self._default_to_pandas(
+                pandas.DataFrame.corrwith, other, axis=axis, drop=drop, method=method
+            )
+        this, other = [
+            df.drop(
+                columns=[
+                    i for i in df.dtypes.index if not is_numeric_dtype(df.dtypes[i])
+                ]
+            )
+            for df in (self, other)
+        ]
+        common_columns = this.columns.intersection(other.columns, sort=False)
+        left, right = this[common_columns], other[common_columns]
+        # mask missing values
+        left = left + right * 0
+        right = right + left * 0
+        # demeaned data
+        ldem = left - left.mean()
+        rdem = right - right.mean()
+        # the reductions hold one value per column, so they are combined locally
+        num = to_pandas((ldem * rdem).sum())
+        dom = (
+            (to_pandas(left.count()) - 1)
+            * to_pandas(left.std())
+            * to_pandas(right.std())
         )
+        correl = num / dom
+        if not drop:
+            # append missing correlations for the non-matching columns
+            idx_diff = this.columns.union(other.columns).difference(correl.index)
+            if len(idx_diff) > 0:
+                correl = correl.append(
+                    pandas.Series([np.nan] * len(idx_diff), index=idx_diff)
+                )
+        return Series(correl)
 
     def cov(self, min_periods=None):
         """
@@ -673,31 +728,9 @@ class DataFrame(BasePandasDataset):
                 i for i in self.dtypes.index if not is_numeric_dtype(self.dtypes[i])
             ]
         )
-
-        cols = numeric_df.columns
-        idx = cols.copy()
-        denom = None
-
-        if all(numeric_df.notna().all()):
-            if min_periods is not None and min_periods > len(numeric_df):
-                result = np.empty((numeric_df.shape[1], numeric_df.shape[1]))
-                result.fill(np.nan)
-                return numeric_df.__constructor__(result)
-            else:
-                numeric_df = numeric_df.astype(dtype="float64")
-                denom = 1.0 / (len(numeric_df) - 1.0)
-                means = numeric_df.mean(axis=0)
-                result = numeric_df - means
-                result = result.T._query_compiler.conj().dot(result._query_compiler)
-        else:
-            result = numeric_df._query_compiler.default_to_pandas(
-                pandas.DataFrame.cov, min_periods=min_periods
-            )
-
-        result = numeric_df.__constructor__(
-            query_compiler=result, index=idx, columns=cols
+        return self.__constructor__(
+            query_compiler=numeric_df._query_compiler.cov(min_periods=min_periods)
         )
-        return result if denom is None else result * denom
 
     def dot(self, other):
         """
@@ -790,7 +823,22 @@ class DataFrame(BasePandasDataset):
         )
 
     def explode(self, column: Union[str, Tuple]):
-        return self._default_to_pandas(pandas.DataFrame.explode, column)
+        """Transform each element of a list-like to a row, replicating the index.
+
+        Args:
+            column: The column to explode.
+
+        Returns:
+            A new DataFrame with the exploded lists of `column` and the other columns
+            repeated.
+        """
+        if not (is_scalar(column) or isinstance(column, tuple)):
+            raise ValueError("column must be a scalar")
+        if not self.columns.is_unique:
+            raise ValueError("columns must be unique")
+        if column not in self.columns:
+            raise KeyError(column)
+        return DataFrame(query_compiler=self._query_compiler.explode(column))
 
     def eval(self, expr, inplace=False, **kwargs):
         """Evaluate a Python expression as a string using various backends.
@@ -1196,8 +1244,8 @@ class DataFrame(BasePandasDataset):
             A generator that iterates over the rows of the frame.
         """
 
-        def iterrow_builder(s):
-            return s.name, s
+        def iterrow_builder(df):
+            return df.iterrows()
 
         partition_iterator = PartitionIterator(self, 0, iterrow_builder)
         for v in partition_iterator:
@@ -1207,20 +1255,14 @@ class DataFrame(BasePandasDataset):
         """Iterator over (column name, Series) pairs.
 
         Note:
-            Generators can't be pickled so from the remote function
-            we expand the generator into a list before getting it.
-            This is not that ideal.
+            The columns are yielded as Modin Series, which are selected lazily,
+            so no data is pulled to the driver.
 
         Returns:
             A generator that iterates over the columns of the frame.
         """
-
-        def items_builder(s):
-            return s.name, s
-
-        partition_iterator = PartitionIterator(self, 1, items_builder)
-        for v in partition_iterator:
-            yield v
+        for i, label in enumerate(self.columns):
+            yield label, self.iloc[:, i]
 
     def iteritems(self):
         """Iterator over (column name, Series) pairs.
@@ -1250,8 +1292,8 @@ class DataFrame(BasePandasDataset):
             A tuple representing row data. See args for varying tuples.
         """
 
-        def itertuples_builder(s):
-            return next(s._to_pandas().to_frame().T.itertuples(index=index, name=name))
+        def itertuples_builder(df):
+            return df.itertuples(index=index, name=name)
 
         partition_iterator = PartitionIterator(self, 0, itertuples_builder)
         for v in partition_iterator:
@@ -1664,9 +1706,22 @@ class DataFrame(BasePandasDataset):
                 return new_df
 
     def pivot(self, index=None, columns=None, values=None):
-        return self._default_to_pandas(
-            pandas.DataFrame.pivot, index=index, columns=columns, values=values
-        )
+        if values is None:
+            cols = [columns] if index is None else [index, columns]
+            indexed = self.set_index(cols, append=index is None)
+        else:
+            if index is None:
+                indexed = self.set_index(columns, append=True)
+            else:
+                indexed = self.set_index([index, columns])
+            if is_list_like(values) and not isinstance(values, tuple):
+                indexed = indexed[values]
+                # pandas builds the result from the values as a single array.
+                indexed = indexed.astype(find_common_type(list(indexed.dtypes)))
+            else:
+                indexed = indexed[values]
+                indexed.name = None
+        return indexed.unstack(columns)
 
     def pivot_table(
         self,
@@ -1680,17 +1735,114 @@ class DataFrame(BasePandasDataset):
         margins_name="All",
         observed=False,
     ):
-        return self._default_to_pandas(
-            pandas.DataFrame.pivot_table,
-            values=values,
-            index=index,
-            columns=columns,
-            aggfunc=aggfunc,
-            fill_value=fill_value,
-            margins=margins,
-            dropna=dropna,
-            margins_name=margins_name,
-        )
+        """Create a spreadsheet-style pivot table.
+
+        The values are aggregated with a distributed groupby on the index and
+        columns keys, and the aggregated cells are scattered into the table with
+        `unstack`.
+        """
+
+        def as_keys(by):
+            if by is None:
+                return []
+            if is_list_like(by) and not isinstance(by, tuple):
+                return list(by)
+            return [by]
+
+        index, columns = as_keys(index), as_keys(columns)
+        keys = index + columns
+        if (
+            margins
+            or isinstance(aggfunc, (list, dict))
+            or len(keys) == 0
+            or not all(is_hashable(key) and key in self.columns for key in keys)
+        ):
+            return self._default_to_pandas(
+                pandas.DataFrame.pivot_table,
+                values=values,
+                index=index if len(index) else None,
+                columns=columns if len(columns) else None,
+                aggfunc=aggfunc,
+                fill_value=fill_value,
+                margins=margins,
+                dropna=dropna,
+                margins_name=margins_name,
+                observed=observed,
+            )
+
+        # The steps below follow `pandas.pivot_table`.
+        data = self
+        values_passed = values is not None
+        if values_passed:
+            if is_list_like(values):
+                values_multi = True
+                values = list(values)
+            else:
+                values_multi = False
+                values = [values]
+            for value in values:
+                if value not in data:
+                    raise KeyError(value)
+            to_filter = [key for key in keys + values if key in data.columns]
+            if len(to_filter) < len(data.columns):
+                data = data[to_filter]
+        else:
+            values = [column for column in data.columns if column not in keys]
+
+        agged = data.groupby(keys, observed=observed).agg(aggfunc)
+        if dropna and isinstance(agged, DataFrame) and len(agged.columns):
+            agged = agged.dropna(how="all")
+            # Integer values stay integers when the aggregation allows it.
+            for value in values:
+                if (
+                    value in data
+                    and is_integer_dtype(data[value].dtype)
+                    and value in agged
+                    and not is_integer_dtype(agged[value].dtype)
+                ):
+                    column = agged[value]
+                    if column.notna().all():
+                        downcast = column.astype(data[value].dtype)
+                        if (downcast == column).all():
+                            agged[value] = downcast
+
+        table = agged
+        if table.index.nlevels > 1 and len(keys) > len(index):
+            index_names = agged.index.names[: len(index)]
+            to_unstack = []
+            for i in range(len(index), len(keys)):
+                name = agged.index.names[i]
+                if name is None or name in index_names:
+                    to_unstack.append(i)
+                else:
+                    to_unstack.append(name)
+            table = agged.unstack(to_unstack)
+
+        if not dropna:
+            for axis in ["index", "columns"]:
+                labels = getattr(table, axis)
+                if isinstance(labels, pandas.MultiIndex):
+                    full = pandas.MultiIndex.from_product(
+                        labels.levels, names=labels.names
+                    )
+                    table = table.reindex(**{axis: full})
+
+        if isinstance(table, DataFrame):
+            table = table.sort_index(axis=1)
+        if fill_value is not None:
+            table = table.fillna(fill_value, downcast="infer")
+        if (
+            values_passed
+            and not values_multi
+            and not table.empty
+            and table.columns.nlevels > 1
+        ):
+            table = table[values[0]]
+        if len(index) == 0 and len(columns) > 0:
+            table = table.T
+        if isinstance(table, DataFrame) and dropna:
+            table = table.dropna(how="all", axis=1)
+        return table
 
     @property
     def plot(
@@ -2056,9 +2208,14 @@ class DataFrame(BasePandasDataset):
             return self.copy()
 
     def stack(self, level=-1, dropna=True):
-        return self._default_to_pandas(
-            pandas.DataFrame.stack, level=level, dropna=dropna
-        )
+        if len(self.index) == 0:
+            return self._default_to_pandas(
+                pandas.DataFrame.stack, level=level, dropna=dropna
+            )
+        query_compiler = self._query_compiler.stack(level, dropna)
+        if list(query_compiler.columns) == ["__reduced__"]:
+            return Series(query_compiler=query_compiler)
+        return DataFrame(query_compiler=query_compiler)
 
     def sub(self, other, axis="columns", level=None, fill_value=None):
         return self._binary_op(
@@ -2600,9 +2757,6 @@ class DataFrame(BasePandasDataset):
     def __round__(self, decimals=0):
         return self._default_to_pandas(pandas.DataFrame.__round__, decimals=decimals)
 
-    def __setstate__(self, state):
-        return self._default_to_pandas(pandas.DataFrame.__setstate__, state)
-
     def __delitem__(self, key):
         """Delete a column by key. `del a[key]` for example.
            Operation happens in place.
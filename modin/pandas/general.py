@@ -173,13 +173,27 @@ def merge_ordered(
         raise ValueError(
             "can not merge DataFrame with instance of type {}".format(type(right))
         )
-    ErrorMessage.default_to_pandas("`merge_ordered`")
+    if isinstance(right, pandas.DataFrame):
+        right = DataFrame(right)
     if isinstance(right, DataFrame):
-        right = to_pandas(right)
+        return DataFrame(
+            query_compiler=left._query_compiler.merge_ordered(
+                right._query_compiler,
+                on=on,
+                left_on=left_on,
+                right_on=right_on,
+                left_by=left_by,
+                right_by=right_by,
+                fill_method=fill_method,
+                suffixes=suffixes,
+                how=how,
+            )
+        )
+    ErrorMessage.default_to_pandas("`merge_ordered`")
     return DataFrame(
         pandas.merge_ordered(
             to_pandas(left),
-            right,
+            to_pandas(right) if isinstance(right, Series) else right,
             on=on,
             left_on=left_on,
             right_on=right_on,
@@ -212,13 +226,31 @@ def merge_asof(
         raise ValueError(
             "can not merge DataFrame with instance of type {}".format(type(right))
         )
-    ErrorMessage.default_to_pandas("`merge_asof`")
+    if isinstance(right, pandas.DataFrame):
+        right = DataFrame(right)
     if isinstance(right, DataFrame):
-        right = to_pandas(right)
+        return DataFrame(
+            query_compiler=left._query_compiler.merge_asof(
+                right._query_compiler,
+                on=on,
+                left_on=left_on,
+                right_on=right_on,
+                left_index=left_index,
+                right_index=right_index,
+                by=by,
+                left_by=left_by,
+                right_by=right_by,
+                suffixes=suffixes,
+                tolerance=tolerance,
+                allow_exact_matches=allow_exact_matches,
+                direction=direction,
+            )
+        )
+    ErrorMessage.default_to_pandas("`merge_asof`")
     return DataFrame(
         pandas.merge_asof(
             to_pandas(left),
-            right,
+            to_pandas(right) if isinstance(right, Series) else right,
             on=on,
             left_on=left_on,
             right_on=right_on,
@@ -261,6 +293,7 @@ def pivot_table(
         margins=margins,
         dropna=dropna,
         margins_name=margins_name,
+        observed=observed,
     )
 
 
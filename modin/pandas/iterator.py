@@ -12,12 +12,21 @@
 # governing permissions and limitations under the License.
 
 from collections import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from modin.data_management.utils import get_default_chunksize
 
 
 class PartitionIterator(Iterator):
     def __init__(self, df, axis, func):
         """PartitionIterator class to define a generator on partitioned data
 
+        The data is pulled to the driver one partition of rows (or columns) at a
+        time, while the next one is fetched in the background, so only two
+        partitions are held in memory at once.
+
         Args:
             df: The dataframe to iterate over
             axis: axis to iterate over
@@ -26,18 +35,68 @@ class PartitionIterator(Iterator):
         """
         self.df = df
         self.axis = axis
-        self.index_iter = (
-            zip(
-                iter(slice(None) for _ in range(len(self.df.columns))),
-                range(len(self.df.columns)),
-            )
-            if axis
-            else zip(
-                range(len(self.df.index)),
-                iter(slice(None) for _ in range(len(self.df.index))),
-            )
-        )
         self.func = func
+        self.chunks = iter(self._chunk_bounds())
+        self.inner_iter = iter(())
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._next_chunk = self._prefetch()
+
+    def _chunk_bounds(self):
+        """Compute the (start, stop) positions of the blocks to fetch.
+
+        The blocks follow the partitions of the frame along the axis when the
+        backend exposes them, so every block is fetched from a single partition.
+
+        Returns:
+            A list of (start, stop) tuples.
+        """
+        from modin.pandas import DEFAULT_NPARTITIONS
+
+        frame = getattr(self.df._query_compiler, "_modin_frame", None)
+        lengths = getattr(
+            frame, "_column_widths" if self.axis else "_row_lengths", None
+        )
+        length = len(self.df.columns) if self.axis else len(self.df.index)
+        if lengths is None or sum(lengths) != length:
+            chunksize = max(get_default_chunksize(length, DEFAULT_NPARTITIONS), 1)
+            lengths = [chunksize] * ((length + chunksize - 1) // chunksize)
+        bounds = np.cumsum([0] + list(lengths))
+        return [
+            (start, min(stop, length))
+            for start, stop in zip(bounds[:-1], bounds[1:])
+            if start < stop
+        ]
+
+    def _prefetch(self):
+        """Start fetching the next block as a pandas DataFrame.
+
+        Returns:
+            A future with the next block, or None if all blocks were fetched.
+        """
+        bounds = next(self.chunks, None)
+        if bounds is None:
+            self._executor.shutdown(wait=False)
+            return None
+        chunk = slice(*bounds)
+        key = (slice(None), chunk) if self.axis else (chunk, slice(None))
+        df = self.df
+        return self._executor.submit(lambda: df.iloc[key]._to_pandas())
+
+    def close(self):
+        """Stop fetching blocks and shut the background thread down.
+
+        This is called when the iterator is garbage collected, so iterations that
+        are abandoned early do not keep the thread and the prefetched block alive.
+        """
+        if self._next_chunk is not None:
+            self._next_chunk.cancel()
+            self._next_chunk = None
+        self.inner_iter = iter(())
+        self._executor.shutdown(wait=False)
+
+    def __del__(self):
+        if hasattr(self, "_executor"):
+            self.close()
 
     def __iter__(self):
         return self
@@ -46,6 +105,12 @@ class PartitionIterator(Iterator):
         return self.next()
 
     def next(self):
-        key = next(self.index_iter)
-        df = self.df.iloc[key]
-        return self.func(df)
+        while True:
+            try:
+                return next(self.inner_iter)
+            except StopIteration:
+                if self._next_chunk is None:
+                    raise
+                df = self._next_chunk.result()
+                self._next_chunk = self._prefetch()
+                self.inner_iter = iter(self.func(df))
@@ -12,6 +12,10 @@
 # governing permissions and limitations under the License.
 
 import pandas
+import pandas.core.common as com
+from pandas.core.base import SelectionMixin
+from pandas.core.dtypes.common import is_list_like
+from pandas.core.indexes.api import get_objs_combined_axis
 
 from .dataframe import DataFrame
 from .series import Series
@@ -108,39 +112,155 @@ def crosstab(
     dropna: bool = True,
     normalize=False,
 ) -> DataFrame:
-    ErrorMessage.default_to_pandas("`crosstab`")
-    pandas_crosstab = pandas.crosstab(
-        index,
-        columns,
-        values,
-        rownames,
-        colnames,
-        aggfunc,
-        margins,
-        margins_name,
-        dropna,
-        normalize,
+    """Compute a simple cross tabulation of two (or more) factors.
+
+    The frequencies (or the `aggfunc` of `values`) are computed with the
+    distributed groupby reduction of `DataFrame.pivot_table`.
+    """
+    index = com.maybe_make_list(index)
+    columns = com.maybe_make_list(columns)
+
+    if values is None and aggfunc is not None:
+        raise ValueError("aggfunc cannot be used without values.")
+    if values is not None and aggfunc is None:
+        raise ValueError("values cannot be used without an aggfunc.")
+
+    if margins:
+        ErrorMessage.default_to_pandas("`crosstab` with `margins`")
+        return DataFrame(
+            pandas.crosstab(
+                [_to_pandas_array(x) for x in index],
+                [_to_pandas_array(x) for x in columns],
+                _to_pandas_array(values),
+                rownames,
+                colnames,
+                aggfunc,
+                margins,
+                margins_name,
+                dropna,
+                normalize,
+            )
+        )
+
+    rownames = _get_names(index, rownames, prefix="row")
+    colnames = _get_names(columns, colnames, prefix="col")
+    names = rownames + colnames
+    arrays = index + columns
+    if values is not None:
+        names.append("__dummy__")
+        arrays.append(values)
+
+    if (
+        len(set(names)) == len(names)
+        and all(isinstance(x, Series) for x in arrays)
+        and all(x.index.equals(arrays[0].index) for x in arrays[1:])
+    ):
+        from .concat import concat
+
+        df = concat([x.rename(name) for x, name in zip(arrays, names)], axis=1)
+    else:
+        # The factors are aligned like in pandas, on the intersection of the
+        # indexes of the Series among them, and the values on the factors.
+        factors = [_to_pandas_array(x) for x in index + columns]
+        pass_objs = [x for x in factors if isinstance(x, pandas.Series)]
+        common_idx = None
+        if pass_objs:
+            common_idx = get_objs_combined_axis(pass_objs, intersect=True, sort=False)
+        data = {}
+        data.update(zip(rownames + colnames, factors))
+        pandas_df = pandas.DataFrame(data, index=common_idx)
+        if values is not None:
+            pandas_df["__dummy__"] = _to_pandas_array(values)
+        df = DataFrame(pandas_df)
+
+    if values is None:
+        df["__dummy__"] = 0
+        kwargs = {"aggfunc": "count", "fill_value": 0}
+    else:
+        if callable(aggfunc):
+            # NumPy reductions are aggregated like their pandas names.
+            aggfunc = SelectionMixin._cython_table.get(aggfunc, aggfunc)
+        kwargs = {"aggfunc": aggfunc}
+
+    table = df.pivot_table(
+        "__dummy__", index=rownames, columns=colnames, dropna=dropna, **kwargs
     )
-    return DataFrame(pandas_crosstab)
+
+    if normalize is not False:
+        if not isinstance(normalize, (bool, str)):
+            try:
+                normalize = {0: "index", 1: "columns"}[normalize]
+            except KeyError:
+                raise ValueError("Not a valid normalize argument")
+        normalizers = {
+            "all": lambda x: x / x.sum(axis=1).sum(axis=0),
+            "columns": lambda x: x / x.sum(),
+            "index": lambda x: x.div(x.sum(axis=1), axis=0),
+        }
+        normalizers[True] = normalizers["all"]
+        try:
+            table = normalizers[normalize](table)
+        except KeyError:
+            raise ValueError("Not a valid normalize argument")
+        table = table.fillna(0)
+    return table
 
 
 def lreshape(data: DataFrame, groups, dropna=True, label=None):
+    """Reshape wide-format data to long, stacking groups of columns."""
     if not isinstance(data, DataFrame):
         raise ValueError("can not lreshape with instance of type {}".format(type(data)))
-    ErrorMessage.default_to_pandas("`lreshape`")
+    if isinstance(groups, dict):
+        keys = list(groups.keys())
+        values = list(groups.values())
+    else:
+        keys, values = zip(*groups)
+    values = [list(names) for names in values]
+    if any(len(names) != len(values[0]) for names in values):
+        raise ValueError("All column lists must be same length")
     return DataFrame(
-        pandas.lreshape(to_pandas(data), groups, dropna=dropna, label=label)
+        query_compiler=data._query_compiler.lreshape(list(keys), values, dropna)
     )
 
 
 def wide_to_long(
     df: DataFrame, stubnames, i, j, sep: str = "", suffix: str = r"\d+"
 ) -> DataFrame:
+    """Reshape wide-format data to long, with the suffixes of the wide columns."""
     if not isinstance(df, DataFrame):
         raise ValueError(
             "can not wide_to_long with instance of type {}".format(type(df))
         )
-    ErrorMessage.default_to_pandas("`wide_to_long`")
+    stubnames = list(stubnames) if is_list_like(stubnames) else [stubnames]
+    if any(col in stubnames for col in df.columns):
+        raise ValueError("stubname can't be identical to a column name")
+    i = list(i) if is_list_like(i) else [i]
+    if df[i].duplicated().any():
+        raise ValueError("the id variables need to uniquely identify each row")
     return DataFrame(
-        pandas.wide_to_long(to_pandas(df), stubnames, i, j, sep=sep, suffix=suffix)
+        query_compiler=df._query_compiler.wide_to_long(stubnames, i, j, sep, suffix)
     )
+
+
+def _get_names(arrs, names, prefix="row"):
+    """Get the names of the factors of `crosstab`, like pandas does."""
+    if names is None:
+        names = []
+        for i, arr in enumerate(arrs):
+            if isinstance(arr, (Series, pandas.Series)) and arr.name is not None:
+                names.append(arr.name)
+            else:
+                names.append("{prefix}_{i}".format(prefix=prefix, i=i))
+    else:
+        if len(names) != len(arrs):
+            raise AssertionError("arrays and names must have the same length")
+        if not isinstance(names, list):
+            names = list(names)
+    return names
+
+
+def _to_pandas_array(x):
+    """Convert a Modin Series or DataFrame to pandas, leaving anything else as is."""
+    if isinstance(x, (Series, DataFrame)):
+        return to_pandas(x)
+    return x
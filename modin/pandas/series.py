@@ -807,7 +807,9 @@ class Series(BasePandasDataset):
         return super(Series, self).dropna(axis=axis, inplace=inplace)
 
     def duplicated(self, keep="first"):
-        return self.to_frame().duplicated(keep=keep)
+        result = self.to_frame().duplicated(keep=keep)
+        result.name = self.name
+        return result
 
     def eq(self, other, level=None, fill_value=None, axis=0):
         new_self, new_other = self._prepare_inter_op(other)
@@ -821,7 +823,9 @@ class Series(BasePandasDataset):
         )
 
     def explode(self):
-        return self._default_to_pandas(pandas.Series.explode)
+        return self.__constructor__(
+            query_compiler=self._query_compiler.explode(self._query_compiler.columns[0])
+        )
 
     def factorize(self, sort=False, na_sentinel=-1):
         return self._default_to_pandas(
@@ -942,8 +946,8 @@ class Series(BasePandasDataset):
         return self[0]
 
     def items(self):
-        def item_builder(s):
-            return s.name, s.squeeze()
+        def item_builder(df):
+            return df.iloc[:, 0].items()
 
         partition_iterator = PartitionIterator(self.to_frame(), 0, item_builder)
         for v in partition_iterator:
@@ -22,12 +22,15 @@ from modin.pandas.utils import to_pandas
 from numpy.testing import assert_array_equal
 import io
 import sys
+import datetime
+from decimal import Decimal
 
 from .utils import (
     random_state,
     RAND_LOW,
     RAND_HIGH,
     df_equals,
+    df_almost_equals,
     df_is_empty,
     arg_keys,
     name_contains,
@@ -1824,6 +1827,92 @@ class TestDataFrameUDF:
             other=lambda df: df,
         )
 
+    @pytest.mark.parametrize(
+        "func",
+        [
+            lambda row: row[0] * 2 + row[-1],
+            lambda row: row.sum() > 0,
+            lambda row: row * 2,
+            lambda row: row[0] / row[1],
+        ],
+        ids=["scalar", "bool", "row", "division"],
+    )
+    def test_apply_raw_rows(self, func):
+        data = np.random.RandomState(42).randint(-10, 10, size=(256, 4))
+        modin_df = pd.DataFrame(data)
+        pandas_df = pandas.DataFrame(data)
+        df_equals(
+            modin_df.apply(func, axis=1, raw=True),
+            pandas_df.apply(func, axis=1, raw=True),
+        )
+
+        def with_args(row, a, b=0):
+            return row[0] * a + b
+
+        df_equals(
+            modin_df.apply(with_args, axis=1, raw=True, args=(3,), b=1),
+            pandas_df.apply(with_args, axis=1, raw=True, args=(3,), b=1),
+        )
+
+        strings = {"a": ["x", "y"] * 64, "b": ["1", "2"] * 64}
+        df_equals(
+            pd.DataFrame(strings).apply(lambda row: row[0] + row[1], axis=1, raw=True),
+            pandas.DataFrame(strings).apply(
+                lambda row: row[0] + row[1], axis=1, raw=True
+            ),
+        )
+
+        # rows of another width are neither scalars nor rows of the frame
+        df_equals(
+            modin_df.apply(lambda row: (row[0], row[1]), axis=1, raw=True),
+            pandas_df.apply(lambda row: (row[0], row[1]), axis=1, raw=True),
+        )
+
+    def test_apply_raw_rows_calls(self):
+        data = np.random.RandomState(42).randint(-10, 10, size=(256, 4))
+        modin_df = pd.DataFrame(data)
+        pandas_df = pandas.DataFrame(data)
+        calls = []
+
+        def record(row):
+            calls.append(row[0])
+            return row[0]
+
+        modin_result = modin_df.apply(record, axis=1, raw=True)
+        assert len(calls) == len(data)
+        df_equals(modin_result, pandas_df.apply(record, axis=1, raw=True))
+
+        pytest.importorskip("numba")
+        from modin.backends.pandas.query_compiler import _jitted_row_loops
+
+        def double(row):
+            return row[0] * 2
+
+        df_equals(
+            modin_df.apply(double, axis=1, raw=True),
+            pandas_df.apply(double, axis=1, raw=True),
+        )
+        compiled = _jitted_row_loops[double]
+        assert all(loop is not None for loop in compiled.values())
+        loops = {row_type: loop[0] for row_type, loop in compiled.items()}
+        modin_df.apply(double, axis=1, raw=True)
+        assert all(compiled[row_type][0] is loops[row_type] for row_type in loops)
+
+        def floordiv(row):
+            return row[0] // row[1]
+
+        # numba raises on the division by zero, where NumPy warns, and the rows
+        # from there on are applied in Python
+        data[100, 1] = 0
+        modin_df = pd.DataFrame(data)
+        pandas_df = pandas.DataFrame(data)
+        with np.errstate(divide="ignore"):
+            df_equals(
+                modin_df.apply(floordiv, axis=1, raw=True),
+                pandas_df.apply(floordiv, axis=1, raw=True),
+            )
+        assert all(loop is not None for loop in _jitted_row_loops[floordiv].values())
+
     def test_eval_df_use_case(self):
         frame_data = {"a": random_state.randn(10), "b": random_state.randn(10)}
         df = pandas.DataFrame(frame_data)
@@ -2005,6 +2094,37 @@ class TestDataFrameDefault:
         pandas_frame = pandas.DataFrame(data)
         assert_array_equal(modin_frame.values, pandas_frame.values)
 
+    def test_to_pandas_mixed_dtypes(self):
+        data = {"col{}".format(i): np.arange(256) * i for i in range(40)}
+        data["float"] = np.arange(256) / 3
+        data["object"] = np.arange(256).astype(str)
+        data["datetime"] = pandas.date_range("2020", periods=256)
+        data["bool"] = np.arange(256) % 2 == 0
+        data["category"] = pandas.Categorical(np.arange(256) % 3)
+        pandas_df = pandas.DataFrame(data)
+        modin_df = pd.DataFrame(pandas_df)
+        df_equals(modin_df._to_pandas(), pandas_df)
+        assert_array_equal(modin_df.values, pandas_df.values)
+        numeric = ["col{}".format(i) for i in range(40)] + ["float"]
+        assert_array_equal(modin_df[numeric].values, pandas_df[numeric].values)
+        # data types that don't match the blocks are not trusted
+        modin_df = pd.DataFrame(pandas_df[numeric])
+        modin_df._query_compiler._modin_frame._dtypes[:] = np.dtype("int8")
+        df_equals(modin_df._to_pandas(), pandas_df[numeric])
+        assert_array_equal(modin_df.values, pandas_df[numeric].values)
+
+    def test_from_pandas_copy(self):
+        pandas_df = pandas.DataFrame(np.arange(256 * 100).reshape(256, 100))
+        modin_df = pd.DataFrame(pandas_df)
+        frame = modin_df._query_compiler._modin_frame
+        assert sum(frame._row_lengths) == len(pandas_df)
+        assert sum(frame._column_widths) == len(pandas_df.columns)
+        df_equals(modin_df, pandas_df)
+        # the partitions don't share memory with the pandas DataFrame
+        pandas_df.iloc[0, 0] = 100
+        assert modin_df.iloc[0, 0] == 0
+        df_equals(modin_df.iloc[1:], pandas_df.iloc[1:])
+
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     def test_partition_to_numpy(self, data):
         frame = pd.DataFrame(data)
@@ -2132,21 +2252,64 @@ class TestDataFrameDefault:
             modin_df1.combine_first(modin_df2), pandas_df1.combine_first(pandas_df2)
         )
 
-    def test_corr(self):
-        data = test_data_values[0]
+    @pytest.mark.parametrize("method", ["pearson", "spearman"])
+    @pytest.mark.parametrize("min_periods", [1, 200])
+    def test_corr(self, method, min_periods):
+        frame_data = random_state.randn(256, 32)
+        frame_data[random_state.rand(256, 32) < 0.1] = np.nan
+        pandas_df = pandas.DataFrame(frame_data).add_prefix("col")
+        pandas_df["str"] = "a"
+        pandas_df["bool"] = random_state.rand(256) > 0.5
+        modin_df = pd.DataFrame(pandas_df)
+        tm.assert_frame_equal(
+            to_pandas(modin_df.corr(method=method, min_periods=min_periods)),
+            pandas_df.corr(method=method, min_periods=min_periods),
+        )
+        # no missing values, so spearman is computed from the column ranks
+        tm.assert_frame_equal(
+            to_pandas(modin_df.fillna(0).corr(method=method)),
+            pandas_df.fillna(0).corr(method=method),
+        )
+        # infinite values are missing values to pandas as well
+        pandas_df = pandas_df.fillna(0)
+        pandas_df.iloc[3, 0] = np.inf
+        modin_df = pd.DataFrame(pandas_df)
+        tm.assert_frame_equal(
+            to_pandas(modin_df.corr(method=method)), pandas_df.corr(method=method)
+        )
+
         with pytest.warns(UserWarning):
-            pd.DataFrame(data).corr()
+            pd.DataFrame(test_data_values[0]).corr(method="kendall")
 
     def test_corrwith(self):
+        frame_data = random_state.randn(256, 32)
+        frame_data[random_state.rand(256, 32) < 0.1] = np.nan
+        pandas_df = pandas.DataFrame(frame_data).add_prefix("col")
+        pandas_other = (pandas_df ** 2).drop(columns=["col3"])
+        pandas_other["extra"] = 1.0
+        modin_df, modin_other = pd.DataFrame(pandas_df), pd.DataFrame(pandas_other)
+        for drop in [False, True]:
+            tm.assert_series_equal(
+                to_pandas(modin_df.corrwith(modin_other, drop=drop)),
+                pandas_df.corrwith(pandas_other, drop=drop),
+            )
+
         data = test_data_values[0]
         with pytest.warns(UserWarning):
-            pd.DataFrame(data).corrwith(pd.DataFrame(data))
+            pd.DataFrame(data).corrwith(pd.DataFrame(data), axis=1)
 
-    def test_cov(self):
+    @pytest.mark.parametrize("min_periods", [None, 200])
+    def test_cov(self, min_periods):
         data = test_data_values[0]
-        modin_result = pd.DataFrame(data).cov()
-        pandas_result = pandas.DataFrame(data).cov()
-        df_equals(modin_result, pandas_result)
+        modin_result = pd.DataFrame(data).cov(min_periods=min_periods)
+        pandas_result = pandas.DataFrame(data).cov(min_periods=min_periods)
+        tm.assert_frame_equal(to_pandas(modin_result), pandas_result)
+
+        frame_data = random_state.randn(256, 32) * 100 + 1e4
+        frame_data[random_state.rand(256, 32) < 0.1] = np.nan
+        modin_result = pd.DataFrame(frame_data).cov(min_periods=min_periods)
+        pandas_result = pandas.DataFrame(frame_data).cov(min_periods=min_periods)
+        tm.assert_frame_equal(to_pandas(modin_result), pandas_result)
 
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     def test_dot(self, data):
@@ -2174,7 +2337,7 @@ class TestDataFrameDefault:
         # Test dataframe input
         modin_result = modin_df.dot(modin_df.T)
         pandas_result = pandas_df.dot(pandas_df.T)
-        df_equals(modin_result, pandas_result)
+        df_almost_equals(modin_result, pandas_result)
 
         # Test when input series index doesn't line up with columns
         with pytest.raises(ValueError):
@@ -2220,12 +2383,35 @@ class TestDataFrameDefault:
         # Test dataframe input
         modin_result = modin_df @ modin_df.T
         pandas_result = pandas_df @ pandas_df.T
-        df_equals(modin_result, pandas_result)
+        df_almost_equals(modin_result, pandas_result)
 
         # Test when input series index doesn't line up with columns
         with pytest.raises(ValueError):
             modin_result = modin_df @ pd.Series(np.arange(col_len))
 
+    @pytest.mark.parametrize("dtype", [np.int64, np.float64])
+    def test_dot_blocks(self, dtype):
+        data = np.random.RandomState(0).randint(-100, 100, size=(300, 70)).astype(dtype)
+        pandas_left = pandas.DataFrame(
+            data, columns=["c{}".format(i) for i in range(70)]
+        )
+        pandas_right = pandas.DataFrame(data[:70, :40].T, columns=pandas_left.columns)
+        pandas_right.index = ["r{}".format(i) for i in range(40)]
+        pandas_right = pandas_right.T
+        modin_left = pd.DataFrame(pandas_left)
+        modin_right = pd.DataFrame(pandas_right)
+
+        df_almost_equals(modin_left.dot(modin_right), pandas_left.dot(pandas_right))
+        df_almost_equals(modin_left @ modin_right, pandas_left @ pandas_right)
+        df_equals(
+            modin_left.dot(modin_right["r3"]), pandas_left.dot(pandas_right["r3"])
+        )
+        # The rows of the right frame are aligned with the left columns by label.
+        df_almost_equals(
+            modin_left.dot(modin_right.iloc[::-1]),
+            pandas_left.dot(pandas_right.iloc[::-1]),
+        )
+
     def test_ewm(self):
         df = pd.DataFrame({"B": [0, 1, 2, np.nan, 4]})
         with pytest.warns(UserWarning):
@@ -2239,8 +2425,29 @@ class TestDataFrameDefault:
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     def test_explode(self, data):
         modin_df = pd.DataFrame(data)
-        with pytest.warns(UserWarning):
-            modin_df.explode(modin_df.columns[0])
+        pandas_df = pandas.DataFrame(data)
+        df_equals(
+            modin_df.explode(modin_df.columns[0]),
+            pandas_df.explode(pandas_df.columns[0]),
+        )
+
+    def test_explode_lists(self):
+        random_state = np.random.RandomState(42)
+        lists = [list(range(random_state.randint(0, 4))) for _ in range(400)]
+        # The long lists at the end make the last row partition much larger.
+        lists[350:] = [list(range(200))] * 50
+        pandas_df = pandas.DataFrame(
+            {"a": lists, "b": np.arange(400), "c": ["x"] * 400},
+            index=np.arange(400) * 2,
+        )
+        modin_df = pd.DataFrame(pandas_df)
+        modin_result = modin_df.explode("a")
+        df_equals(modin_result, pandas_df.explode("a"))
+        row_lengths = modin_result._query_compiler._modin_frame._row_lengths
+        assert max(row_lengths) < 2 * min(row_lengths)
+
+        with pytest.raises(ValueError):
+            modin_df.explode(["a"])
 
     def test_first(self):
         i = pd.date_range("2010-04-09", periods=400, freq="2D")
@@ -2410,17 +2617,25 @@ class TestDataFrameDefault:
         with pytest.warns(UserWarning):
             pd.DataFrame(data).pct_change()
 
-    def test_pivot(self):
-        df = pd.DataFrame(
-            {
-                "foo": ["one", "one", "one", "two", "two", "two"],
-                "bar": ["A", "B", "C", "A", "B", "C"],
-                "baz": [1, 2, 3, 4, 5, 6],
-                "zoo": ["x", "y", "z", "q", "w", "t"],
-            }
+    @pytest.mark.parametrize(
+        "index, values",
+        [("foo", "baz"), ("foo", ["baz", "zoo"]), ("foo", None), (None, "baz")],
+    )
+    def test_pivot(self, index, values):
+        data = {
+            "foo": ["one", "one", "one", "two", "two", "two"],
+            "bar": ["A", "B", "C", "A", "B", "C"],
+            "baz": [1, 2, 3, 4, 5, 6],
+            "zoo": ["x", "y", "z", "q", "w", "t"],
+        }
+        df_equals(
+            pd.DataFrame(data).pivot(index=index, columns="bar", values=values),
+            pandas.DataFrame(data).pivot(index=index, columns="bar", values=values),
         )
-        with pytest.warns(UserWarning):
-            df.pivot(index="foo", columns="bar", values="baz")
+        with pytest.raises(ValueError):
+            pd.DataFrame({"a": [1, 1], "b": ["x", "x"], "c": [1, 2]}).pivot(
+                index="a", columns="b", values="c"
+            )
 
     def test_pivot_table(self):
         df = pd.DataFrame(
@@ -2443,7 +2658,66 @@ class TestDataFrameDefault:
             }
         )
         with pytest.warns(UserWarning):
-            df.pivot_table(values="D", index=["A", "B"], columns=["C"], aggfunc=np.sum)
+            df.pivot_table(
+                values="D",
+                index=["A", "B"],
+                columns=["C"],
+                aggfunc=np.sum,
+                margins=True,
+            )
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"index": "user", "columns": "feature", "values": "count"},
+            {
+                "index": "user",
+                "columns": "feature",
+                "values": "count",
+                "aggfunc": "sum",
+                "fill_value": 0,
+            },
+            {
+                "index": ["user", "group"],
+                "columns": "feature",
+                "values": ["count", "weight"],
+                "aggfunc": "max",
+            },
+            {
+                "index": "user",
+                "columns": ["feature", "group"],
+                "values": "count",
+                "aggfunc": "count",
+                "dropna": False,
+            },
+            {"columns": "feature", "values": "count", "aggfunc": "sum"},
+            {"index": ["user", "group"], "values": "count"},
+            {"index": ["user", "group"], "values": ["count", "weight"]},
+        ],
+    )
+    def test_pivot_table_distributed(self, kwargs):
+        random_state = np.random.RandomState(42)
+        data = {
+            "user": random_state.randint(0, 40, 512),
+            "feature": random_state.choice(list("abcde"), 512),
+            "group": random_state.choice(["x", "y"], 512),
+            "count": random_state.randint(0, 10, 512),
+            "weight": random_state.randint(0, 100, 512) / 4,
+        }
+        df_equals(
+            pd.DataFrame(data).pivot_table(**kwargs),
+            pandas.DataFrame(data).pivot_table(**kwargs),
+        )
+
+    def test_pivot_table_empty(self):
+        pandas_df = pandas.DataFrame({"user": np.arange(0), "count": np.arange(0.0)})
+        modin_df = pd.DataFrame(pandas_df)
+        with pytest.warns(UserWarning):
+            modin_result = modin_df.pivot_table(index="user", values="count")
+        tm.assert_frame_equal(
+            modin_result._to_pandas(),
+            pandas_df.pivot_table(index="user", values="count"),
+        )
 
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     def test_plot(self, request, data):
@@ -2622,10 +2896,21 @@ class TestDataFrameDefault:
             pandas_df.slice_shift(periods=periods, axis=axis),
         )
 
-    def test_stack(self):
+    def test_stack_default(self):
         data = test_data_values[0]
-        with pytest.warns(UserWarning):
-            pd.DataFrame(data).stack()
+        df_equals(pd.DataFrame(data).stack(), pandas.DataFrame(data).stack())
+
+    @pytest.mark.parametrize("level", [-1, 0, [0, 1]])
+    @pytest.mark.parametrize("dropna", [True, False])
+    def test_stack(self, level, dropna):
+        columns = pandas.MultiIndex.from_product([["a", "b"], ["x", "y", "z"]])
+        data = np.random.RandomState(42).randint(0, 10, (256, 6)).astype(float)
+        data[data == 0] = np.nan
+        modin_df = pd.DataFrame(data, columns=columns)
+        pandas_df = pandas.DataFrame(data, columns=columns)
+        df_equals(
+            modin_df.stack(level, dropna=dropna), pandas_df.stack(level, dropna=dropna)
+        )
 
     def test_style(self):
         data = test_data_values[0]
@@ -2833,10 +3118,50 @@ class TestDataFrameDefault:
             pandas_df.tz_localize("America/Los_Angeles", axis=0),
         )
 
-    def test_unstack(self):
+    def test_unstack_default(self):
         data = test_data_values[0]
-        with pytest.warns(UserWarning):
-            pd.DataFrame(data).unstack()
+        df_equals(pd.DataFrame(data).unstack(), pandas.DataFrame(data).unstack())
+
+    @pytest.mark.parametrize("level", [-1, 0, "b", ["b", "c"], []])
+    @pytest.mark.parametrize("fill_value", [None, 0])
+    def test_unstack(self, level, fill_value):
+        random_state = np.random.RandomState(42)
+        index = pandas.MultiIndex.from_product(
+            [range(20), ["x", "y", "z"], [True, False]], names=["a", "b", "c"]
+        )
+        # Drop some of the rows to leave missing cells.
+        rows = random_state.permutation(len(index))[:100]
+        data = {
+            "int": random_state.randint(0, 10, len(index))[rows],
+            "float": random_state.rand(len(index))[rows],
+            "str": random_state.choice(["p", "q"], len(index))[rows],
+        }
+        modin_df = pd.DataFrame(data, index=index[rows])
+        pandas_df = pandas.DataFrame(data, index=index[rows])
+        df_equals(
+            modin_df.unstack(level, fill_value=fill_value),
+            pandas_df.unstack(level, fill_value=fill_value),
+        )
+        df_equals(
+            modin_df.unstack(level, fill_value=fill_value).dtypes,
+            pandas_df.unstack(level, fill_value=fill_value).dtypes,
+        )
+        df_equals(modin_df["int"].unstack(level), pandas_df["int"].unstack(level))
+
+        # with MultiIndex columns pandas unstacks a list of levels one at a time, so
+        # the combinations of "b" and "c" that are never observed get columns too
+        observed = [key[1:] != ("z", True) for key in index[rows]]
+        columns = pandas.MultiIndex.from_tuples([("i", "int"), ("f", "float")])
+        modin_df = pd.DataFrame(data, index=index[rows])[["int", "float"]][observed]
+        pandas_df = pandas.DataFrame(data, index=index[rows])[["int", "float"]][
+            observed
+        ]
+        modin_df.columns = columns
+        pandas_df.columns = columns
+        df_equals(
+            modin_df.unstack(level, fill_value=fill_value),
+            pandas_df.unstack(level, fill_value=fill_value),
+        )
 
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     def test___array__(self, data):
@@ -3579,7 +3904,7 @@ class TestDataFrameWindow:
                 modin_df.cumprod(axis=axis, skipna=skipna)
         else:
             modin_result = modin_df.cumprod(axis=axis, skipna=skipna)
-            df_equals(modin_result, pandas_result)
+            df_almost_equals(modin_result, pandas_result)
 
         try:
             pandas_result = pandas_df.T.cumprod(axis=axis, skipna=skipna)
@@ -3588,7 +3913,7 @@ class TestDataFrameWindow:
                 modin_df.T.cumprod(axis=axis, skipna=skipna)
         else:
             modin_result = modin_df.T.cumprod(axis=axis, skipna=skipna)
-            df_equals(modin_result, pandas_result)
+            df_almost_equals(modin_result, pandas_result)
 
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     @pytest.mark.parametrize("axis", axis_values, ids=axis_keys)
@@ -3614,7 +3939,7 @@ class TestDataFrameWindow:
                     modin_df.cumsum(axis=axis, skipna=skipna)
             else:
                 modin_result = modin_df.cumsum(axis=axis, skipna=skipna)
-                df_equals(modin_result, pandas_result)
+                df_almost_equals(modin_result, pandas_result)
 
         if name_contains(request.node.name, ["datetime_timedelta_data"]) and (
             axis == 0 or axis == "rows"
@@ -3629,7 +3954,25 @@ class TestDataFrameWindow:
                     modin_df.T.cumsum(axis=axis, skipna=skipna)
             else:
                 modin_result = modin_df.T.cumsum(axis=axis, skipna=skipna)
-                df_equals(modin_result, pandas_result)
+                df_almost_equals(modin_result, pandas_result)
+
+    @pytest.mark.parametrize(
+        "skipna", bool_arg_values, ids=arg_keys("skipna", bool_arg_keys)
+    )
+    def test_cumulative_nan_blocks(self, skipna):
+        # NaN runs that cover whole row blocks must not break the carried values
+        data = {"col1": np.arange(1024) % 13, "col2": np.arange(1024) * 0.5}
+        pandas_df = pandas.DataFrame(data)
+        pandas_df.iloc[100:700, 1] = np.nan
+        pandas_df.iloc[1000:, 1] = np.nan
+        modin_df = pd.DataFrame(pandas_df)
+
+        df_equals(modin_df.cummax(skipna=skipna), pandas_df.cummax(skipna=skipna))
+        df_equals(modin_df.cummin(skipna=skipna), pandas_df.cummin(skipna=skipna))
+        df_equals(modin_df.cumsum(skipna=skipna), pandas_df.cumsum(skipna=skipna))
+        df_equals(modin_df.ffill(), pandas_df.ffill())
+        df_equals(modin_df.diff(300), pandas_df.diff(300))
+        df_equals(modin_df.diff(-300), pandas_df.diff(-300))
 
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     @pytest.mark.parametrize("axis", axis_values, ids=axis_keys)
@@ -3680,6 +4023,46 @@ class TestDataFrameWindow:
 
         df_equals(modin_result, pandas_result)
 
+    @pytest.mark.parametrize(
+        "keep", ["last", "first", False], ids=["last", "first", "False"]
+    )
+    def test_duplicated_mixed_dtypes(self, keep):
+        data = {
+            "a": np.tile([1, 2, 3, 1], 64),
+            "b": np.tile([0.0, -0.0, np.nan, 0.0], 64),
+            "c": np.tile(["x", "y", "x", "x"], 64),
+        }
+        modin_df = pd.DataFrame(data)
+        pandas_df = pandas.DataFrame(data)
+
+        df_equals(modin_df.duplicated(keep=keep), pandas_df.duplicated(keep=keep))
+        df_equals(
+            modin_df.drop_duplicates(subset=["b", "c"], keep=keep),
+            pandas_df.drop_duplicates(subset=["b", "c"], keep=keep),
+        )
+
+    @pytest.mark.parametrize(
+        "keep", ["last", "first", False], ids=["last", "first", "False"]
+    )
+    def test_duplicated_mixed_objects(self, keep):
+        # equal values of different types are duplicates, as in pandas
+        data = {
+            "a": [1] * 64 + [1.0] * 64 + [True] * 64 + ["1"] * 64,
+            "b": [Decimal(2), 2, "2", (2, 3)] * 64,
+        }
+        modin_df = pd.DataFrame(data)
+        pandas_df = pandas.DataFrame(data)
+        assert len(modin_df._query_compiler._modin_frame._row_lengths) > 1
+
+        df_equals(modin_df.duplicated(keep=keep), pandas_df.duplicated(keep=keep))
+        df_equals(
+            modin_df.drop_duplicates(subset=["a"], keep=keep),
+            pandas_df.drop_duplicates(subset=["a"], keep=keep),
+        )
+        df_equals(
+            modin_df.drop_duplicates(keep=keep), pandas_df.drop_duplicates(keep=keep)
+        )
+
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     def test_ffill(self, data):
         modin_df = pd.DataFrame(data)
@@ -4108,6 +4491,51 @@ class TestDataFrameWindow:
         pandas_result = pandas_df.T.nunique(axis=axis, dropna=dropna)
         df_equals(modin_result, pandas_result)
 
+    @pytest.mark.parametrize("dropna", bool_arg_values, ids=bool_arg_keys)
+    def test_nunique_across_blocks(self, dropna):
+        data = {
+            "float": [0.0, -0.0, np.nan, 1.5] * 64,
+            "int": np.arange(256) % 100,
+            "str": ["a", None, "b", "c"] * 64,
+            "cat": pandas.Categorical(["x", "y"] * 128),
+        }
+        modin_df = pd.DataFrame(data)
+        pandas_df = pandas.DataFrame(data)
+        df_equals(modin_df.nunique(dropna=dropna), pandas_df.nunique(dropna=dropna))
+
+    @pytest.mark.parametrize("dropna", bool_arg_values, ids=bool_arg_keys)
+    def test_nunique_mixed_objects(self, dropna):
+        # equal numbers of different types are counted once, as in pandas, while
+        # numbers and their string forms are distinct
+        values = [1, "1", 1.0, True, 2.5, "2.5", np.nan, -0.0, 0, "a", 2 ** 60]
+        data = {"obj": values * 16, "rev": values[::-1] * 16}
+        modin_df = pd.DataFrame(data)
+        pandas_df = pandas.DataFrame(data)
+        assert len(modin_df._query_compiler._modin_frame._row_lengths) > 1
+        df_equals(modin_df.nunique(dropna=dropna), pandas_df.nunique(dropna=dropna))
+
+    @pytest.mark.parametrize("dropna", bool_arg_values, ids=bool_arg_keys)
+    def test_nunique_mixed_types(self, dropna):
+        # equal objects of different types are counted once, and None and NaN
+        # are counted like pandas does
+        values = [
+            None,
+            np.nan,
+            "a",
+            Decimal(1),
+            1,
+            pandas.Timestamp("2020-01-01"),
+            datetime.datetime(2020, 1, 1),
+            (1, 2),
+            (1.0, 2),
+            1 + 0j,
+        ]
+        data = {"obj": values * 64, "rev": values[::-1] * 64}
+        modin_df = pd.DataFrame(data)
+        pandas_df = pandas.DataFrame(data)
+        assert len(modin_df._query_compiler._modin_frame._row_lengths) > 1
+        df_equals(modin_df.nunique(dropna=dropna), pandas_df.nunique(dropna=dropna))
+
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     @pytest.mark.parametrize("q", quantiles_values, ids=quantiles_keys)
     def test_quantile(self, request, data, q):
@@ -5370,6 +5798,7 @@ class TestDataFrameIter:
         for modin_item, pandas_item in zip(modin_items, pandas_items):
             modin_index, modin_series = modin_item
             pandas_index, pandas_series = pandas_item
+            assert isinstance(modin_series, pd.Series)
             df_equals(pandas_series, modin_series)
             assert pandas_index == modin_index
 
@@ -5399,6 +5828,51 @@ class TestDataFrameIter:
             df_equals(pandas_series, modin_series)
             assert pandas_index == modin_index
 
+    def test_iterrows_stop_early(self):
+        from modin.pandas.iterator import PartitionIterator
+
+        pandas_df = pandas.DataFrame(np.arange(64 * 4).reshape(64, 4))
+        modin_df = pd.DataFrame(pandas_df)
+        modin_index, modin_series = next(modin_df.iterrows())
+        pandas_index, pandas_series = next(pandas_df.iterrows())
+        assert modin_index == pandas_index
+        df_equals(modin_series, pandas_series)
+
+        # stop in the second block, while the third one is being fetched
+        modin_iter = PartitionIterator(modin_df, 0, lambda df: df.iterrows())
+        pandas_iter = pandas_df.iterrows()
+        first_stop = modin_iter._chunk_bounds()[0][1]
+        for _ in range(first_stop + 1):
+            modin_index, modin_series = next(modin_iter)
+            pandas_index, pandas_series = next(pandas_iter)
+            assert modin_index == pandas_index
+            df_equals(modin_series, pandas_series)
+        executor = modin_iter._executor
+        modin_iter.close()
+        assert executor._shutdown
+        for thread in executor._threads:
+            thread.join(timeout=10)
+            assert not thread.is_alive()
+        with pytest.raises(StopIteration):
+            next(modin_iter)
+
+        # abandoned iterators are shut down when they are garbage collected
+        modin_iter = PartitionIterator(modin_df, 1, lambda df: df.items())
+        next(modin_iter)
+        executor = modin_iter._executor
+        del modin_iter
+        assert executor._shutdown
+
+        # the blocks follow uneven partitions
+        pandas_df = pandas.concat([pandas_df.iloc[:5], pandas_df.iloc[5:]])
+        modin_df = pd.concat([modin_df.iloc[:5], modin_df.iloc[5:]])
+        row_lengths = modin_df._query_compiler._modin_frame._row_lengths
+        bounds = PartitionIterator(modin_df, 0, None)._chunk_bounds()
+        assert [stop - start for start, stop in bounds] == row_lengths
+        for modin_row, pandas_row in zip(modin_df.iterrows(), pandas_df.iterrows()):
+            assert modin_row[0] == pandas_row[0]
+            df_equals(modin_row[1], pandas_row[1])
+
     @pytest.mark.parametrize("name", [None, "NotPandas", "Pandas"])
     @pytest.mark.parametrize("index", [True, False])
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
@@ -5581,6 +6055,23 @@ class TestDataFrameIter:
         modin_df = pd.read_csv(io.StringIO(string_data))
         assert repr(pandas_df) == repr(modin_df)
 
+        # rows == 61, the head and tail overlap, or nothing is cut
+        frame_data = random_state.randint(RAND_LOW, RAND_HIGH, size=(61, 30))
+        for max_rows in [60, 75]:
+            with pandas.option_context(
+                "display.max_rows", max_rows, "display.max_columns", 75
+            ):
+                pandas_df = pandas.DataFrame(frame_data)
+                modin_df = pd.DataFrame(frame_data)
+                assert repr(pandas_df) == repr(modin_df)
+
+                # the cached repr is dropped once the labels change
+                pandas_df.columns = ["col{}".format(i) for i in range(30)]
+                modin_df.columns = ["col{}".format(i) for i in range(30)]
+                pandas_df.index = pandas_df.index * 2
+                modin_df.index = modin_df.index * 2
+                assert repr(pandas_df) == repr(modin_df)
+
     @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
     def test_reset_index_with_multi_index(self, data):
         modin_df = pd.DataFrame(data)
@@ -181,24 +181,22 @@ def test_merge_ordered():
 
 
 def test_merge_asof():
-    left = pd.DataFrame({"a": [1, 5, 10], "left_val": ["a", "b", "c"]})
-    right = pd.DataFrame({"a": [1, 2, 3, 6, 7], "right_val": [1, 2, 3, 6, 7]})
-
-    with pytest.warns(UserWarning):
-        df = pd.merge_asof(left, right, on="a")
-        assert isinstance(df, pd.DataFrame)
-
-    with pytest.warns(UserWarning):
-        df = pd.merge_asof(left, right, on="a", allow_exact_matches=False)
-        assert isinstance(df, pd.DataFrame)
-
-    with pytest.warns(UserWarning):
-        df = pd.merge_asof(left, right, on="a", direction="forward")
-        assert isinstance(df, pd.DataFrame)
-
-    with pytest.warns(UserWarning):
-        df = pd.merge_asof(left, right, on="a", direction="nearest")
+    pandas_left = pandas.DataFrame({"a": [1, 5, 10], "left_val": ["a", "b", "c"]})
+    pandas_right = pandas.DataFrame(
+        {"a": [1, 2, 3, 6, 7], "right_val": [1, 2, 3, 6, 7]}
+    )
+    left = pd.DataFrame(pandas_left)
+    right = pd.DataFrame(pandas_right)
+
+    for kwargs in [
+        {},
+        {"allow_exact_matches": False},
+        {"direction": "forward"},
+        {"direction": "nearest"},
+    ]:
+        df = pd.merge_asof(left, right, on="a", **kwargs)
         assert isinstance(df, pd.DataFrame)
+        df_equals(df, pandas.merge_asof(pandas_left, pandas_right, on="a", **kwargs))
 
     left = pd.DataFrame({"left_val": ["a", "b", "c"]}, index=[1, 5, 10])
     right = pd.DataFrame({"right_val": [1, 2, 3, 6, 7]}, index=[1, 2, 3, 6, 7])
@@ -216,6 +214,116 @@ def test_merge_asof():
         )
 
 
+@pytest.mark.parametrize("direction", ["backward", "forward", "nearest"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"by": "ticker"},
+        {"tolerance": pandas.Timedelta("10s")},
+        {
+            "by": "ticker",
+            "tolerance": pandas.Timedelta("3s"),
+            "allow_exact_matches": False,
+        },
+    ],
+)
+def test_merge_asof_distributed(direction, kwargs):
+    random_state = np.random.RandomState(42)
+    start = pandas.Timestamp("2020-01-01")
+    trades = pandas.DataFrame(
+        {
+            "time": start
+            + pandas.to_timedelta(np.sort(random_state.randint(0, 5000, 1000)), "s"),
+            "ticker": random_state.choice(list("ABCDE"), 1000),
+            "quantity": random_state.randint(1, 100, 1000),
+        }
+    )
+    quotes = pandas.DataFrame(
+        {
+            "time": start
+            + pandas.to_timedelta(np.sort(random_state.randint(0, 5000, 3000)), "s"),
+            "ticker": random_state.choice(list("BCDEF"), 3000),
+            "bid": random_state.randint(0, 1000, 3000),
+        }
+    )
+    # The only quote of "A" is before every trade, far behind their partitions.
+    quotes = pandas.concat(
+        [pandas.DataFrame({"time": [start], "ticker": ["A"], "bid": [-1]}), quotes],
+        ignore_index=True,
+    )
+    modin_result = pd.merge_asof(
+        pd.DataFrame(trades),
+        pd.DataFrame(quotes),
+        on="time",
+        direction=direction,
+        **kwargs,
+    )
+    pandas_result = pandas.merge_asof(
+        trades, quotes, on="time", direction=direction, **kwargs
+    )
+    df_equals(modin_result, pandas_result)
+
+    with pytest.raises(ValueError):
+        pd.merge_asof(pd.DataFrame(trades[::-1]), pd.DataFrame(quotes), on="time")
+
+
+@pytest.mark.parametrize("how", ["outer", "inner", "left", "right"])
+def test_merge_ordered_distributed(how):
+    random_state = np.random.RandomState(42)
+    pandas_left = pandas.DataFrame(
+        {"key": np.sort(random_state.randint(0, 300, 500)), "lvalue": np.arange(500)}
+    )
+    pandas_right = pandas.DataFrame(
+        {"key": np.sort(random_state.randint(-50, 350, 400)), "rvalue": np.arange(400)}
+    )
+    modin_result = pd.merge_ordered(
+        pd.DataFrame(pandas_left), pd.DataFrame(pandas_right), on="key", how=how
+    )
+    pandas_result = pandas.merge_ordered(pandas_left, pandas_right, on="key", how=how)
+    df_equals(modin_result, pandas_result)
+
+
+def _with_empty_row_partition(modin_df, position):
+    """Insert an empty row partition into the frame of a modin DataFrame."""
+    frame = modin_df._query_compiler._modin_frame.copy()
+    put = frame._frame_mgr_cls._partition_class.put
+    empty_row = [put(part.to_pandas().iloc[:0]) for part in frame._partitions[0]]
+    row_lengths = list(frame._row_lengths)
+    # The constructor would remove the empty partition.
+    frame._partitions = np.insert(frame._partitions, position, empty_row, axis=0)
+    frame._row_lengths_cache = row_lengths[:position] + [0] + row_lengths[position:]
+    return pd.DataFrame(query_compiler=type(modin_df._query_compiler)(frame))
+
+
+def test_merge_sorted_empty_partitions():
+    random_state = np.random.RandomState(42)
+    pandas_left = pandas.DataFrame(
+        {"key": np.sort(random_state.randint(0, 300, 500)), "lvalue": np.arange(500)}
+    )
+    pandas_right = pandas.DataFrame(
+        {"key": np.sort(random_state.randint(-50, 350, 400)), "rvalue": np.arange(400)}
+    )
+
+    def modin_frames():
+        # Rebuilt for every merge, as a merge may drop the empty partitions.
+        return (
+            _with_empty_row_partition(pd.DataFrame(pandas_left), 1),
+            _with_empty_row_partition(pd.DataFrame(pandas_right), 2),
+        )
+
+    for how in ["outer", "left"]:
+        df_equals(
+            pd.merge_ordered(*modin_frames(), on="key", how=how),
+            pandas.merge_ordered(pandas_left, pandas_right, on="key", how=how),
+        )
+    for direction in ["backward", "forward", "nearest"]:
+        df_equals(
+            pd.merge_asof(*modin_frames(), on="key", direction=direction),
+            pandas.merge_asof(pandas_left, pandas_right, on="key", direction=direction),
+        )
+
+
 def test_pivot():
     test_df = pd.DataFrame(
         {
@@ -225,9 +333,8 @@ def test_pivot():
             "zoo": ["x", "y", "z", "q", "w", "t"],
         }
     )
-    with pytest.warns(UserWarning):
-        df = pd.pivot(test_df, index="foo", columns="bar", values="baz")
-        assert isinstance(df, pd.DataFrame)
+    df = pd.pivot(test_df, index="foo", columns="bar", values="baz")
+    assert isinstance(df, pd.DataFrame)
 
     with pytest.raises(ValueError):
         pd.pivot(test_df["bar"], index="foo", columns="bar", values="baz")
@@ -253,11 +360,10 @@ def test_pivot_table():
             "E": [2, 4, 5, 5, 6, 6, 8, 9, 9],
         }
     )
-    with pytest.warns(UserWarning):
-        df = pd.pivot_table(
-            test_df, values="D", index=["A", "B"], columns=["C"], aggfunc=np.sum
-        )
-        assert isinstance(df, pd.DataFrame)
+    df = pd.pivot_table(
+        test_df, values="D", index=["A", "B"], columns=["C"], aggfunc=np.sum
+    )
+    assert isinstance(df, pd.DataFrame)
 
     with pytest.raises(ValueError):
         pd.pivot_table(
@@ -384,6 +490,29 @@ def test_to_datetime():
     modin_s = pd.Series(["3/11/2000", "3/12/2000", "3/13/2000"] * 1000)
     pandas_s = pandas.Series(["3/11/2000", "3/12/2000", "3/13/2000"] * 1000)
     df_equals(pd.to_datetime(modin_s), pandas.to_datetime(pandas_s))
+    for kwargs in [
+        {"infer_datetime_format": True},
+        {"dayfirst": True, "cache": False},
+        {"format": "%m/%d/%Y", "utc": True},
+    ]:
+        df_equals(
+            pd.to_datetime(modin_s, **kwargs), pandas.to_datetime(pandas_s, **kwargs)
+        )
+    modin_s = pd.Series(["3/11/2000", "not a date", None] * 1000)
+    pandas_s = pandas.Series(["3/11/2000", "not a date", None] * 1000)
+    for errors in ["coerce", "ignore"]:
+        df_equals(
+            pd.to_datetime(modin_s, errors=errors),
+            pandas.to_datetime(pandas_s, errors=errors),
+        )
+    # only the last block has a value that cannot be parsed
+    modin_s = pd.Series(["3/11/2000", "3/12/2000", None] * 1000 + ["not a date"])
+    pandas_s = pandas.Series(["3/11/2000", "3/12/2000", None] * 1000 + ["not a date"])
+    for errors in ["coerce", "ignore"]:
+        modin_result = pd.to_datetime(modin_s, errors=errors)
+        df_equals(modin_result, pandas.to_datetime(pandas_s, errors=errors))
+        assert modin_result.dtype == pandas.to_datetime(pandas_s, errors=errors).dtype
+    assert pd.to_datetime(modin_s, errors="ignore").iloc[0] == "3/11/2000"
 
     # Other inputs for to_datetime
     value = 1490195805
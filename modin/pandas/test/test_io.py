@@ -719,6 +719,37 @@ def test_from_sql_with_chunksize(make_sql_connection):
         df_equals(modin_df, pandas_df)
 
 
+def test_sql_connection_pool(make_sql_connection):
+    from modin.engines.base.io.sql.connection_pool import SQLConnectionPool
+
+    filename = "test_sql_connection_pool.db"
+    table = "test_sql_connection_pool"
+    conn = make_sql_connection(filename, table)
+    query = "select * from {0}".format(table)
+    pool = SQLConnectionPool(max_sessions=1, idle_timeout=0)
+
+    with pool.connect(conn) as connection:
+        pandas_df = pandas.read_sql(query, connection)
+        engine = connection.engine
+        # engines with checked out connections are never evicted
+        pool.dispose()
+        assert list(pool._engines) == [conn]
+    df_equals(pandas_df, pandas.read_sql(query, conn))
+    # the idle engine is disposed and recreated on the next checkout
+    with pool.connect(conn) as connection:
+        assert connection.engine is not engine
+    pool.idle_timeout = 300
+    with pool.connect(conn) as connection:
+        engine = connection.engine
+    with pool.connect(conn) as connection:
+        assert connection.engine is engine
+    # the session limit is held for the whole checkout
+    with pool.connect(conn):
+        assert not pool._sessions.acquire(blocking=False)
+    pool.dispose()
+    assert not pool._engines
+
+
 @pytest.mark.skip(reason="No SAS write methods in Pandas")
 def test_from_sas():
     pandas_df = pandas.read_sas(TEST_SAS_FILENAME)
@@ -995,6 +1026,60 @@ def test_from_csv_with_usecols(usecols):
     df_equals(modin_df, pandas_df)
 
 
+@pytest.mark.skipif(
+    execution_engine.get().lower() == "python", reason="Using pandas implementation"
+)
+def test_from_csv_read_cache(make_csv_file, monkeypatch):
+    cache_dir = "test_read_cache"
+    monkeypatch.setenv("MODIN_READ_CACHE_DIR", cache_dir)
+    kwargs = {"parse_dates": ["col2"], "index_col": "col1"}
+    try:
+        make_csv_file()
+        pandas_df = pandas.read_csv(TEST_CSV_FILENAME, **kwargs)
+        df_equals(pd.read_csv(TEST_CSV_FILENAME, **kwargs), pandas_df)
+        assert len(os.listdir(cache_dir)) == 1
+        # the second read is served from the cache
+        df_equals(pd.read_csv(TEST_CSV_FILENAME, **kwargs), pandas_df)
+        assert len(os.listdir(cache_dir)) == 1
+
+        df_equals(pd.read_csv(TEST_CSV_FILENAME), pandas.read_csv(TEST_CSV_FILENAME))
+        assert len(os.listdir(cache_dir)) == 2
+
+        make_csv_file(row_size=SMALL_ROW_SIZE * 2)
+        pandas_df = pandas.read_csv(TEST_CSV_FILENAME, **kwargs)
+        df_equals(pd.read_csv(TEST_CSV_FILENAME, **kwargs), pandas_df)
+        assert len(os.listdir(cache_dir)) == 3
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+@pytest.mark.skipif(
+    execution_engine.get().lower() == "python", reason="Using pandas implementation"
+)
+def test_from_csv_read_cache_missing_values(monkeypatch):
+    cache_dir = "test_read_cache"
+    monkeypatch.setenv("MODIN_READ_CACHE_DIR", cache_dir)
+    size = SMALL_ROW_SIZE
+    pandas.DataFrame(
+        {
+            "col1": np.arange(size),
+            "col2": ["" if i % 3 == 0 else "a" for i in range(size)],
+            "col3": ["" if i % 5 == 0 else "b{}".format(i) for i in range(size)],
+        }
+    ).to_csv(TEST_CSV_FILENAME, index=False)
+    try:
+        pandas_df = pandas.read_csv(TEST_CSV_FILENAME)
+        pd.read_csv(TEST_CSV_FILENAME)
+        # the second read is served from the cache
+        modin_df = pd.read_csv(TEST_CSV_FILENAME)
+        df_equals(modin_df, pandas_df)
+        # df_equals takes None and NaN for equal
+        df_equals(modin_df.applymap(type), pandas_df.applymap(type))
+    finally:
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        teardown_test_file(TEST_CSV_FILENAME)
+
+
 @pytest.mark.skipif(
     execution_engine.get().lower() == "python", reason="Using pandas implementation"
 )
@@ -1140,6 +1225,25 @@ def test_from_csv_parse_dates(make_csv_file):
     modin_df = pd.read_csv(TEST_CSV_FILENAME, parse_dates={"time": ["col2", "col4"]})
     df_equals(modin_df, pandas_df)
 
+    for kwargs in [{}, {"infer_datetime_format": True, "cache_dates": False}]:
+        pandas_df = pandas.read_csv(TEST_CSV_FILENAME, parse_dates=["col2"], **kwargs)
+        modin_df = pd.read_csv(TEST_CSV_FILENAME, parse_dates=["col2"], **kwargs)
+        df_equals(modin_df, pandas_df)
+        df_equals(modin_df.dtypes, pandas_df.dtypes)
+
+
+def test_from_csv_parse_dates_partly_invalid(make_csv_file):
+    # only the last partition has a value that cannot be parsed, so pandas keeps
+    # the whole column as strings
+    df = make_csv_file(row_size=1000)
+    df.loc[len(df) - 1, "col2"] = "not a date"
+    df.to_csv(TEST_CSV_FILENAME)
+    pandas_df = pandas.read_csv(TEST_CSV_FILENAME, parse_dates=["col2", "col4"])
+    modin_df = pd.read_csv(TEST_CSV_FILENAME, parse_dates=["col2", "col4"])
+    df_equals(modin_df, pandas_df)
+    df_equals(modin_df.dtypes, pandas_df.dtypes)
+    assert modin_df["col2"].apply(type).eq(str).all()
+
 
 def test_from_csv_newlines_in_quotes():
     pandas_df = pandas.read_csv("modin/pandas/test/data/newlines.csv")
@@ -1280,6 +1384,18 @@ def test_to_json():
     teardown_test_file(TEST_JSON_pandas_FILENAME)
     teardown_test_file(TEST_JSON_DF_FILENAME)
 
+    modin_df.to_json(TEST_JSON_DF_FILENAME, orient="records", lines=True)
+    pandas_df.to_json(TEST_JSON_pandas_FILENAME, orient="records", lines=True)
+
+    assert assert_files_eq(TEST_JSON_DF_FILENAME, TEST_JSON_pandas_FILENAME)
+
+    teardown_test_file(TEST_JSON_pandas_FILENAME)
+    teardown_test_file(TEST_JSON_DF_FILENAME)
+
+    assert modin_df.to_json(orient="records", lines=True) == pandas_df.to_json(
+        orient="records", lines=True
+    )
+
 
 def test_to_latex():
     modin_df = create_test_modin_dataframe()
@@ -1334,6 +1450,35 @@ def test_to_pickle():
     teardown_test_file(TEST_PICKLE_DF_FILENAME)
 
 
+def test_pickle_dumps():
+    import pickle
+
+    modin_df = create_test_modin_dataframe()
+    pandas_df = create_test_pandas_dataframe()
+
+    unpickled = pickle.loads(pickle.dumps(modin_df))
+    assert isinstance(unpickled, pd.DataFrame)
+    df_equals(unpickled, pandas_df)
+    assert (
+        unpickled._query_compiler._modin_frame._partitions.shape
+        == modin_df._query_compiler._modin_frame._partitions.shape
+    )
+
+    unpickled = pickle.loads(pickle.dumps(modin_df["col1"]))
+    assert isinstance(unpickled, pd.Series)
+    df_equals(unpickled, pandas_df["col1"])
+
+    # empty objects are not handed to pandas to be pickled
+    for modin_empty, pandas_empty in [
+        (pd.DataFrame(), pandas.DataFrame()),
+        (modin_df.iloc[:0], pandas_df.iloc[:0]),
+        (modin_df["col1"].iloc[:0], pandas_df["col1"].iloc[:0]),
+    ]:
+        unpickled = pickle.loads(pickle.dumps(modin_empty))
+        assert type(unpickled) is type(modin_empty)
+        df_equals(unpickled, pandas_empty)
+
+
 def test_to_sql_without_index(make_sql_connection):
     table_name = "tbl_without_index"
     modin_df = create_test_modin_dataframe()
@@ -65,6 +65,34 @@ def test_get_dummies():
         pd.get_dummies(1)
 
 
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"dummy_na": True},
+        {"drop_first": True, "dtype": float},
+        {"columns": ["a", "b", "c"], "prefix": "P", "prefix_sep": "/"},
+    ],
+)
+def test_get_dummies_across_blocks(kwargs):
+    random_state = np.random.RandomState(42)
+    data = {
+        "a": random_state.choice(["x", "y", None], 256),
+        "b": random_state.randint(0, 3, 256),
+        "c": pandas.Categorical(
+            random_state.choice(["p", "q"], 256), categories=["q", "p", "r"]
+        ),
+        "d": [None] * 256,
+    }
+    # A category that only appears in the first rows
+    data["a"][:10] = "w"
+    modin_result = pd.get_dummies(pd.DataFrame(data), **kwargs)
+    pandas_result = pandas.get_dummies(pandas.DataFrame(data), **kwargs)
+    df_equals(modin_result, pandas_result)
+    assert modin_result._to_pandas().columns.equals(pandas_result.columns)
+    df_equals(modin_result.dtypes, pandas_result.dtypes)
+
+
 def test_melt():
     data = test_data_values[0]
     with pytest.warns(UserWarning):
@@ -97,20 +125,59 @@ def test_crosstab():
         dtype=object,
     )
 
+    df = pd.crosstab(a, [b, c], rownames=["a"], colnames=["b", "c"])
+    assert isinstance(df, pd.DataFrame)
+    df_equals(df, pandas.crosstab(a, [b, c], rownames=["a"], colnames=["b", "c"]))
+
+    for kwargs in [
+        {"normalize": True},
+        {"normalize": "columns"},
+        {"normalize": 0},
+        {"dropna": False},
+        {"values": np.arange(len(a)), "aggfunc": np.sum},
+    ]:
+        df_equals(
+            pd.crosstab(a, [b, c], **kwargs), pandas.crosstab(a, [b, c], **kwargs)
+        )
+
+    modin_series = [pd.Series(x, name=name) for x, name in zip([a, b, c], "abc")]
+    pandas_series = [pandas.Series(x, name=name) for x, name in zip([a, b, c], "abc")]
+    df_equals(
+        pd.crosstab(modin_series[0], modin_series[1:]),
+        pandas.crosstab(pandas_series[0], pandas_series[1:]),
+    )
+    # the values are aligned on the factors, with NaN where they are missing
+    pandas_values = pandas.Series(np.arange(len(a)), index=np.arange(len(a)) + 3)
+    for aggfunc in [np.sum, "count"]:
+        df_equals(
+            pd.crosstab(
+                modin_series[0],
+                modin_series[1:],
+                values=pd.Series(pandas_values),
+                aggfunc=aggfunc,
+            ),
+            pandas.crosstab(
+                pandas_series[0],
+                pandas_series[1:],
+                values=pandas_values,
+                aggfunc=aggfunc,
+            ),
+        )
+
     with pytest.warns(UserWarning):
-        df = pd.crosstab(a, [b, c], rownames=["a"], colnames=["b", "c"])
-        assert isinstance(df, pd.DataFrame)
+        df = pd.crosstab(a, [b, c], margins=True)
+    df_equals(df, pandas.crosstab(a, [b, c], margins=True))
 
-    foo = pd.Categorical(["a", "b"], categories=["a", "b", "c"])
-    bar = pd.Categorical(["d", "e"], categories=["d", "e", "f"])
+    with pytest.raises(ValueError):
+        pd.crosstab(a, b, aggfunc=np.sum)
 
-    with pytest.warns(UserWarning):
-        df = pd.crosstab(foo, bar)
-        assert isinstance(df, pd.DataFrame)
+    foo = pandas.Categorical(["a", "b"], categories=["a", "b", "c"])
+    bar = pandas.Categorical(["d", "e"], categories=["d", "e", "f"])
 
-    with pytest.warns(UserWarning):
-        df = pd.crosstab(foo, bar, dropna=False)
-        assert isinstance(df, pd.DataFrame)
+    df_equals(pd.crosstab(foo, bar), pandas.crosstab(foo, bar))
+    df_equals(
+        pd.crosstab(foo, bar, dropna=False), pandas.crosstab(foo, bar, dropna=False)
+    )
 
 
 def test_lreshape():
@@ -124,9 +191,17 @@ def test_lreshape():
         }
     )
 
-    with pytest.warns(UserWarning):
-        df = pd.lreshape(data, {"year": ["year1", "year2"], "hr": ["hr1", "hr2"]})
-        assert isinstance(df, pd.DataFrame)
+    groups = {"year": ["year1", "year2"], "hr": ["hr1", "hr2"]}
+    df = pd.lreshape(data, groups)
+    assert isinstance(df, pd.DataFrame)
+    df_equals(df, pandas.lreshape(data._to_pandas(), groups))
+
+    data["hr1"] = [np.nan, 573]
+    for dropna in [True, False]:
+        df_equals(
+            pd.lreshape(data, groups, dropna=dropna),
+            pandas.lreshape(data._to_pandas(), groups, dropna=dropna),
+        )
 
     with pytest.raises(ValueError):
         pd.lreshape(data.to_numpy(), {"year": ["year1", "year2"], "hr": ["hr1", "hr2"]})
@@ -143,9 +218,35 @@ def test_wide_to_long():
         }
     )
 
-    with pytest.warns(UserWarning):
-        df = pd.wide_to_long(data, ["hr", "year"], "team", "index")
-        assert isinstance(df, pd.DataFrame)
+    df = pd.wide_to_long(data, ["hr", "year"], "team", "index")
+    assert isinstance(df, pd.DataFrame)
+    df_equals(
+        df, pandas.wide_to_long(data._to_pandas(), ["hr", "year"], "team", "index")
+    )
+
+    with pytest.raises(ValueError):
+        pd.wide_to_long(pd.DataFrame({"A1": [1, 2], "id": [0, 0]}), "A", "id", "j")
 
     with pytest.raises(ValueError):
         pd.wide_to_long(data.to_numpy(), ["hr", "year"], "team", "index")
+
+
+@pytest.mark.parametrize("stubnames", [["A"], ["A", "B"], ["A", "C"]])
+@pytest.mark.parametrize("i", ["id", ["id", "X"]])
+def test_wide_to_long_partitions(stubnames, i):
+    n = 256
+    data = {
+        "A1970": np.arange(n),
+        "A1980": np.arange(n) * 2.0,
+        "B1970": np.arange(n) % 7,
+        "B1980": np.arange(n) % 5,
+        "C1990": np.arange(n) % 3,
+        "X": np.arange(n) % 11,
+        "id": np.random.RandomState(42).permutation(n),
+    }
+    modin_df = pd.DataFrame(data)
+    pandas_df = pandas.DataFrame(data)
+    modin_result = pd.wide_to_long(modin_df, stubnames, i=i, j="year")
+    pandas_result = pandas.wide_to_long(pandas_df, stubnames, i=i, j="year")
+    df_equals(modin_result, pandas_result)
+    assert modin_result.index.equals(pandas_result.index)
@@ -16,7 +16,7 @@ import numpy as np
 import pandas
 import modin.pandas as pd
 
-from .utils import df_equals, test_data_values, test_data_keys
+from .utils import df_equals, df_almost_equals, test_data_values, test_data_keys
 
 pd.DEFAULT_NPARTITIONS = 4
 
@@ -53,15 +53,15 @@ def test_dataframe(data, window, min_periods, win_type):
     # Testing of Rolling class
     else:
         df_equals(modin_rolled.count(), pandas_rolled.count())
-        df_equals(modin_rolled.sum(), pandas_rolled.sum())
-        df_equals(modin_rolled.mean(), pandas_rolled.mean())
+        df_almost_equals(modin_rolled.sum(), pandas_rolled.sum())
+        df_almost_equals(modin_rolled.mean(), pandas_rolled.mean())
         df_equals(modin_rolled.median(), pandas_rolled.median())
-        df_equals(modin_rolled.var(ddof=0), pandas_rolled.var(ddof=0))
-        df_equals(modin_rolled.std(ddof=0), pandas_rolled.std(ddof=0))
+        df_almost_equals(modin_rolled.var(ddof=0), pandas_rolled.var(ddof=0))
+        df_almost_equals(modin_rolled.std(ddof=0), pandas_rolled.std(ddof=0))
         df_equals(modin_rolled.min(), pandas_rolled.min())
         df_equals(modin_rolled.max(), pandas_rolled.max())
-        df_equals(modin_rolled.skew(), pandas_rolled.skew())
-        df_equals(modin_rolled.kurt(), pandas_rolled.kurt())
+        df_almost_equals(modin_rolled.skew(), pandas_rolled.skew())
+        df_almost_equals(modin_rolled.kurt(), pandas_rolled.kurt())
         df_equals(modin_rolled.apply(np.sum), pandas_rolled.apply(np.sum))
         df_equals(modin_rolled.aggregate(np.sum), pandas_rolled.aggregate(np.sum))
         df_equals(
@@ -185,3 +185,20 @@ def test_series_dt_index(closed):
     )
     df_equals(modin_rolled.aggregate(np.sum), pandas_rolled.aggregate(np.sum))
     df_equals(modin_rolled.quantile(0.1), pandas_rolled.quantile(0.1))
+
+
+@pytest.mark.parametrize("window", [3, 64, "3s", "90s"])
+@pytest.mark.parametrize("center", [False, True])
+def test_dataframe_overlapping_blocks(window, center):
+    if center and isinstance(window, str):
+        pytest.skip("center is not implemented for offset windows")
+    index = pandas.date_range("1/1/2000", periods=1024, freq="s")[::3]
+    data = {"A": np.arange(len(index)) % 7, "B": np.arange(len(index)) % 5}
+    pandas_df = pandas.DataFrame(data, index=index)
+    modin_df = pd.DataFrame(data, index=index)
+    pandas_rolled = pandas_df.rolling(window=window, center=center, min_periods=1)
+    modin_rolled = modin_df.rolling(window=window, center=center, min_periods=1)
+    df_equals(modin_rolled.count(), pandas_rolled.count())
+    df_equals(modin_rolled.sum(), pandas_rolled.sum())
+    df_equals(modin_rolled.max(), pandas_rolled.max())
+    df_equals(modin_rolled.median(), pandas_rolled.median())
@@ -2853,8 +2853,7 @@ def test_take():
 @pytest.mark.parametrize("data", test_data_values, ids=test_data_keys)
 def test_explode(data):
     modin_series, pandas_series = create_test_series(data)
-    with pytest.warns(UserWarning):
-        modin_result = modin_series.explode()
+    modin_result = modin_series.explode()
     pandas_result = pandas_series.explode()
     df_equals(modin_result, pandas_result)
 
@@ -3048,8 +3047,8 @@ def test_unstack():
             names=["Number", "Letter", "Color"],
         ),
     )
-    with pytest.warns(UserWarning):
-        s.unstack()
+    df_equals(s.unstack(), s._to_pandas().unstack())
+    df_equals(s.unstack(level=[0, 2]), s._to_pandas().unstack(level=[0, 2]))
 
 
 @pytest.mark.parametrize(
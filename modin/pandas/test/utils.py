@@ -535,6 +535,33 @@ def df_equals(df1, df2):
             np.testing.assert_almost_equal(df1, df2)
 
 
+def df_almost_equals(df1, df2):
+    """Tests if df1 and df2 are equal up to the rounding of floating point values.
+
+    Results that are computed one row block at a time (e.g. running sums) may differ
+    from pandas in the last digits.
+
+    Args:
+        df1: (pandas or modin DataFrame or series) dataframe to test if equal.
+        df2: (pandas or modin DataFrame or series) dataframe to test if equal.
+    """
+    if isinstance(df1, (pd.DataFrame, pd.Series)):
+        df1 = to_pandas(df1)
+    if isinstance(df2, (pd.DataFrame, pd.Series)):
+        df2 = to_pandas(df2)
+    if isinstance(df1, pandas.DataFrame) and isinstance(df2, pandas.DataFrame):
+        assert_frame_equal(
+            df1,
+            df2,
+            check_dtype=False,
+            check_index_type=False,
+            check_column_type=False,
+            check_categorical=False,
+        )
+    else:
+        df_equals(df1, df2)
+
+
 def df_is_empty(df):
     """Tests if df is empty.
 